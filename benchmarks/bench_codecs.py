@@ -0,0 +1,97 @@
+# Run from the repository root: python -m benchmarks.bench_codecs
+import argparse
+import random
+import time
+
+from tastytrade.codec import available_codecs, get_codec
+from tastytrade.replay import read_recording
+
+# Number of passes over the payloads for each codec
+ROUNDS = 5
+# Events per synthetic FEED_DATA frame, about what a busy channel delivers
+EVENTS_PER_FRAME = 200
+
+QUOTE_FIELDS = ['eventType', 'eventSymbol', 'bidPrice', 'askPrice',
+                'bidSize', 'askSize']
+GREEKS_FIELDS = ['eventType', 'eventSymbol', 'time', 'price', 'volatility',
+                 'delta', 'gamma', 'theta', 'rho', 'vega']
+
+
+def synthetic_frames(count):
+    # FEED_DATA frames in COMPACT format, alternating quotes and greeks
+    codec = get_codec()
+    random.seed(0)
+    frames = []
+    for i in range(count):
+        if i % 2 == 0:
+            values = []
+            for _ in range(EVENTS_PER_FRAME):
+                bid = round(random.uniform(1, 500), 2)
+                values += ['Quote', f'SYM{random.randrange(5000)}', bid,
+                           bid + 0.01, random.randrange(1, 500),
+                           random.choice([random.randrange(1, 500), 'NaN'])]
+            data = [['Quote', QUOTE_FIELDS], values]
+            channel = 7
+        else:
+            values = []
+            for _ in range(EVENTS_PER_FRAME):
+                symbol = f'.SPY241220C{random.randrange(400, 600)}'
+                values += ['Greeks', symbol,
+                           1718000000000 + random.randrange(10 ** 6),
+                           random.uniform(0, 50), random.uniform(0.1, 1)]
+                values += [random.uniform(-1, 1) for _ in range(5)]
+            data = [['Greeks', GREEKS_FIELDS], values]
+            channel = 3
+        frames.append(codec.dumps({'type': 'FEED_DATA', 'channel': channel,
+                                   'data': data}))
+    return frames
+
+
+def recorded_frames(path):
+    # The FEED_DATA frames of a recording made with `record_path`
+    codec = get_codec()
+    return [frame for _, frame in read_recording(path)
+            if codec.loads(frame)['type'] == 'FEED_DATA']
+
+
+def bench(codec, frames):
+    # Best of ROUNDS, so a stray pause doesn't skew the result
+    best_loads = best_dumps = float('inf')
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        messages = [codec.loads(frame) for frame in frames]
+        best_loads = min(best_loads, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for message in messages:
+            codec.dumps(message)
+        best_dumps = min(best_dumps, time.perf_counter() - start)
+    return len(frames) / best_loads, len(frames) / best_dumps
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Frames per second of each installed JSON codec.')
+    parser.add_argument('payloads', nargs='?',
+                        help='a recording made by DXLinkStreamer')
+    parser.add_argument('--frames', type=int, default=2000,
+                        help='number of synthetic frames without a file')
+    args = parser.parse_args()
+
+    if args.payloads:
+        frames = recorded_frames(args.payloads)
+    else:
+        frames = synthetic_frames(args.frames)
+    size = sum(len(frame) for frame in frames)
+    print(f'{len(frames)} frames, {size / len(frames):.0f} bytes on average')
+
+    baseline = None
+    for name in available_codecs():
+        decode, encode = bench(get_codec(name), frames)
+        baseline = baseline or decode
+        print(f'{name:>10}: {decode:>10.0f} decoded/s '
+              f'({decode / baseline:.2f}x)  {encode:>10.0f} encoded/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,458 @@
+# Run from the repository root: python -m benchmarks.bench_ingest
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+
+from process_raw_data import (BATCH_SIZE, connect, handle_batch,
+                              process_document)
+from tastytrade.dxfeed import EventType
+from tastytrade.mongodb import MongoDB
+from tastytrade.replay import FrameRecorder, ReplayServer, read_recording
+from tastytrade.streamer import _EVENT_CLASSES, DXLinkStreamer
+
+# Synthetic FEED_DATA frames per event type, and events in each frame
+FRAMES = 200
+EVENTS_PER_FRAME = 100
+# Share of optional synthetic values sent as 'NaN', as the feed does
+MISSING_SHARE = 0.1
+# A stage is reported as a regression when its throughput drops this much
+REGRESSION_THRESHOLD = 0.1
+# Document types process_raw_data knows how to decode
+RAW_TYPES = ('Trade', 'Greeks')
+
+
+class MemoryCollection:
+    # In-memory stand-in for a pymongo collection; it only counts, so the
+    # benchmark measures our side of the pipeline and not the database
+    def __init__(self):
+        self.inserted = 0
+        self.deleted = 0
+
+    def insert_many(self, documents, ordered=True):
+        self.inserted += len(documents)
+
+    def delete_many(self, query):
+        self.deleted += len(query['_id']['$in'])
+
+
+class AsyncMemoryCollection(MemoryCollection):
+    # The same stand-in for a motor collection
+    async def insert_many(self, documents, ordered=True):
+        self.inserted += len(documents)
+
+
+def synthetic_value(kind, symbol, index, optional):
+    if kind is str:
+        return symbol
+    if kind is bool:
+        return False
+    if kind is int:
+        return 1718000000000 + index
+    if kind is type(None):
+        return None
+    if optional and random.random() < MISSING_SHARE:
+        return 'NaN'
+    return round(random.uniform(0.01, 500), 4)
+
+
+def write_synthetic_recording(path, frames, events_per_frame):
+    # One FEED_CONFIG per event type, then its FEED_DATA frames in COMPACT
+    # format, interleaved the way a busy connection delivers them
+    random.seed(0)
+    recorder = FrameRecorder(path)
+    channels = {}
+    for i, (event_type, event_class) in enumerate(_EVENT_CLASSES.items()):
+        channels[event_type] = 2 * i + 1
+        recorder.write(json.dumps({
+            'type': 'FEED_CONFIG', 'channel': channels[event_type],
+            'dataFormat': 'COMPACT',
+            'eventFields': {event_type.value: list(event_class.model_fields)}
+        }), 0.0)
+    for frame in range(frames):
+        for event_type, event_class in _EVENT_CLASSES.items():
+            types = event_class.field_types()
+            fields = event_class.model_fields
+            values = []
+            for event in range(events_per_frame):
+                symbol = f'SYM{random.randrange(5000)}'
+                index = frame * events_per_frame + event
+                for name, kind in types.items():
+                    optional = not fields[name].is_required()
+                    value = synthetic_value(kind, symbol, index, optional)
+                    if name == 'eventSymbol':
+                        value = symbol
+                    values.append(value)
+            recorder.write(json.dumps({
+                'type': 'FEED_DATA', 'channel': channels[event_type],
+                'data': [event_type.value, values]
+            }), frame * 0.01)
+    recorder.close()
+
+
+def load_feeds(path):
+    # The FEED_DATA payloads of a recording with the fields they were sent
+    # with, grouped by event type
+    fields = {}
+    feeds = {}
+    for _, frame in read_recording(path):
+        message = json.loads(frame)
+        if message['type'] == 'FEED_CONFIG':
+            fields.update(message.get('eventFields', {}))
+        elif message['type'] == 'FEED_DATA':
+            header, data = message['data']
+            if isinstance(header, str):
+                event_type = header
+            else:
+                event_type = header[0]
+                if len(header) > 1:
+                    fields[event_type] = header[1]
+            feeds.setdefault(event_type, []).append(
+                (fields.get(event_type), data))
+    return feeds
+
+
+def count_events(event_type, fields, data):
+    size = len(fields or _EVENT_CLASSES[EventType(event_type)].model_fields)
+    return len(data) // size
+
+
+def bench_from_stream(feeds, event_type, options):
+    event_class = _EVENT_CLASSES[EventType(event_type)]
+    latencies = []
+    events = 0
+    for fields, data in feeds[event_type]:
+        start = time.perf_counter()
+        events += len(event_class.from_stream(data, fields))
+        latencies.append(time.perf_counter() - start)
+    return events, latencies, sum(latencies)
+
+
+def bench_map_message(feeds, mode, options):
+    # Messages of every event type go through the streamer's decoding and
+    # queueing; the queues are emptied between messages, outside the timing
+    async def run():
+        async with ReplayServer(options['recording']) as server:
+            streamer = DXLinkStreamer(server.session,
+                                      records=mode == 'records',
+                                      columnar=mode == 'columnar')
+            async with streamer:
+                latencies = []
+                events = 0
+                for event_type, payloads in feeds.items():
+                    queue = streamer._queues[EventType(event_type)]
+                    for fields, data in payloads:
+                        start = time.perf_counter()
+                        await streamer._map_message(EventType(event_type),
+                                                    fields, data)
+                        latencies.append(time.perf_counter() - start)
+                        events += count_events(event_type, fields, data)
+                        while not queue.empty():
+                            queue.get_nowait()
+                return events, latencies, sum(latencies)
+    return asyncio.run(run())
+
+
+def memory_mongodb():
+    # MongoDB reads its settings from config.ini in the working directory,
+    # so one is written to a temporary directory for the constructor; the
+    # client never connects, since the collection is replaced
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, 'config.ini'), 'w') as f:
+            f.write('[MONGODB]\nUser = bench\nPassword = bench\n'
+                    'URI = localhost:27017\n')
+        os.chdir(directory)
+        try:
+            mongodb = MongoDB('tastytrade_bench', 'market_data')
+        finally:
+            os.chdir(cwd)
+    mongodb.collection = AsyncMemoryCollection()
+    return mongodb
+
+
+def bench_mongodb_insert(feeds, _, options):
+    # Raw messages as the streamer stores them; the final flush is timed
+    # too, since it is part of getting every message written
+    async def run():
+        if options['mongodb']:
+            mongodb = MongoDB('tastytrade_bench', 'market_data')
+        else:
+            mongodb = memory_mongodb()
+        latencies = []
+        events = 0
+        for event_type, payloads in feeds.items():
+            for fields, data in payloads:
+                start = time.perf_counter()
+                await mongodb.insert([event_type, data], fields)
+                latencies.append(time.perf_counter() - start)
+                events += count_events(event_type, fields, data)
+        start = time.perf_counter()
+        await mongodb.flush_buffer()
+        flush = time.perf_counter() - start
+        if options['mongodb']:
+            await mongodb.collection.drop()
+        await mongodb.close()
+        return events, latencies, sum(latencies) + flush
+    return asyncio.run(run())
+
+
+def raw_documents(feeds, event_types=None):
+    # Raw documents as the streamer stores them, of every recorded type
+    # unless `event_types` narrows them down
+    return [{'type': event_type, 'content': data, 'fields': fields}
+            for event_type, payloads in feeds.items()
+            if event_types is None or event_type in event_types
+            for fields, data in payloads]
+
+
+def bench_process_document(feeds, _, options):
+    latencies = []
+    events = 0
+    for document in raw_documents(feeds, RAW_TYPES):
+        start = time.perf_counter()
+        events += len(process_document(document))
+        latencies.append(time.perf_counter() - start)
+    return events, latencies, sum(latencies)
+
+
+def bench_handle_batch(feeds, _, options):
+    # Batches of raw documents decoded and written as process_raw_data
+    # does it, one insert_many per target collection; other event types
+    # are part of the batches too, as they are in the raw collection
+    if options['mongodb']:
+        source = connect()[0]
+        collections = [source.database.client['tastytrade_bench'][name]
+                       for name in ('bench_source', 'bench_trades',
+                                    'bench_greeks')]
+    else:
+        collections = [MemoryCollection() for _ in range(3)]
+    source, trades, greeks = collections
+    documents = raw_documents(feeds)
+    latencies = []
+    events = 0
+    for offset in range(0, len(documents), BATCH_SIZE):
+        # handle_batch pops the _id, so each batch gets fresh copies
+        batch = [dict(document, _id=offset + i) for i, document
+                 in enumerate(documents[offset:offset + BATCH_SIZE])]
+        start = time.perf_counter()
+        events += handle_batch(batch, trades, greeks, source)
+        latencies.append(time.perf_counter() - start)
+    if options['mongodb']:
+        for collection in collections:
+            collection.drop()
+    return events, latencies, sum(latencies)
+
+
+def bench_end_to_end(feeds, _, options):
+    # The recording replayed as fast as possible through a local socket
+    # into a streamer producing records, until every event came out of the
+    # queues; there is no per-call latency here, only throughput
+    expected = {event_type: sum(count_events(event_type, fields, data)
+                                for fields, data in payloads)
+                for event_type, payloads in feeds.items()}
+
+    async def drain(streamer, event_type, count):
+        received = 0
+        async for _ in streamer.listen(EventType(event_type)):
+            received += 1
+            if received == count:
+                return
+
+    async def run():
+        async with ReplayServer(options['recording'], speed=0,
+                                autoplay=False) as server:
+            async with DXLinkStreamer(server.session,
+                                      records=True) as streamer:
+                for event_type in expected:
+                    await streamer.subscribe(EventType(event_type),
+                                             ['BENCH'])
+                # the last feed setups may still be on their way
+                while not set(expected) <= server.feeds:
+                    await asyncio.sleep(0.01)
+                drains = [asyncio.create_task(drain(streamer, event_type,
+                                                    count))
+                          for event_type, count in expected.items()]
+                start = time.perf_counter()
+                server.play()
+                await asyncio.gather(*drains)
+                return sum(expected.values()), [], \
+                    time.perf_counter() - start
+    return asyncio.run(run())
+
+
+STAGES = {
+    'from_stream': bench_from_stream,
+    'map_message': bench_map_message,
+    'mongodb_insert': bench_mongodb_insert,
+    'process_document': bench_process_document,
+    'handle_batch': bench_handle_batch,
+    'end_to_end': bench_end_to_end,
+}
+
+
+def stage_names(feeds):
+    # Every stage and variant, as 'stage' or 'stage[variant]'
+    names = [f'from_stream[{event_type}]' for event_type in feeds]
+    names += [f'map_message[{mode}]'
+              for mode in ('events', 'records', 'columnar')]
+    names += ['mongodb_insert', 'process_document', 'handle_batch',
+              'end_to_end']
+    return names
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def run_stage(name, options):
+    # Each stage runs in a fresh process, so its peak RSS is its own
+    feeds = load_feeds(options['recording'])
+    stage, _, variant = name.partition('[')
+    baseline_rss = peak_rss_mb()
+    events, latencies, seconds = STAGES[stage](feeds, variant.rstrip(']'),
+                                               options)
+    p50 = percentile(latencies, 0.5)
+    p99 = percentile(latencies, 0.99)
+    return {
+        'events': events,
+        'seconds': seconds,
+        'events_per_second': events / seconds if seconds else None,
+        'p50_ms': p50 * 1000 if p50 is not None else None,
+        'p99_ms': p99 * 1000 if p99 is not None else None,
+        'calls': len(latencies),
+        'baseline_rss_mb': baseline_rss,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    # Throughput relative to the baseline, per stage present in both runs
+    regressions = []
+    print(f"\nCompared to {baseline.get('commit')} "
+          f"({baseline.get('created_at')}):")
+    for name, result in results['stages'].items():
+        before = baseline['stages'].get(name)
+        if not before or not before['events_per_second'] \
+                or not result['events_per_second']:
+            continue
+        ratio = result['events_per_second'] / before['events_per_second']
+        flag = ''
+        if ratio < 1 - threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f'{name:>28}: {ratio:6.2f}x throughput{flag}')
+    return regressions
+
+
+def print_result(name, result):
+    p50 = result['p50_ms']
+    p99 = result['p99_ms']
+    latency = f'p50 {p50:8.3f} ms  p99 {p99:8.3f} ms' \
+        if p50 is not None else ' ' * 31
+    print(f"{name:>28}: {result['events_per_second']:>12,.0f} events/s  "
+          f"{latency}  peak RSS {result['peak_rss_mb']:7.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Throughput, latency and memory of the ingest pipeline.')
+    parser.add_argument('--recording',
+                        help='a recording made by DXLinkStreamer, '
+                             'synthetic frames are used without one')
+    parser.add_argument('--frames', type=int, default=FRAMES,
+                        help='synthetic frames per event type')
+    parser.add_argument('--events-per-frame', type=int,
+                        default=EVENTS_PER_FRAME)
+    parser.add_argument('--stages', nargs='+',
+                        help='only run stages starting with these names')
+    parser.add_argument('--mongodb', action='store_true',
+                        help='write to the MongoDB in config.ini instead '
+                             'of in-memory collections')
+    parser.add_argument('--output',
+                        help='file to save the results to, defaults to '
+                             'benchmarks/results/ingest-<commit>.json')
+    parser.add_argument('--compare',
+                        help='results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float,
+                        default=REGRESSION_THRESHOLD,
+                        help='throughput drop reported as a regression')
+    args = parser.parse_args()
+
+    recording = args.recording
+    if recording is None:
+        recording = os.path.join(tempfile.mkdtemp(), 'synthetic.jsonl.gz')
+        write_synthetic_recording(recording, args.frames,
+                                  args.events_per_frame)
+    recording = os.path.abspath(recording)
+    options = {'recording': recording, 'mongodb': args.mongodb}
+
+    names = stage_names(load_feeds(recording))
+    if args.stages:
+        names = [name for name in names
+                 if any(name.startswith(prefix) for prefix in args.stages)]
+
+    commit = git_commit()
+    results = {
+        'commit': commit,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'recording': args.recording or 'synthetic',
+        'frames': args.frames,
+        'events_per_frame': args.events_per_frame,
+        'mongodb': 'config.ini' if args.mongodb else 'memory',
+        'stages': {},
+    }
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1,
+                                 mp_context=get_context('spawn')) as pool:
+            result = pool.submit(run_stage, name, options).result()
+        results['stages'][name] = result
+        print_result(name, result)
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'results',
+        f'ingest-{commit or "local"}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'\nResults saved to {output}')
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,129 @@
 import datetime
 import time
+from bisect import bisect_left, insort
 from configparser import ConfigParser
+from itertools import groupby
 
 import pymongo
+from bson import ObjectId
+
+# Only one greeks sample per symbol is kept for each interval, in ms
+SAMPLE_INTERVAL = 600000
+# Number of documents removed per delete_many
+DELETE_BATCH_SIZE = 1000
+# Seconds after which an insert is assumed to be visible; documents with
+# newer _ids are left for the next run
+SETTLE_TIME = 60
+# _id of the watermark document holding the position in greeks_data, no
+# symbol is empty
+POSITION_ID = ''
+
+
+def keep_new_samples(times, last_kept):
+    # Apply the interval rule to samples newer than the last kept one,
+    # yielding whether each of them is kept
+    for current_time in times:
+        if last_kept is None or (current_time - last_kept) >= SAMPLE_INTERVAL:
+            last_kept = current_time
+            yield True
+        else:
+            yield False
+
+
+def keep_late_samples(times, kept):
+    # Samples that arrived after newer ones were kept are only kept when no
+    # kept sample of the symbol is within the interval on either side
+    for current_time in times:
+        i = bisect_left(kept, current_time)
+        if (i > 0 and current_time - kept[i - 1] < SAMPLE_INTERVAL) or \
+                (i < len(kept) and kept[i] - current_time < SAMPLE_INTERVAL):
+            yield False
+        else:
+            insort(kept, current_time)
+            yield True
+
+
+def kept_times(greeks_data, symbol, times, position):
+    # Times of the samples already processed around the late ones; whatever
+    # is left of them was kept by an earlier run
+    query = {'eventSymbol': symbol,
+             'time': {'$gt': times[0] - SAMPLE_INTERVAL,
+                      '$lt': times[-1] + SAMPLE_INTERVAL},
+             '_id': {'$lte': position}}
+    cursor = greeks_data.find(query, {'_id': 0, 'time': 1}) \
+        .sort('time', pymongo.ASCENDING) \
+        .hint([('eventSymbol', pymongo.ASCENDING),
+               ('time', pymongo.ASCENDING)])
+    return [doc['time'] for doc in cursor]
+
+
+def downsample(greeks_data, watermarks):
+    # The watermark is a position in insertion order, so each run looks at
+    # every document written since the previous one, however old its event
+    # time. Those are walked once, ordered by symbol and time; the last kept
+    # time of each symbol is stored alongside, and only samples older than
+    # it need their neighbours looked up
+    state = {doc['_id']: doc for doc in watermarks.find()}
+    position = state.pop(POSITION_ID, {}).get('position')
+    # Without a position, e.g. on the first run, everything is new
+    last_kept = {} if position is None else \
+        {symbol: doc['last_kept'] for symbol, doc in state.items()}
+    settled = ObjectId.from_datetime(
+        datetime.datetime.now(datetime.timezone.utc)
+        - datetime.timedelta(seconds=SETTLE_TIME))
+
+    query = {'_id': {'$lte': settled}}
+    if position is not None:
+        query['_id']['$gt'] = position
+    projection = {'_id': 1, 'eventSymbol': 1, 'time': 1}
+    cursor = greeks_data.find(query, projection) \
+        .sort([('eventSymbol', pymongo.ASCENDING),
+               ('time', pymongo.ASCENDING)]) \
+        .allow_disk_use(True)
+
+    ids_to_delete = []
+    deleted = 0
+    updates = []
+    for symbol, docs in groupby(cursor, key=lambda doc: doc['eventSymbol']):
+        docs = list(docs)
+        last = last_kept.get(symbol)
+        late = [] if last is None else \
+            [doc for doc in docs if doc['time'] <= last]
+        new = docs[len(late):]
+
+        decisions = []
+        if late:
+            times = [doc['time'] for doc in late]
+            kept = kept_times(greeks_data, symbol, times, position)
+            decisions += zip(late, keep_late_samples(times, kept))
+        decisions += zip(new, keep_new_samples(
+            (doc['time'] for doc in new), last))
+
+        for doc, keep in decisions:
+            if keep:
+                if last is None or doc['time'] > last:
+                    last = doc['time']
+                continue
+            # Mark this document for deletion
+            ids_to_delete.append(doc['_id'])
+            if len(ids_to_delete) >= DELETE_BATCH_SIZE:
+                greeks_data.delete_many({'_id': {'$in': ids_to_delete}})
+                deleted += len(ids_to_delete)
+                ids_to_delete = []
+
+        if last is not None and last != last_kept.get(symbol):
+            updates.append(pymongo.UpdateOne(
+                {'_id': symbol}, {'$set': {'last_kept': last}}, upsert=True))
+
+    if ids_to_delete:
+        greeks_data.delete_many({'_id': {'$in': ids_to_delete}})
+        deleted += len(ids_to_delete)
+    # The position goes last, so it only moves once everything before it
+    # is stored
+    updates.append(pymongo.UpdateOne(
+        {'_id': POSITION_ID}, {'$set': {'position': settled}}, upsert=True))
+    watermarks.bulk_write(updates)
+    return deleted
 
 
 def main():
@@ -18,47 +139,15 @@ def main():
     client = pymongo.MongoClient(f'mongodb://{user}:{password}@{uri}')
     db = client['tastytrade']
     greeks_data = db['greeks_data']
-
-    # Aggregation pipeline to find the documents to delete
-    pipeline = [
-        {'$sort': {'eventSymbol': 1, 'time': 1}},
-        {
-            '$group': {
-                '_id': '$eventSymbol',
-                'docs': {'$push': {'_id': '$_id', 'time': '$time'}},
-            }
-        },
-        {
-            '$project': {
-                'eventSymbol': '$_id',
-                '_id': 0,
-                'docs': 1
-            }
-        }
-    ]
+    watermarks = db['greeks_watermarks']
+    greeks_data.create_index([('eventSymbol', pymongo.ASCENDING),
+                              ('time', pymongo.ASCENDING)])
 
     while True:
-        result = greeks_data.aggregate(pipeline)
-
-        for group in result:
-            docs = group['docs']
-            last_valid_time = None
-            ids_to_delete = []
-
-            for doc in docs:
-                current_time = doc['time']
-
-                if last_valid_time is None or (current_time - last_valid_time) >= 600000:
-                    # Update last valid time if this document is kept
-                    last_valid_time = current_time
-                else:
-                    # Mark this document for deletion
-                    ids_to_delete.append(doc['_id'])
-
-            if ids_to_delete:
-                greeks_data.delete_many({'_id': {'$in': ids_to_delete}})
+        deleted = downsample(greeks_data, watermarks)
 
-        print(f"{datetime.datetime.now()}: Cleanup complete.")
+        print(f"{datetime.datetime.now()}: Cleanup complete, "
+              f"deleted {deleted} documents.")
         time.sleep(600)
 
 
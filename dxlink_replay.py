@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+
+from session import ApplicationSession
+from tastytrade.dxfeed import EventType
+from tastytrade.replay import ReplayServer
+from tastytrade.streamer import DXLinkStreamer
+
+
+async def record(path, event_types, symbols, seconds):
+    # Subscribe with a live session and write every frame to the recording;
+    # events aren't parsed or kept, only the raw frames matter here
+    session = ApplicationSession().session
+    async with DXLinkStreamer(session, publish_events=False,
+                              record_path=path) as streamer:
+        for event_type in event_types:
+            await streamer.subscribe(event_type, symbols)
+        await asyncio.sleep(seconds)
+        print(f'Recorded {streamer.stats.recorded} frames '
+              f'({streamer.stats.events} events) to {path}')
+
+
+async def serve(path, speed, host, port, loop):
+    # Replay the recording to every client until interrupted
+    async with ReplayServer(path, speed=speed, host=host, port=port,
+                            loop=loop) as server:
+        print(f'Replaying {path} on {server.url} at '
+              f'{"max" if not speed else f"{speed}x"} speed')
+        await asyncio.Future()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Record a live DXLink session or replay a recording.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    recorder = commands.add_parser('record', help='record a live session')
+    recorder.add_argument('path', help='recording to write, e.g. x.jsonl.gz')
+    recorder.add_argument('symbols', nargs='+')
+    recorder.add_argument('--types', nargs='+', default=['Quote'],
+                          choices=[event_type.value
+                                   for event_type in EventType])
+    recorder.add_argument('--seconds', type=float, default=60)
+
+    server = commands.add_parser('serve', help='replay a recording')
+    server.add_argument('path', help='recording to replay')
+    server.add_argument('--speed', type=float, default=1.0,
+                        help='playback speed, 0 for as fast as possible')
+    server.add_argument('--host', default='localhost')
+    server.add_argument('--port', type=int, default=8765)
+    server.add_argument('--loop', action='store_true',
+                        help='start over when the recording ends')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        event_types = [EventType(event_type) for event_type in args.types]
+        asyncio.run(record(args.path, event_types, args.symbols,
+                           args.seconds))
+    else:
+        try:
+            asyncio.run(serve(args.path, args.speed, args.host, args.port,
+                              args.loop))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,13 @@
 import asyncio
 import time
 from dataclasses import asdict, dataclass, field
-from threading import Thread
-from typing import Any, ClassVar, Dict, List
+from threading import Lock, Thread
+from typing import Any, ClassVar, Dict, List, Optional, Set
 
 from session import ApplicationSession
 from tastytrade.instruments import Future
-from tastytrade.streamer import DXLinkStreamer, EventType, Greeks, Quote, Trade
+from tastytrade.dxfeed import GreeksRecord, QuoteRecord, TradeRecord
+from tastytrade.streamer import DXLinkStreamer, EventType
 
 
 @dataclass
@@ -14,14 +15,24 @@ class MarketData:
     # singleton class
     _instance: ClassVar['MarketData'] = None
 
-    _subscribed_symbols: Dict[str, List[str]] = field(init=False,
-                                                      default_factory=dict)
+    _subscribed_symbols: Dict[str, Set[str]] = field(init=False,
+                                                     default_factory=dict)
     _new_symbols: Dict[str, List[str]] = field(init=False, default_factory=dict)
+    # latest event per symbol, for each event type
     _cached_events: Dict[str, Dict[str, Any]] = field(init=False,
                                                       default_factory=dict)
     _stop_streaming: bool = field(init=False, default=False)
     _thread_runs: bool = field(init=False, default=False)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # guards _new_symbols, which both threads swap
+    _pending_lock: Lock = field(init=False, default_factory=Lock)
+    _sending: bool = field(init=False, default=False)
+    # store the raw feed in MongoDB next to the in-memory cache
+    mongodb: bool = True
+    # ms between the samples of a symbol stored in MongoDB, per event type;
+    # greeks are only kept every 10 minutes anyway
+    sample_intervals: Dict[str, int] = field(
+        default_factory=lambda: {EventType.GREEKS: 600000})
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -33,29 +44,45 @@ class MarketData:
             self._new_symbols[EventType.GREEKS] = []
             self._new_symbols[EventType.TRADE] = []
             self._new_symbols[EventType.QUOTE] = []
-            self._subscribed_symbols[EventType.GREEKS] = []
-            self._subscribed_symbols[EventType.TRADE] = []
-            self._subscribed_symbols[EventType.QUOTE] = []
+            self._subscribed_symbols[EventType.GREEKS] = set()
+            self._subscribed_symbols[EventType.TRADE] = set()
+            self._subscribed_symbols[EventType.QUOTE] = set()
             self._cached_events[EventType.GREEKS] = {}
             self._cached_events[EventType.TRADE] = {}
             self._cached_events[EventType.QUOTE] = {}
 
-    def subscribe_greeks(self, symbols: list[str]) -> List[Greeks] | None:
+    def subscribe_greeks(self, symbols: list[str]) -> None:
         return self._subscribe_symbol(EventType.GREEKS, symbols)
 
-    def subscribe_trades(self, symbols: list[str]) -> List[Trade] | None:
+    def subscribe_trades(self, symbols: list[str]) -> None:
         return self._subscribe_symbol(EventType.TRADE, symbols)
 
-    def subscribe_quotes(self, symbols: list[str]) -> Quote | None:
+    def subscribe_quotes(self, symbols: list[str]) -> None:
         return self._subscribe_symbol(EventType.QUOTE, symbols)
 
-    def get_greeks(self, symbols: list[str]) -> List[Greeks] | None:
+    def subscribe(self, subscriptions: Dict[EventType, List[str]],
+                  timeout: Optional[float] = None) -> None:
+        """
+        Subscribes to any number of symbols for several event types in one
+        go. With a timeout, blocks until the subscriptions have been sent or
+        the timeout (in seconds) expires.
+        """
+        for event_type, symbols in subscriptions.items():
+            self._subscribe_symbol(event_type, symbols)
+        if timeout is None:
+            return
+        deadline = time.monotonic() + timeout
+        while (self._sending or any(self._new_symbols.values())) \
+                and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    def get_greeks(self, symbols: list[str]) -> List[GreeksRecord] | None:
         return self._get_events(EventType.GREEKS, symbols)
 
-    def get_trades(self, symbols: list[str]) -> List[Trade] | None:
+    def get_trades(self, symbols: list[str]) -> List[TradeRecord] | None:
         return self._get_events(EventType.TRADE, symbols)
 
-    def get_quotes(self, symbols: list[str]) -> Quote | None:
+    def get_quotes(self, symbols: list[str]) -> List[QuoteRecord] | None:
         return self._get_events(EventType.QUOTE, symbols)
 
     def start_streamer(self) -> None:
@@ -72,72 +99,61 @@ class MarketData:
 
     def _subscribe_symbol(self, event_type: EventType,
                           symbols: List[str]) -> None:
-        new_symbols = (list(
-            set(symbols) - set(self._subscribed_symbols[event_type]))
-                       + self._new_symbols[event_type])
-        if new_symbols:
-            self._new_symbols[event_type] = new_symbols
-            self._subscribed_symbols[event_type] = list(
-                set(self._subscribed_symbols[event_type]) | set(symbols))
+        with self._pending_lock:
+            subscribed = self._subscribed_symbols[event_type]
+            new_symbols = set(symbols) - subscribed
+            if new_symbols:
+                self._new_symbols[event_type].extend(new_symbols)
+                subscribed.update(new_symbols)
+
+    def _take_new_symbols(self) -> Dict[EventType, List[str]]:
+        with self._pending_lock:
+            new_symbols = {event_type: symbols for event_type, symbols
+                           in self._new_symbols.items() if symbols}
+            for event_type in new_symbols:
+                self._new_symbols[event_type] = []
+            self._sending = bool(new_symbols)
+        return new_symbols
 
     def _get_events(self, event_type: EventType, symbols: List[str]) \
-            -> List[Greeks] | List[Trade] | List[Quote] | None:  # NOQA
-        market_data = list(self._cached_events[event_type].values())
-        market_data = [data for data in market_data if
-                       data.eventSymbol in symbols]
-        return market_data
-
-    async def _fetch_greeks(self) -> None:
-        session = ApplicationSession().session  # NOQA
-        async with DXLinkStreamer(session, mongodb=True) as streamer:
-            while not self._stop_streaming:
-                if self._new_symbols[EventType.GREEKS]:
-                    await self._lock.acquire()
-                    await streamer.subscribe(EventType.GREEKS,
-                                             symbols=self._new_symbols[
-                                                 EventType.GREEKS])
-                    self._lock.release()
-                    self._new_symbols[EventType.GREEKS] = []
-                size = streamer._queues[EventType.QUOTE].qsize()
-                if 0 < size % 100 < 25:
-                    print(size)
-                await asyncio.sleep(0.1)
-
-    async def _fetch_trades(self) -> None:
-        session = ApplicationSession().session  # NOQA
-        async with DXLinkStreamer(session, mongodb=True) as streamer:
-            while not self._stop_streaming:
-                if self._new_symbols[EventType.TRADE]:
-                    await self._lock.acquire()
-                    await streamer.subscribe(EventType.TRADE,
-                                             symbols=self._new_symbols[
-                                                 EventType.TRADE])
-                    self._lock.release()
-                    self._new_symbols[EventType.TRADE] = []
-                size = streamer._queues[EventType.QUOTE].qsize()
-                if 0 < size % 100 < 25:
-                    print(size)
-                await asyncio.sleep(0.1)
-
-    async def _fetch_quotes(self) -> None:
-        session = ApplicationSession().session  # NOQA
-        async with DXLinkStreamer(session, mongodb=True) as streamer:
-            while not self._stop_streaming:
-                if self._new_symbols[EventType.QUOTE]:
-                    await self._lock.acquire()
-                    await streamer.subscribe(EventType.QUOTE,
-                                             symbols=self._new_symbols[
-                                                 EventType.QUOTE])
-                    self._lock.release()
-                    self._new_symbols[EventType.QUOTE] = []
-                size = streamer._queues[EventType.QUOTE].qsize()
-                if 0 < size % 100 < 100:
-                    print(size)
-                await asyncio.sleep(0.1)
+            -> List[GreeksRecord] | List[TradeRecord] | List[QuoteRecord] | None:  # NOQA
+        cache = self._cached_events[event_type]
+        return [cache[symbol] for symbol in symbols if symbol in cache]
+
+    async def _update_cache(self, streamer: DXLinkStreamer,
+                            event_type: EventType) -> None:
+        # keep only the latest event per symbol
+        cache = self._cached_events[event_type]
+        async for event in streamer.listen(event_type):
+            cache[event.eventSymbol] = event
 
     async def _start_streamers(self) -> None:
-        await asyncio.gather(self._fetch_quotes(), self._fetch_trades(),
-                             self._fetch_greeks())
+        # every event type is multiplexed over a single connection
+        application_session = ApplicationSession()
+        session = application_session.session
+        async with DXLinkStreamer(session, mongodb=self.mongodb,
+                                  records=True,
+                                  publish_events=True,
+                                  sample_intervals=self.sample_intervals
+                                  ) as streamer:
+            cache_tasks = [
+                asyncio.create_task(self._update_cache(streamer, event_type))
+                for event_type in self._new_symbols
+            ]
+            # the streamer token is replaced before it expires
+            cache_tasks.append(asyncio.create_task(
+                application_session.keep_streamers_authorized([streamer])))
+            try:
+                while not self._stop_streaming:
+                    new_symbols = self._take_new_symbols()
+                    if new_symbols:
+                        async with self._lock:
+                            await streamer.subscribe_many(new_symbols)
+                        self._sending = False
+                    await asyncio.sleep(0.1)
+            finally:
+                for task in cache_tasks:
+                    task.cancel()
 
     def _streamer_thread(self) -> None:
         asyncio.run(self._start_streamers())
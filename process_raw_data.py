@@ -1,58 +1,255 @@
+import argparse
+import os
+import socket
 import time
 from configparser import ConfigParser
-from decimal import Decimal
+from datetime import datetime, timedelta, timezone
+from multiprocessing import Process
+from threading import Thread
 
 import pymongo
 
-from tastytrade.dxfeed.greeks import Greeks
-from tastytrade.dxfeed.trade import Trade
+from storage import (create_timeseries_collections, timeseries_collections,
+                     to_timeseries)
+from tastytrade.dxfeed import GreeksRecord, TradeRecord
+from tastytrade.utils import TastytradeError
 
-
-def convert_decimal(obj):
-    if isinstance(obj, Decimal):
-        return float(obj)
-    elif isinstance(obj, dict):
-        return {k: convert_decimal(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_decimal(item) for item in obj]
-    else:
-        return obj
+# Number of source documents processed and acknowledged together
+BATCH_SIZE = 500
+# Seconds a partial batch waits for more inserts before it is processed
+MAX_BATCH_WAIT = 0.2
+# Seconds between polls when change streams are unavailable
+POLL_INTERVAL = 0.5
+# Error code returned by servers that aren't part of a replica set
+CHANGE_STREAMS_UNSUPPORTED = 40573
+# Record classes used to decode each type of source document
+RECORD_CLASSES = {'Trade': TradeRecord, 'Greeks': GreeksRecord}
+# Seconds without renewal after which a claim is presumed to belong to a
+# crashed worker
+CLAIM_TIMEOUT = 60
+# Seconds between renewals of a worker's claims
+CLAIM_RENEW_INTERVAL = 15
+# Seconds between throughput reports of each worker
+REPORT_INTERVAL = 10
 
 
 def process_document(document):
-    # Check the type field and call the appropriate method
-    if document.get('type') == 'Trade':
-        trades = Trade.from_stream(document['content'])
-        return [convert_decimal(trade.__dict__) for trade in trades if trade.time != 0]
-    elif document.get('type') == 'Greeks':
-        greeks = Greeks.from_stream(document['content'])
-        return [convert_decimal(greek.__dict__) for greek in greeks if greek.time != 0]
-    else:
+    # Decode the COMPACT rows straight into BSON-ready dictionaries
+    record_class = RECORD_CLASSES.get(document.get('type'))
+    if record_class is None:
         raise ValueError(f"Unknown document type: {document.get('type')}")
+    rows = record_class.dicts_from_stream(document['content'],
+                                          document.get('fields'))
+    return [row for row in rows if row['time'] != 0]
 
 
-def handle_document(document, trade_data, greeks_data, collection_source):
-    document_id = document['_id']  # Save _id before processing
-    document.pop('_id', None)  # Remove _id field from the document
-    try:
-        result = process_document(document)
-        if result:  # Check if result is not empty
-            if document.get('type') == 'Trade':
-                trade_data.insert_many(result, ordered=False)
-            elif document.get('type') == 'Greeks':
-                greeks_data.insert_many(result, ordered=False)
-    except pymongo.errors.BulkWriteError as e:
-        # Check for duplicate key error
-        if any(error['code'] == 11000 for error in e.details['writeErrors']):
-            print("Duplicate key error, deleting source document")
-        else:
+def handle_batch(documents, trade_data, greeks_data, collection_source,
+                 timeseries=False):
+    results = {'Trade': [], 'Greeks': []}
+    document_ids = []
+    for document in documents:
+        document_ids.append(document.pop('_id'))  # Save _id before processing
+        if document.get('type') not in RECORD_CLASSES:
+            # Other event types, e.g. quotes, aren't moved anywhere
+            continue
+        try:
+            rows = process_document(document)
+        except (TastytradeError, ValueError) as e:
             print(f"error: {e}")
-    finally:
-        # Delete the document from the source collection
-        collection_source.delete_one({'_id': document_id})
+            continue
+        results[document['type']].extend(rows)
 
+    for document_type, collection in (('Trade', trade_data),
+                                      ('Greeks', greeks_data)):
+        rows = results[document_type]
+        if timeseries:
+            rows = to_timeseries(document_type, rows)
+        if not rows:
+            continue
+        try:
+            collection.insert_many(rows, ordered=False)
+        except pymongo.errors.BulkWriteError as e:
+            # Duplicate keys mean the events were already stored
+            errors = e.details['writeErrors']
+            if not all(error['code'] == 11000 for error in errors):
+                print(f"error: {e}")
 
-def main():
+    # Acknowledge the whole batch with a single delete
+    collection_source.delete_many({'_id': {'$in': document_ids}})
+    return sum(len(rows) for rows in results.values())
+
+
+def read_backlog(collection_source, batch_size, last_id=None):
+    # Yield the documents already waiting in the collection, oldest first
+    while True:
+        query = {} if last_id is None else {'_id': {'$gt': last_id}}
+        batch = list(collection_source.find(query)
+                     .sort('_id', pymongo.ASCENDING)
+                     .limit(batch_size))
+        if not batch:
+            return
+        last_id = batch[-1]['_id']
+        yield batch
+
+
+def watch_inserts(collection_source, batch_size, max_wait, resume_token=None):
+    # Open the change stream first so nothing inserted while the backlog is
+    # drained gets lost, then skip the stream events for drained documents.
+    # Those are matched by _id rather than compared to the last one drained:
+    # with several writers, or spilled data written back with its original
+    # _id, insertion order isn't _id order
+    pipeline = [{'$match': {'operationType': 'insert'}}]
+    with collection_source.watch(
+        pipeline,
+        resume_after=resume_token,
+        max_await_time_ms=int(max_wait * 1000)
+    ) as stream:
+        drained = set()
+        for batch in read_backlog(collection_source, batch_size):
+            drained.update(document['_id'] for document in batch)
+            yield batch, resume_token
+
+        batch = []
+        deadline = 0.0
+        while stream.alive:
+            change = stream.try_next()
+            if change is not None:
+                document = change['fullDocument']
+                if document['_id'] in drained:
+                    # Each document is inserted once, so this is its only
+                    # stream event
+                    drained.discard(document['_id'])
+                else:
+                    if not batch:
+                        deadline = time.monotonic() + max_wait
+                    batch.append(document)
+            if batch and (len(batch) >= batch_size or change is None
+                          or time.monotonic() >= deadline):
+                yield batch, stream.resume_token
+                batch = []
+
+
+def poll_inserts(collection_source, batch_size, poll_interval):
+    # Fallback for servers without change streams, e.g. a standalone mongod;
+    # processed documents are deleted, so whatever is left is still pending
+    while True:
+        found = False
+        for batch in read_backlog(collection_source, batch_size):
+            found = True
+            yield batch
+        if not found:
+            time.sleep(poll_interval)
+
+
+def process_stream(collection_source, trade_data, greeks_data,
+                   batch_size=BATCH_SIZE, timeseries=False):
+    resume_token = None
+    while True:
+        try:
+            batches = watch_inserts(collection_source, batch_size,
+                                    MAX_BATCH_WAIT, resume_token)
+            for batch, resume_token in batches:
+                handle_batch(batch, trade_data, greeks_data,
+                             collection_source, timeseries)
+        except pymongo.errors.OperationFailure as e:
+            if e.code != CHANGE_STREAMS_UNSUPPORTED:
+                raise
+            print("Change streams are not supported, polling instead")
+            break
+        except pymongo.errors.ConnectionFailure as e:
+            # Reopen the change stream where it left off
+            print(f"Change stream interrupted, resuming: {e}")
+            time.sleep(1)
+
+    for batch in poll_inserts(collection_source, batch_size, POLL_INTERVAL):
+        handle_batch(batch, trade_data, greeks_data, collection_source,
+                     timeseries)
+
+
+def claim_batch(collection_source, worker_id, worker_index, batch_size):
+    # Workers look at different slices of the unclaimed documents so that
+    # they rarely race for the same ones; the conditional update below makes
+    # sure each document is claimed by exactly one worker anyway
+    unclaimed = {'claimed_by': None}
+    for skip in (worker_index * batch_size, 0):
+        candidates = [document['_id'] for document in
+                      collection_source.find(unclaimed, {'_id': 1})
+                      .sort('_id', pymongo.ASCENDING)
+                      .skip(skip)
+                      .limit(batch_size)]
+        if candidates:
+            break
+    if not candidates:
+        return []
+
+    collection_source.update_many(
+        {'_id': {'$in': candidates}, 'claimed_by': None},
+        {'$set': {'claimed_by': worker_id,
+                  'claimed_at': datetime.now(timezone.utc)}}
+    )
+    return list(collection_source.find(
+        {'_id': {'$in': candidates}, 'claimed_by': worker_id}
+    ))
+
+
+def renew_claims(collection_source, worker_id):
+    # Runs beside the worker's main loop, so a batch that takes long to
+    # process keeps its claims; they only go stale once the process is gone
+    while True:
+        time.sleep(CLAIM_RENEW_INTERVAL)
+        try:
+            collection_source.update_many(
+                {'claimed_by': worker_id},
+                {'$set': {'claimed_at': datetime.now(timezone.utc)}}
+            )
+        except pymongo.errors.PyMongoError as e:
+            print(f"error: {e}")
+
+
+def release_stale_claims(collection_source):
+    # Hand the documents of crashed workers back to the pool; live workers
+    # renew their claims, so only abandoned ones get this old
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=CLAIM_TIMEOUT)
+    result = collection_source.update_many(
+        {'claimed_at': {'$lt': cutoff}},
+        {'$unset': {'claimed_by': '', 'claimed_at': ''}}
+    )
+    if result.modified_count:
+        print(f"Released {result.modified_count} stale claims")
+
+
+def process_claims(worker_index, batch_size=BATCH_SIZE, timeseries=False):
+    collection_source, trade_data, greeks_data = connect(timeseries)
+    worker_id = f'{socket.gethostname()}-{os.getpid()}'
+    Thread(target=renew_claims, args=(collection_source, worker_id),
+           daemon=True).start()
+
+    documents = events = 0
+    last_report = last_release = time.monotonic()
+    while True:
+        batch = claim_batch(collection_source, worker_id, worker_index,
+                            batch_size)
+        if batch:
+            documents += len(batch)
+            events += handle_batch(batch, trade_data, greeks_data,
+                                   collection_source, timeseries)
+        else:
+            time.sleep(POLL_INTERVAL)
+
+        now = time.monotonic()
+        if now - last_release >= CLAIM_TIMEOUT / 2:
+            release_stale_claims(collection_source)
+            last_release = now
+        if now - last_report >= REPORT_INTERVAL:
+            elapsed = now - last_report
+            print(f"Worker {worker_index}: "
+                  f"{documents / elapsed:.1f} documents/s, "
+                  f"{events / elapsed:.1f} events/s")
+            documents = events = 0
+            last_report = now
+
+
+def connect(timeseries=False):
     # Read MongoDB configuration from config.ini
     config = ConfigParser()
     config.read('config.ini')
@@ -65,17 +262,49 @@ def main():
     client = pymongo.MongoClient(
         f'mongodb://{user}:{password}@{uri}')
     db = client['tastytrade']
-    collection_source = db['market_data']
-    trade_data = db['trade_data']
-    greeks_data = db['greeks_data']
+    if timeseries:
+        collections = timeseries_collections(db)
+        return db['market_data'], collections['Trade'], collections['Greeks']
+    return db['market_data'], db['trade_data'], db['greeks_data']
 
-    while True:
-        # Process existing documents
-        for document in collection_source.find():
-            handle_document(document, trade_data, greeks_data, collection_source)
 
-        # Sleep for a while before checking for new documents again
-        time.sleep(10)
+def main():
+    parser = argparse.ArgumentParser(
+        description='Move raw streamer data into the event collections.')
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help='number of worker processes claiming batches in parallel')
+    parser.add_argument(
+        '--batch-size', type=int, default=BATCH_SIZE,
+        help='number of source documents handled at once')
+    parser.add_argument(
+        '--timeseries', action='store_true',
+        help='store events in time-series collections (see storage.py)')
+    args = parser.parse_args()
+
+    collection_source, _, _ = connect()
+    if args.timeseries:
+        create_timeseries_collections(collection_source.database)
+
+    if args.workers <= 1:
+        process_stream(*connect(args.timeseries),
+                       batch_size=args.batch_size,
+                       timeseries=args.timeseries)
+        return
+
+    collection_source.create_index([('claimed_by', pymongo.ASCENDING),
+                                    ('_id', pymongo.ASCENDING)])
+    collection_source.create_index('claimed_at', sparse=True)
+    release_stale_claims(collection_source)
+
+    workers = [Process(target=process_claims,
+                       args=(worker_index, args.batch_size,
+                             args.timeseries))
+               for worker_index in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
 
 
 if __name__ == "__main__":
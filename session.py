@@ -1,20 +1,43 @@
+import asyncio
+import os
 from configparser import ConfigParser
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Any, List, Optional
 
+from tastytrade import logger
 from tastytrade.session import ProductionSession
+from tastytrade.utils import TastytradeError
+
+# File the session is kept in between runs, unless config.ini names another
+SESSION_CACHE = 'session.json'
+# The streamer token is replaced this long before it expires
+REFRESH_MARGIN = timedelta(hours=1)
 
 
 class ApplicationSession:
     """
     It provides access to the  session object and reads configuration from a config file.
+
+    A single session is shared by everything in the process, and it is saved
+    to the `SessionCache` file of the `TASTY` section of config.ini so other
+    processes and later runs can reuse it. A saved session is only checked
+    with one request; if it has expired, its remember token is used to log
+    in again, and the password only when that fails too.
     """
+    _session: Optional[ProductionSession] = None
+    _lock = Lock()
 
     def __init__(self) -> None:
         config: ConfigParser = ConfigParser()
         config.read('config.ini')
 
-        login: str = config['TASTY']['Login']
-        password: str = config['TASTY']['Password']
-        self._session: ProductionSession = ProductionSession(login, password)
+        self._config = config['TASTY']
+        self._cache_path: str = self._config.get('SessionCache',
+                                                 SESSION_CACHE)
+        with ApplicationSession._lock:
+            if ApplicationSession._session is None:
+                ApplicationSession._session = self._restore()
         self.initialized: bool = True  # Mark as initialized
 
     @property
@@ -25,4 +48,90 @@ class ApplicationSession:
         Returns:
             Session: The  session object.
         """
-        return self._session
\ No newline at end of file
+        return ApplicationSession._session  # type: ignore
+
+    def _restore(self) -> ProductionSession:
+        remember_token = None
+        if os.path.isfile(self._cache_path):
+            try:
+                with open(self._cache_path, 'r') as f:
+                    session = ProductionSession.deserialize(f.read())
+            except (ValueError, KeyError) as e:
+                logger.warning('Ignoring unreadable session cache: %s', e)
+            else:
+                if session.validate():
+                    if self._expires_soon(session):
+                        session.refresh_streamer_token()
+                        self._save(session)
+                    return session
+                remember_token = session.remember_token
+
+        login: str = self._config['Login']
+        session = None
+        if remember_token is not None:
+            try:
+                session = ProductionSession(login, remember_me=True,
+                                            remember_token=remember_token)
+            except TastytradeError as e:
+                logger.warning('Remember token was rejected: %s', e)
+        if session is None:
+            password: str = self._config['Password']
+            session = ProductionSession(login, password, remember_me=True)
+        self._save(session)
+        return session
+
+    def _save(self, session: ProductionSession) -> None:
+        # Write to a private temporary file and rename it over the cache, so
+        # another process never reads a half-written session; the name is
+        # per process so processes saving at once don't share it
+        temporary = f'{self._cache_path}.{os.getpid()}.tmp'
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(session.serialize())
+        os.replace(temporary, self._cache_path)
+
+    @staticmethod
+    def _expires_soon(session: ProductionSession) -> bool:
+        remaining = session.streamer_expiration - datetime.now(timezone.utc)
+        return remaining <= REFRESH_MARGIN
+
+    def refresh_streamer_token(self, force: bool = False) -> bool:
+        """
+        Fetches a new streamer token if the current one is about to expire,
+        and saves it to the session cache.
+
+        :param force: fetch a new token even if the current one is fresh
+
+        :return: True if a new token was fetched
+        """
+        session = self.session
+        with ApplicationSession._lock:
+            if not force and not self._expires_soon(session):
+                return False
+            session.refresh_streamer_token()
+            self._save(session)
+        return True
+
+    async def keep_streamers_authorized(self, streamers: List[Any]) -> None:
+        """
+        Replaces the streamer token shortly before it expires, forever, and
+        hands every new token to the given streamers.
+
+        :param streamers:
+            :class:`~tastytrade.streamer.DXLinkStreamer` or
+            :class:`~tastytrade.streamer.DXLinkStreamerPool` instances
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            wait = self.session.streamer_expiration - REFRESH_MARGIN - \
+                datetime.now(timezone.utc)
+            # never poll faster than once a minute, even for short tokens
+            await asyncio.sleep(max(wait.total_seconds(), 60))
+            try:
+                await loop.run_in_executor(None, self.refresh_streamer_token,
+                                           True)
+            except (TastytradeError, OSError) as e:
+                logger.error('Could not refresh streamer token: %s', e)
+                continue
+            for streamer in streamers:
+                await streamer.update_token(self.session.streamer_token)
@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+
+# Time-series layout of each event type: the collection it is stored in and
+# the bucketing granularity, matched to how often the events arrive
+TIMESERIES_COLLECTIONS = {
+    'Trade': {'name': 'trades', 'granularity': 'seconds'},
+    'Greeks': {'name': 'greeks', 'granularity': 'minutes'},
+}
+
+
+def create_timeseries_collections(db):
+    # Create the time-series collections and their secondary indexes;
+    # calling this again on an existing database is harmless
+    existing = set(db.list_collection_names())
+    for layout in TIMESERIES_COLLECTIONS.values():
+        if layout['name'] not in existing:
+            db.create_collection(
+                layout['name'],
+                timeseries={
+                    'timeField': 'timestamp',
+                    'metaField': 'meta',
+                    'granularity': layout['granularity'],
+                }
+            )
+        # Range queries for one symbol are the common case
+        db[layout['name']].create_index([('meta.eventSymbol', 1),
+                                         ('timestamp', 1)])
+
+
+def timeseries_collections(db):
+    return {event_type: db[layout['name']]
+            for event_type, layout in TIMESERIES_COLLECTIONS.items()}
+
+
+def to_timeseries(event_type, rows):
+    # The symbol and event type become the metaField, so the server buckets
+    # each symbol's events together; `time` (ms since epoch) becomes the
+    # timeField as a BSON date
+    documents = []
+    for row in rows:
+        if row['time'] is None:
+            continue
+        document = dict(row)
+        document['meta'] = {'eventSymbol': document.pop('eventSymbol'),
+                            'type': event_type}
+        document['timestamp'] = datetime.fromtimestamp(
+            document.pop('time') / 1000, tz=timezone.utc)
+        documents.append(document)
+    return documents
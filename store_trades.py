@@ -1,6 +1,9 @@
+import json
 import os
 import signal
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 from datetime import date, datetime
 
@@ -10,54 +13,118 @@ import schedule
 
 from market_data import MarketData
 from session import ApplicationSession
+from tastytrade.dxfeed import EventType
 from tastytrade.instruments import (Future, NestedFutureOptionChain,
+                                    NestedFutureOptionChainExpiration,
                                     get_option_chain)
+from tastytrade.session import ProductionSession
 
 MAX_DTE = 365
 PID_FILE = "/tmp/market_data_script.pid"
+# discovered symbol universes, one file per day
+SYMBOL_CACHE_DIR = "symbol_cache"
+# number of option chains fetched concurrently
+CHAIN_WORKERS = 8
 
 
-def create_symbol_list_earlier_expirations(underlying_symbols: list[str]) \
-        -> tuple[list[str | None], dict[str | None, str | None]]:
-    equity_option_symbols = []
-    future_option_symbols = []
+def _equity_option_symbols(session: ProductionSession, symbol: str) \
+        -> tuple[list[str], dict[str, str]]:
+    # Get option chain for equity options
+    symbols = [symbol]
     streamer_to_normal_symbols = {}
+    option_chain = get_option_chain(session, symbol)
+    for expiration, options in option_chain.items():
+        dte = (expiration - date.today()).days
+        if dte > MAX_DTE:
+            continue
+        for option in options:
+            symbols.append(option.streamer_symbol)
+            streamer_to_normal_symbols[option.streamer_symbol] = symbol
+    return symbols, streamer_to_normal_symbols
+
+
+def _future_option_expirations(session: ProductionSession, symbol: str) \
+        -> list[NestedFutureOptionChainExpiration]:
+    # Get option chain for future options
+    option_chain = sorted(NestedFutureOptionChain
+                          .get_chain(session, symbol)
+                          .option_chains[0].expirations,
+                          key=lambda x: x.expiration_date)
+    return [obj for obj in option_chain
+            if (obj.expiration_date - date.today()).days <= MAX_DTE]
+
+
+def _future_option_symbols(
+        expirations: list[NestedFutureOptionChainExpiration],
+        futures: dict[str, Future]) -> tuple[list[str], dict[str, str]]:
     symbols = []
+    streamer_to_normal_symbols = {}
+    for option in expirations:
+        underlying_symbol = futures[option.underlying_symbol]
+        symbols.append(underlying_symbol.streamer_symbol)
+        for strike in option.strikes:
+            symbols.append(strike.call_streamer_symbol)
+            symbols.append(strike.put_streamer_symbol)
+            streamer_to_normal_symbols[strike.call_streamer_symbol] = \
+                underlying_symbol.streamer_symbol
+            streamer_to_normal_symbols[strike.put_streamer_symbol] = \
+                underlying_symbol.streamer_symbol
+    return symbols, streamer_to_normal_symbols
+
+
+def _symbol_cache_path(underlying_symbols: list[str]) -> str:
+    # the cache is only valid for the same day and the same underlyings
+    key = zlib.crc32(','.join(sorted(underlying_symbols)).encode())
+    return os.path.join(SYMBOL_CACHE_DIR,
+                        f'universe-{date.today().isoformat()}-{key:08x}.json')
+
+
+def create_symbol_list_earlier_expirations(underlying_symbols: list[str]) \
+        -> tuple[list[str | None], dict[str | None, str | None]]:
+    cache_path = _symbol_cache_path(underlying_symbols)
+    if os.path.isfile(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            return cached['symbols'], cached['symbol_map']
+        except (json.JSONDecodeError, KeyError):
+            # a damaged cache is treated as missing and fetched again
+            pass
+
     session = ApplicationSession().session
-    for symbol in underlying_symbols:
-        if not symbol.startswith('/'):
-            # Get option chain for equity options
-            option_chain = get_option_chain(session, symbol)
-            for expiration, options in option_chain.items():
-                dte = (expiration - date.today()).days
-                if dte > MAX_DTE:
-                    continue
-                for option in options:
-                    equity_option_symbols.append(symbol)
-                    equity_option_symbols.append(option.streamer_symbol)
-                    streamer_to_normal_symbols[option.streamer_symbol] = symbol
-        elif symbol.startswith('/'):
-            # Get option chain for future options
-            option_chain = sorted(NestedFutureOptionChain
-                                  .get_chain(session, symbol)
-                                  .option_chains[0].expirations,
-                                  key=lambda x: x.expiration_date)
-            filtered_option_chain = [obj for obj in option_chain
-                                     if (obj.expiration_date
-                                         - date.today()).days <= MAX_DTE]
-            for option in filtered_option_chain:
-                underlying_symbol = Future.get_future(session,
-                                                      option.underlying_symbol)
-                future_option_symbols.append(underlying_symbol.streamer_symbol)
-                for strike in option.strikes:
-                    future_option_symbols.append(strike.call_streamer_symbol)
-                    future_option_symbols.append(strike.put_streamer_symbol)
-                    streamer_to_normal_symbols[strike.call_streamer_symbol] = \
-                        underlying_symbol.streamer_symbol
-                    streamer_to_normal_symbols[strike.put_streamer_symbol] = \
-                        underlying_symbol.streamer_symbol
-    return list(set(equity_option_symbols + future_option_symbols)), \
-        streamer_to_normal_symbols
+    equities = [s for s in underlying_symbols if not s.startswith('/')]
+    futures = [s for s in underlying_symbols if s.startswith('/')]
+    symbols: set[str] = set()
+    streamer_to_normal_symbols = {}
+    with ThreadPoolExecutor(max_workers=CHAIN_WORKERS) as executor:
+        # all chains are fetched concurrently
+        equity_results = executor.map(
+            lambda symbol: _equity_option_symbols(session, symbol), equities)
+        expirations = list(executor.map(
+            lambda symbol: _future_option_expirations(session, symbol),
+            futures))
+        # each underlying future is only looked up once
+        future_symbols = {option.underlying_symbol
+                          for chain in expirations for option in chain}
+        future_lookup = dict(zip(future_symbols, executor.map(
+            lambda symbol: Future.get_future(session, symbol),
+            future_symbols)))
+        results = list(equity_results) + [
+            _future_option_symbols(chain, future_lookup)
+            for chain in expirations]
+    for chain_symbols, chain_map in results:
+        symbols.update(chain_symbols)
+        streamer_to_normal_symbols.update(chain_map)
+
+    os.makedirs(SYMBOL_CACHE_DIR, exist_ok=True)
+    # write a temporary file and rename it over the cache, so a crash never
+    # leaves a half-written cache behind
+    temporary = f'{cache_path}.{os.getpid()}.tmp'
+    with open(temporary, 'w') as f:
+        json.dump({'symbols': sorted(symbols),
+                   'symbol_map': streamer_to_normal_symbols}, f)
+    os.replace(temporary, cache_path)
+    return list(symbols), streamer_to_normal_symbols
 
 
 def store_symbol_map(symbol_map: dict[str, str]) -> None:
@@ -101,19 +168,10 @@ def main():
         'GOOGL', 'TSLA',
         'NVDA', 'META'])
     store_symbol_map(symbol_map)
-    MAX_SIZE = 1000
     market_data = MarketData()
     market_data.start_streamer()
-    for x in range(0, len(streamer_symbols), MAX_SIZE):
-        if x + MAX_SIZE > len(streamer_symbols):
-            x = len(streamer_symbols)
-        market_data.subscribe_trades(streamer_symbols[x:x + MAX_SIZE])
-        time.sleep(5)
-    for x in range(0, len(streamer_symbols), MAX_SIZE):
-        if x + MAX_SIZE > len(streamer_symbols):
-            x = len(streamer_symbols)
-        market_data.subscribe_greeks(streamer_symbols[x:x + MAX_SIZE])
-        time.sleep(5)
+    market_data.subscribe({EventType.TRADE: streamer_symbols,
+                           EventType.GREEKS: streamer_symbols}, timeout=60)
     while True:
         time.sleep(1000)
 
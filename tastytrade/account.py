@@ -1,8 +1,7 @@
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-import requests
 from pydantic import BaseModel
 
 from tastytrade.order import (InstrumentType, NewComplexOrder, NewOrder,
@@ -10,7 +9,8 @@ from tastytrade.order import (InstrumentType, NewComplexOrder, NewOrder,
                               PlacedOrderResponse, PriceEffect)
 from tastytrade.session import ProductionSession, Session
 from tastytrade.utils import (TastytradeError, TastytradeJsonDataclass,
-                              today_in_new_york, validate_response)
+                              build_params, fetch_pages, today_in_new_york,
+                              validate_response)
 
 
 class EmptyDict(BaseModel):
@@ -413,7 +413,37 @@ class Account(TastytradeJsonDataclass):
         :return: a list of :class:`Account` objects.
         """
 
-        response = requests.get(
+        response = session.client.get(
+            f'{session.base_url}/customers/me/accounts',
+            headers=session.headers
+        )
+        validate_response(response)  # throws exception if not 200
+
+        accounts = []
+        data = response.json()['data']['items']
+        for entry in data:
+            account = entry['account']
+            if not include_closed and account['is-closed']:
+                continue
+            accounts.append(cls(**account))
+
+        return accounts
+
+    @classmethod
+    async def a_get_accounts(
+        cls,
+        session: Session,
+        include_closed=False
+    ) -> List['Account']:
+        """
+        Gets all trading accounts from the Tastyworks platform. By default
+        excludes closed accounts from the results.
+
+        :param session: the session to use for the request.
+
+        :return: a list of :class:`Account` objects.
+        """
+        response = await session.async_client.get(
             f'{session.base_url}/customers/me/accounts',
             headers=session.headers
         )
@@ -439,7 +469,30 @@ class Account(TastytradeJsonDataclass):
 
         :return: :class:`Account` object corresponding to the given ID.
         """
-        response = requests.get(
+        response = session.client.get(
+            f'{session.base_url}/customers/me/accounts/{account_number}',
+            headers=session.headers
+        )
+        validate_response(response)  # throws exception if not 200
+
+        account = response.json()['data']
+        return cls(**account)
+
+    @classmethod
+    async def a_get_account(
+        cls,
+        session: Session,
+        account_number: str
+    ) -> 'Account':
+        """
+        Returns a new :class:`Account` object for the given account ID.
+
+        :param session: the session to use for the request.
+        :param account_number: the account ID to get.
+
+        :return: :class:`Account` object corresponding to the given ID.
+        """
+        response = await session.async_client.get(
             f'{session.base_url}/customers/me/accounts/{account_number}',
             headers=session.headers
         )
@@ -456,7 +509,26 @@ class Account(TastytradeJsonDataclass):
 
         :return: a Tastytrade 'TradingStatus' object in JSON format.
         """
-        response = requests.get(
+        response = session.client.get(
+            (f'{session.base_url}/accounts/{self.account_number}/'
+             'trading-status'),
+            headers=session.headers
+        )
+        validate_response(response)  # throws exception if not 200
+
+        data = response.json()['data']
+
+        return TradingStatus(**data)
+
+    async def a_get_trading_status(self, session: Session) -> TradingStatus:
+        """
+        Get the trading status of the account.
+
+        :param session: the session to use for the request.
+
+        :return: a Tastytrade 'TradingStatus' object in JSON format.
+        """
+        response = await session.async_client.get(
             (f'{session.base_url}/accounts/{self.account_number}/'
              'trading-status'),
             headers=session.headers
@@ -475,7 +547,25 @@ class Account(TastytradeJsonDataclass):
 
         :return: a Tastytrade 'AccountBalance' object in JSON format.
         """
-        response = requests.get(
+        response = session.client.get(
+            f'{session.base_url}/accounts/{self.account_number}/balances',
+            headers=session.headers
+        )
+        validate_response(response)  # throws exception if not 200
+
+        data = response.json()['data']
+
+        return AccountBalance(**data)
+
+    async def a_get_balances(self, session: Session) -> AccountBalance:
+        """
+        Get the current balances of the account.
+
+        :param session: the session to use for the request.
+
+        :return: a Tastytrade 'AccountBalance' object in JSON format.
+        """
+        response = await session.async_client.get(
             f'{session.base_url}/accounts/{self.account_number}/balances',
             headers=session.headers
         )
@@ -512,7 +602,7 @@ class Account(TastytradeJsonDataclass):
             'time-of-day': time_of_day
         }
 
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/accounts/{self.account_number}/balance-'
              'snapshots'),
             headers=session.headers,
@@ -565,10 +655,62 @@ class Account(TastytradeJsonDataclass):
             'net-positions': net_positions,
             'include-marks': include_marks
         }
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/accounts/{self.account_number}/positions',
             headers=session.headers,
-            params={k: v for k, v in params.items() if v is not None}
+            params=build_params(params)
+        )
+        validate_response(response)  # throws exception if not 200
+
+        data = response.json()['data']['items']
+
+        return [CurrentPosition(**entry) for entry in data]
+
+    async def a_get_positions(
+        self,
+        session: Session,
+        underlying_symbols: Optional[List[str]] = None,
+        symbol: Optional[str] = None,
+        instrument_type: Optional[InstrumentType] = None,
+        include_closed: bool = False,
+        underlying_product_code: Optional[str] = None,
+        partition_keys: Optional[List[str]] = None,
+        net_positions: bool = False,
+        include_marks: bool = False
+    ) -> List[CurrentPosition]:
+        """
+        Get the current positions of the account.
+
+        :param session: the session to use for the request.
+        :param underlying_symbols:
+            an array of underlying symbols for positions.
+        :param symbol: a single symbol.
+        :param instrument_type: the type of instrument.
+        :param include_closed:
+            if closed positions should be included in the query.
+        :param underlying_product_code: the underlying future's product code.
+        :param partition_keys: account partition keys.
+        :param net_positions:
+            returns net positions grouped by instrument type and symbol.
+        :param include_marks:
+            include current quote mark (note: can decrease performance).
+
+        :return: a list of Tastytrade 'CurrentPosition' objects in JSON format.
+        """
+        params: Dict[str, Any] = {
+            'underlying-symbol[]': underlying_symbols,
+            'symbol': symbol,
+            'instrument-type': instrument_type,
+            'include-closed-positions': include_closed,
+            'underlying-product-code': underlying_product_code,
+            'partition-keys[]': partition_keys,
+            'net-positions': net_positions,
+            'include-marks': include_marks
+        }
+        response = await session.async_client.get(
+            f'{session.base_url}/accounts/{self.account_number}/positions',
+            headers=session.headers,
+            params=build_params(params)
         )
         validate_response(response)  # throws exception if not 200
 
@@ -594,7 +736,8 @@ class Account(TastytradeJsonDataclass):
         partition_key: Optional[str] = None,
         futures_symbol: Optional[str] = None,
         start_at: Optional[datetime] = None,
-        end_at: Optional[datetime] = None
+        end_at: Optional[datetime] = None,
+        max_workers: int = 1
     ) -> List[Transaction]:
         """
         Get transaction history of the account.
@@ -621,9 +764,86 @@ class Account(TastytradeJsonDataclass):
             datetime start range for filtering transactions in full date-time.
         :param end_at:
             datetime end range for filtering transactions in full date-time.
+        :param max_workers:
+            the number of pages to download concurrently once the total
+            number of pages is known.
 
         :return: a list of Tastytrade 'Transaction' objects in JSON format.
         """
+        return list(self.iter_history(
+            session,
+            per_page=per_page,
+            page_offset=page_offset,
+            sort=sort,
+            type=type,
+            types=types,
+            sub_types=sub_types,
+            start_date=start_date,
+            end_date=end_date,
+            instrument_type=instrument_type,
+            symbol=symbol,
+            underlying_symbol=underlying_symbol,
+            action=action,
+            partition_key=partition_key,
+            futures_symbol=futures_symbol,
+            start_at=start_at,
+            end_at=end_at,
+            max_workers=max_workers
+        ))
+
+    def iter_history(
+        self,
+        session: Session,
+        per_page: int = 250,
+        page_offset: Optional[int] = None,
+        sort: str = 'Desc',
+        type: Optional[str] = None,
+        types: Optional[List[str]] = None,
+        sub_types: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: date = today_in_new_york(),
+        instrument_type: Optional[InstrumentType] = None,
+        symbol: Optional[str] = None,
+        underlying_symbol: Optional[str] = None,
+        action: Optional[str] = None,
+        partition_key: Optional[str] = None,
+        futures_symbol: Optional[str] = None,
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+        max_workers: int = 1
+    ) -> Iterator[Transaction]:
+        """
+        Iterate over the transaction history of the account, yielding
+        transactions as soon as the page holding them has been downloaded.
+
+        :param session: the session to use for the request.
+        :param per_page: the number of results to return per page.
+        :param page_offset:
+            provide a specific page to get; if not provided, get all pages
+        :param sort: the order to sort results in, either 'Desc' or 'Asc'.
+        :param type: the type of transaction.
+        :param types: a list of transaction types to filter by.
+        :param sub_types: an array of transaction subtypes to filter by.
+        :param start_date: the start date of transactions to query.
+        :param end_date: the end date of transactions to query.
+        :param instrument_type: the type of instrument.
+        :param symbol: a single symbol.
+        :param underlying_symbol: the underlying symbol.
+        :param action:
+            the action of the transaction: 'Sell to Open', 'Sell to Close',
+            'Buy to Open', 'Buy to Close', 'Sell' or 'Buy'.
+        :param partition_key: account partition key.
+        :param futures_symbol: the full TW Future Symbol, e.g. /ESZ9, /NGZ19.
+        :param start_at:
+            datetime start range for filtering transactions in full date-time.
+        :param end_at:
+            datetime end range for filtering transactions in full date-time.
+        :param max_workers:
+            the number of pages to download concurrently once the total
+            number of pages is known.
+
+        :return: a generator of Tastytrade 'Transaction' objects.
+        """
         # if a specific page is provided, we just get that page;
         # otherwise, we loop through all pages
         paginate = False
@@ -649,28 +869,18 @@ class Account(TastytradeJsonDataclass):
             'end-at': end_at
         }
 
-        # loop through pages and get all transactions
-        results = []
-        while True:
-            response = requests.get(
-                (f'{session.base_url}/accounts/{self.account_number}/'
-                 'transactions'),
-                headers=session.headers,
-                params={k: v for k, v in params.items() if v is not None}
-            )
-            validate_response(response)
-
-            json = response.json()
-            results.extend(json['data']['items'])
-
-            pagination = json['pagination']
-            if pagination['page-offset'] >= pagination['total-pages'] - 1:
-                break
-            if not paginate:
-                break
-            params['page-offset'] += 1  # type: ignore
-
-        return [Transaction(**entry) for entry in results]
+        pages = fetch_pages(
+            session.client,
+            (f'{session.base_url}/accounts/{self.account_number}/'
+             'transactions'),
+            session.headers,
+            params,
+            paginate,
+            max_workers
+        )
+        for page in pages:
+            for entry in page:
+                yield Transaction(**entry)
 
     def get_transaction(
         self,
@@ -685,7 +895,7 @@ class Account(TastytradeJsonDataclass):
 
         :return: a Tastytrade 'Transaction' object in JSON format.
         """
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/accounts/{self.account_number}/transactions'
              f'/{id}'),
             headers=session.headers
@@ -710,7 +920,7 @@ class Account(TastytradeJsonDataclass):
         :return: a dict containing the total fees and the price effect.
         """
         params: Dict[str, Any] = {'date': date}
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/accounts/{self.account_number}/transactions/'
              'total-fees'),
             headers=session.headers,
@@ -752,7 +962,7 @@ class Account(TastytradeJsonDataclass):
         else:
             params = {'time-back': time_back}
 
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/accounts/{self.account_number}/net-liq/'
              'history'),
             headers=session.headers,
@@ -772,7 +982,7 @@ class Account(TastytradeJsonDataclass):
 
         :return: a Tastytrade 'PositionLimit' object in JSON format.
         """
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/accounts/{self.account_number}/position-'
              'limit'),
             headers=session.headers
@@ -799,7 +1009,7 @@ class Account(TastytradeJsonDataclass):
         """
         if symbol:
             symbol = symbol.replace('/', '%2F')
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/accounts/{self.account_number}/margin-'
              f'requirements/{symbol}/effective'),
             headers=session.headers
@@ -819,7 +1029,7 @@ class Account(TastytradeJsonDataclass):
 
         :return: a :class:`MarginReport` object.
         """
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/margin/accounts/{self.account_number}/'
              'requirements'),
             headers=session.headers
@@ -838,7 +1048,25 @@ class Account(TastytradeJsonDataclass):
 
         :return: a list of :class:`Order` objects.
         """
-        response = requests.get(
+        response = session.client.get(
+            f'{session.base_url}/accounts/{self.account_number}/orders/live',
+            headers=session.headers
+        )
+        validate_response(response)
+
+        data = response.json()['data']['items']
+
+        return [PlacedOrder(**entry) for entry in data]
+
+    async def a_get_live_orders(self, session: Session) -> List[PlacedOrder]:
+        """
+        Get all live orders for the account.
+
+        :param session: the session to use for the request.
+
+        :return: a list of :class:`Order` objects.
+        """
+        response = await session.async_client.get(
             f'{session.base_url}/accounts/{self.account_number}/orders/live',
             headers=session.headers
         )
@@ -861,7 +1089,7 @@ class Account(TastytradeJsonDataclass):
         :return:
             a :class:`PlacedComplexOrder` object corresponding to the given ID
         """
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/accounts/{self.account_number}/complex-'
              f'orders/{order_id}'),
             headers=session.headers
@@ -880,7 +1108,7 @@ class Account(TastytradeJsonDataclass):
 
         :return: a :class:`PlacedOrder` object corresponding to the given ID
         """
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/accounts/{self.account_number}/orders'
              f'/{order_id}'),
             headers=session.headers
@@ -898,7 +1126,7 @@ class Account(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         :param order_id: the ID of the order to delete.
         """
-        response = requests.delete(
+        response = session.client.delete(
             (f'{session.base_url}/accounts/{self.account_number}/complex-'
              f'orders/{order_id}'),
             headers=session.headers
@@ -912,7 +1140,7 @@ class Account(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         :param order_id: the ID of the order to delete.
         """
-        response = requests.delete(
+        response = session.client.delete(
             (f'{session.base_url}/accounts/{self.account_number}/orders'
              f'/{order_id}'),
             headers=session.headers
@@ -932,7 +1160,8 @@ class Account(TastytradeJsonDataclass):
         underlying_instrument_type: Optional[InstrumentType] = None,
         sort: str = 'Desc',
         start_at: Optional[datetime] = None,
-        end_at: Optional[datetime] = None
+        end_at: Optional[datetime] = None,
+        max_workers: int = 1
     ) -> List[PlacedOrder]:
         """
         Get order history of the account.
@@ -953,9 +1182,70 @@ class Account(TastytradeJsonDataclass):
             datetime start range for filtering transactions in full date-time.
         :param end_at:
             datetime end range for filtering transactions in full date-time.
+        :param max_workers:
+            the number of pages to download concurrently once the total
+            number of pages is known.
 
         :return: a list of Tastytrade 'Transaction' objects in JSON format.
         """
+        return list(self.iter_order_history(
+            session,
+            per_page=per_page,
+            page_offset=page_offset,
+            start_date=start_date,
+            end_date=end_date,
+            underlying_symbol=underlying_symbol,
+            statuses=statuses,
+            futures_symbol=futures_symbol,
+            underlying_instrument_type=underlying_instrument_type,
+            sort=sort,
+            start_at=start_at,
+            end_at=end_at,
+            max_workers=max_workers
+        ))
+
+    def iter_order_history(
+        self,
+        session: Session,
+        per_page: int = 50,
+        page_offset: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        underlying_symbol: Optional[str] = None,
+        statuses: Optional[List[OrderStatus]] = None,
+        futures_symbol: Optional[str] = None,
+        underlying_instrument_type: Optional[InstrumentType] = None,
+        sort: str = 'Desc',
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+        max_workers: int = 1
+    ) -> Iterator[PlacedOrder]:
+        """
+        Iterate over the order history of the account, yielding orders as
+        soon as the page holding them has been downloaded.
+
+        :param session: the session to use for the request.
+        :param per_page: the number of results to return per page.
+        :param page_offset:
+            provide a specific page to get; if not provided, get all pages
+        :param start_date: the start date of orders to query.
+        :param end_date: the end date of orders to query.
+        :param underlying_symbol: underlying symbol to filter by.
+        :param statuses: a list of statuses to filter by.
+        :param futures_symbol:
+            Tastytrade future symbol for futures and future options.
+        :param underlying_instrument_type: the type of instrument to filter by
+        :param sort: the order to sort results in, either 'Desc' or 'Asc'.
+        :param start_at:
+            datetime start range for filtering transactions in full date-time.
+        :param end_at:
+            datetime end range for filtering transactions in full date-time.
+        :param max_workers:
+            the number of pages to download concurrently once the total
+            number of pages is known.
+
+        :return: a generator of Tastytrade 'PlacedOrder' objects.
+        """
         # if a specific page is provided, we just get that page;
         # otherwise, we loop through all pages
         paginate = False
@@ -976,27 +1266,17 @@ class Account(TastytradeJsonDataclass):
             'end-at': end_at
         }
 
-        # loop through pages and get all transactions
-        results = []
-        while True:
-            response = requests.get(
-                f'{session.base_url}/accounts/{self.account_number}/orders',
-                headers=session.headers,
-                params={k: v for k, v in params.items() if v is not None}
-            )
-            validate_response(response)
-
-            json = response.json()
-            results.extend(json['data']['items'])
-
-            pagination = json['pagination']
-            if pagination['page-offset'] >= pagination['total-pages'] - 1:
-                break
-            if not paginate:
-                break
-            params['page-offset'] += 1  # type: ignore
-
-        return [PlacedOrder(**entry) for entry in results]
+        pages = fetch_pages(
+            session.client,
+            f'{session.base_url}/accounts/{self.account_number}/orders',
+            session.headers,
+            params,
+            paginate,
+            max_workers
+        )
+        for page in pages:
+            for entry in page:
+                yield PlacedOrder(**entry)
 
     def place_order(
         self,
@@ -1026,7 +1306,7 @@ class Account(TastytradeJsonDataclass):
         headers['Content-Type'] = 'application/json'
         json = order.model_dump_json(exclude_none=True, by_alias=True)
 
-        response = requests.post(url, headers=session.headers, data=json)
+        response = session.client.post(url, headers=session.headers, data=json)
         # sometimes we just want to see BP usage for an invalid trade
         if raise_errors:
             validate_response(response)
@@ -1059,7 +1339,7 @@ class Account(TastytradeJsonDataclass):
         headers['Content-Type'] = 'application/json'
         json = order.model_dump_json(exclude_none=True, by_alias=True)
 
-        response = requests.post(url, headers=session.headers, data=json)
+        response = session.client.post(url, headers=session.headers, data=json)
         validate_response(response)
 
         data = response.json()['data']
@@ -1085,7 +1365,7 @@ class Account(TastytradeJsonDataclass):
         headers = session.headers
         # required because we're passing the JSON as a string
         headers['Content-Type'] = 'application/json'
-        response = requests.put(
+        response = session.client.put(
             (f'{session.base_url}/accounts/{self.account_number}/orders'
              f'/{old_order_id}'),
             headers=headers,
@@ -0,0 +1,98 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from tastytrade.utils import TastytradeError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover
+    simdjson = None  # type: ignore
+
+
+class JsonCodec:
+    """
+    Encodes and decodes the JSON messages exchanged with the streamers.
+
+    Every codec decodes `str` or `bytes` and encodes to `str`, since the
+    websocket protocols used here expect text frames. The default codec is
+    the standard library's :mod:`json`; see :func:`get_codec` for the
+    faster backends.
+
+    :param name: the name the codec is registered under
+    :param loads: function decoding a JSON document
+    :param dumps: function encoding an object to a JSON string
+    """
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[str, bytes]], Any],
+        dumps: Callable[[Any], str]
+    ):
+        #: the name the codec is registered under
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f'JsonCodec({self.name!r})'
+
+
+def _orjson_dumps(obj: Any) -> str:
+    # orjson produces bytes, but the messages are sent as text frames
+    return orjson.dumps(obj).decode()
+
+
+def _compact_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(',', ':'))
+
+
+_CODECS: Dict[str, JsonCodec] = {
+    'json': JsonCodec('json', json.loads, json.dumps)
+}
+if orjson is not None:
+    _CODECS['orjson'] = JsonCodec('orjson', orjson.loads, _orjson_dumps)
+if simdjson is not None:
+    # simdjson only parses, so encoding falls back to the standard library
+    _CODECS['simdjson'] = JsonCodec('simdjson', simdjson.loads,
+                                    _compact_dumps)
+
+#: codec used when none is given explicitly
+DEFAULT_CODEC = _CODECS['json']
+# fastest first, used for `get_codec('auto')`
+_PREFERENCE = ['orjson', 'simdjson', 'json']
+
+
+def available_codecs() -> List[str]:
+    """
+    Returns the names of the codecs whose backend is installed.
+    """
+    return list(_CODECS)
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """
+    Looks up a JSON codec.
+
+    :param codec:
+        'json', 'orjson' or 'simdjson' to pick a backend, 'auto' for the
+        fastest installed one, None for :data:`DEFAULT_CODEC`, or a
+        :class:`JsonCodec` which is returned as is
+
+    :return: the codec
+    """
+    if codec is None:
+        return DEFAULT_CODEC
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == 'auto':
+        return next(_CODECS[name] for name in _PREFERENCE if name in _CODECS)
+    found: Optional[JsonCodec] = _CODECS.get(codec)
+    if found is None:
+        raise TastytradeError(f'JSON codec {codec!r} is not available, '
+                              f'choose one of {available_codecs()}')
+    return found
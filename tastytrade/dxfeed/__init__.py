@@ -1,8 +1,11 @@
 from .candle import Candle
-from .event import Event, EventType
+from .event import Event, EventBatch, EventType
 from .greeks import Greeks
 from .profile import Profile
 from .quote import Quote
+from .record import (CandleRecord, EventRecord, GreeksRecord, ProfileRecord,
+                     QuoteRecord, SummaryRecord, TheoPriceRecord,
+                     TimeAndSaleRecord, TradeRecord, UnderlyingRecord)
 from .summary import Summary
 from .theoprice import TheoPrice
 from .timeandsale import TimeAndSale
@@ -11,14 +14,25 @@ from .underlying import Underlying
 
 __all__ = [
     'Candle',
+    'CandleRecord',
     'Event',
+    'EventBatch',
+    'EventRecord',
     'EventType',
     'Greeks',
+    'GreeksRecord',
     'Profile',
+    'ProfileRecord',
     'Quote',
+    'QuoteRecord',
     'Summary',
+    'SummaryRecord',
     'TheoPrice',
+    'TheoPriceRecord',
     'TimeAndSale',
+    'TimeAndSaleRecord',
     'Trade',
-    'Underlying'
+    'TradeRecord',
+    'Underlying',
+    'UnderlyingRecord'
 ]
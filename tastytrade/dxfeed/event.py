@@ -1,10 +1,16 @@
+from decimal import Decimal
 from enum import Enum
-from typing import List
+from typing import (Any, Dict, Iterator, List, Optional, Sequence, Type,
+                    Union, get_args, get_origin)
 
+import numpy as np
 from pydantic import BaseModel, validator
 
 from tastytrade.utils import TastytradeError
 
+#: raw values the streamer sends for missing numeric data
+MISSING_VALUES = ('NaN', 'Infinity')
+
 
 class EventType(str, Enum):
     """
@@ -27,33 +33,179 @@ class EventType(str, Enum):
     UNDERLYING = 'Underlying'
 
 
+def _base_type(annotation: Any) -> Any:
+    """
+    Strips the `Optional` wrapper from a field annotation.
+    """
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        return args[0] if args else type(None)
+    return annotation
+
+
+def _rows_from_stream(data: list, size: int) -> np.ndarray:
+    """
+    Reshapes a flat COMPACT list into a 2D object array, one row per event.
+    """
+    if size == 0 or len(data) % size != 0:
+        msg = 'Mapper data input values are not a multiple of the key size'
+        raise TastytradeError(msg)
+    flat = np.empty(len(data), dtype=object)
+    flat[:] = data
+    return flat.reshape(-1, size)
+
+
 class Event(BaseModel):
     @validator('*', pre=True)
     def change_nan_to_none(cls, v):
-        if v == 'NaN' or v == 'Infinity':
+        if v in MISSING_VALUES:
             return None
         return v
 
     @classmethod
-    def from_stream(cls, data: list) -> List['Event']:  # pragma: no cover
+    def field_types(cls) -> Dict[str, Any]:
+        """
+        Returns the type of each field of the event, in stream order, with
+        `Optional` stripped. Used by the decoders that bypass pydantic.
+        """
+        return {name: _base_type(field.annotation)
+                for name, field in cls.model_fields.items()}
+
+    @classmethod
+    def from_stream(
+        cls,
+        data: list,
+        fields: Optional[Sequence[str]] = None
+    ) -> List['Event']:  # pragma: no cover
         """
         Makes a list of event objects from a list of raw trade data fetched by
         a :class:`~tastyworks.streamer.DXFeedStreamer`.
 
         :param data: list of raw quote data from streamer
+        :param fields:
+            the field order used by the feed, defaults to the model's fields
 
         :return: list of event objects from data
         """
         objs = []
-        size = len(cls.model_fields)
+        keys = list(fields or cls.model_fields.keys())
+        size = len(keys)
         multiples = len(data) / size
         if not multiples.is_integer():
             msg = 'Mapper data input values are not a multiple of the key size'
             raise TastytradeError(msg)
-        keys = cls.model_fields.keys()
         for i in range(int(multiples)):
             offset = i * size
             local_values = data[offset:(i + 1) * size]
             event_dict = dict(zip(keys, local_values))
             objs.append(cls(**event_dict))
         return objs
+
+    @classmethod
+    def from_stream_columnar(
+        cls,
+        data: list,
+        fields: Optional[Sequence[str]] = None
+    ) -> 'EventBatch':
+        """
+        Makes a column-oriented :class:`EventBatch` from a list of raw data
+        fetched by a :class:`~tastyworks.streamer.DXLinkStreamer`. No event
+        objects are built until they are accessed.
+
+        :param data: list of raw quote data from streamer
+        :param fields:
+            the field order used by the feed, defaults to the model's fields
+
+        :return: a batch containing every event in data
+        """
+        keys = list(fields or cls.model_fields.keys())
+        return EventBatch(cls, keys, _rows_from_stream(data, len(keys)))
+
+
+class EventBatch:
+    """
+    All events of a single FEED_DATA message, stored column by column.
+
+    Each column is decoded in one pass the first time it is requested:
+    numeric fields become NumPy arrays with missing values mapped to `nan`,
+    and other fields are kept as object arrays with missing values mapped to
+    None. Indexing or iterating the batch builds the pydantic events lazily
+    and caches them.
+
+    Example usage::
+
+        batch = Greeks.from_stream_columnar(data)
+        deltas = batch.column('delta')
+        first = batch[0]  # a regular :class:`Greeks` object
+    """
+    def __init__(
+        self,
+        event_class: Type[Event],
+        fields: List[str],
+        rows: np.ndarray
+    ):
+        #: the event class the rows belong to
+        self.event_class = event_class
+        #: the field names, in stream order
+        self.fields = fields
+        self._index = {name: i for i, name in enumerate(fields)}
+        self._rows = rows
+        self._types = event_class.field_types()
+        self._columns: Dict[str, np.ndarray] = {}
+        self._events: List[Optional[Event]] = [None] * len(rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index: int) -> Event:
+        event = self._events[index]
+        if event is None:
+            event = self.event_class(**dict(zip(self.fields,
+                                                self._rows[index])))
+            self._events[index] = event
+        return event
+
+    def __iter__(self) -> Iterator[Event]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return (f'EventBatch({self.event_class.__name__}, '
+                f'{len(self)} events)')
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Returns all values of the given field as a NumPy array.
+
+        :param name: the field to get values for
+        """
+        column = self._columns.get(name)
+        if column is None:
+            if name not in self._index:
+                raise TastytradeError(f'Field not in batch: {name}')
+            column = self._decode(self._rows[:, self._index[name]],
+                                  self._types.get(name))
+            self._columns[name] = column
+        return column
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Returns every field of the batch decoded as a NumPy array.
+        """
+        return {name: self.column(name) for name in self.fields}
+
+    @staticmethod
+    def _decode(values: np.ndarray, kind: Any) -> np.ndarray:
+        missing = np.isin(values, MISSING_VALUES) | np.equal(values, None)
+        has_missing = bool(missing.any())
+        if kind is Decimal or (kind is int and has_missing):
+            column = np.full(len(values), np.nan)
+            column[~missing] = values[~missing].astype(np.float64)
+            return column
+        if kind is int:
+            return values.astype(np.int64)
+        if kind is bool and not has_missing:
+            return values.astype(np.bool_)
+        column = values.copy()
+        column[missing] = None
+        return column
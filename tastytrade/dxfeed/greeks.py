@@ -1,4 +1,5 @@
 from decimal import Decimal
+from typing import Optional
 
 from .event import Event
 
@@ -15,26 +16,26 @@ class Greeks(Event):
     #: symbol of this event
     eventSymbol: str
     #: time of this event
-    eventTime: int
+    eventTime: Optional[int] = None
     #: transactional event flags
-    eventFlags: int
+    eventFlags: Optional[int] = None
     #: unique per-symbol index of this event
-    index: int
+    index: Optional[int] = None
     #: timestamp of this event in milliseconds
-    time: int
+    time: Optional[int] = None
     #: sequence number to distinguish events that have the same time
-    sequence: int
+    sequence: Optional[int] = None
     #: option market price
-    price: Decimal
+    price: Optional[Decimal] = None
     #: Black-Scholes implied volatility of the option
-    volatility: Decimal
+    volatility: Optional[Decimal] = None
     #: option delta
-    delta: Decimal
+    delta: Optional[Decimal] = None
     #: option gamma
-    gamma: Decimal
+    gamma: Optional[Decimal] = None
     #: option theta
-    theta: Decimal
+    theta: Optional[Decimal] = None
     #: option rho
-    rho: Decimal
+    rho: Optional[Decimal] = None
     #: option vega
-    vega: Decimal
+    vega: Optional[Decimal] = None
@@ -0,0 +1,236 @@
+from decimal import Decimal
+from typing import (Any, Callable, ClassVar, Dict, List, Optional, Sequence,
+                    Tuple, Type)
+
+from tastytrade.utils import TastytradeError
+
+from .candle import Candle
+from .event import MISSING_VALUES, Event
+from .greeks import Greeks
+from .profile import Profile
+from .quote import Quote
+from .summary import Summary
+from .theoprice import TheoPrice
+from .timeandsale import TimeAndSale
+from .trade import Trade
+from .underlying import Underlying
+
+
+def _converter(kind: Any) -> Optional[Callable[[Any], Any]]:
+    if kind is Decimal:
+        return float
+    if kind is int:
+        return int
+    return None
+
+
+class EventRecord:
+    """
+    A lightweight, slots-based counterpart of an :class:`Event`. Records
+    skip pydantic validation entirely and store prices as floats, so they
+    are much cheaper to build and hold than the models they mirror. Missing
+    values are None, just like on the models.
+
+    Use :meth:`to_event` to get the :class:`Event` (with its `Decimal`
+    fields) when exact arithmetic is needed.
+    """
+    __slots__: Tuple[str, ...] = ()
+    #: the pydantic event class this record mirrors
+    event_class: ClassVar[Type[Event]]
+    _converters: ClassVar[Dict[str, Optional[Callable[[Any], Any]]]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        types = cls.event_class.field_types()
+        cls._converters = {name: _converter(types[name])
+                           for name in cls.__slots__}
+
+    def __init__(self, **kwargs):
+        for name in self.__slots__:
+            setattr(self, name, kwargs.get(name))
+
+    def __repr__(self) -> str:
+        values = ' '.join(f'{name}={getattr(self, name)!r}'
+                          for name in self.__slots__)
+        return f'{type(self).__name__}({values})'
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self.__slots__)
+
+    @classmethod
+    def from_stream(
+        cls,
+        data: list,
+        fields: Optional[Sequence[str]] = None
+    ) -> List['EventRecord']:
+        """
+        Makes a list of records from a list of raw data fetched by a
+        :class:`~tastyworks.streamer.DXLinkStreamer`.
+
+        :param data: list of raw quote data from streamer
+        :param fields:
+            the field order used by the feed, defaults to the model's fields
+
+        :return: list of records from data
+        """
+        columns, absent = cls._columns(data, fields)
+        size = len(columns)
+        records = []
+        for offset in range(0, len(data), size):
+            record = cls.__new__(cls)
+            for (name, convert), value in zip(columns,
+                                              data[offset:offset + size]):
+                if value is None or value in MISSING_VALUES:
+                    value = None
+                elif convert is not None:
+                    value = convert(value)
+                setattr(record, name, value)
+            for name in absent:
+                setattr(record, name, None)
+            records.append(record)
+        return records
+
+    @classmethod
+    def dicts_from_stream(
+        cls,
+        data: list,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Like :meth:`from_stream`, but returns plain dictionaries with the same
+        float/int typing, ready to be stored as BSON documents without going
+        through `Decimal`.
+
+        :param data: list of raw quote data from streamer
+        :param fields:
+            the field order used by the feed, defaults to the model's fields
+
+        :return: list of dictionaries, one per event, with every model field
+        """
+        columns, absent = cls._columns(data, fields)
+        size = len(columns)
+        missing = dict.fromkeys(absent)
+        rows = []
+        for offset in range(0, len(data), size):
+            row = {}
+            for (name, convert), value in zip(columns,
+                                              data[offset:offset + size]):
+                if value is None or value in MISSING_VALUES:
+                    value = None
+                elif convert is not None:
+                    value = convert(value)
+                row[name] = value
+            row.update(missing)
+            rows.append(row)
+        return rows
+
+    @classmethod
+    def _columns(
+        cls,
+        data: list,
+        fields: Optional[Sequence[str]]
+    ) -> Tuple[List[Tuple[str, Optional[Callable[[Any], Any]]]], List[str]]:
+        keys = list(fields or cls.__slots__)
+        size = len(keys)
+        if size == 0 or len(data) % size != 0:
+            msg = 'Mapper data input values are not a multiple of the key size'
+            raise TastytradeError(msg)
+        columns = [(name, cls._converters.get(name)) for name in keys]
+        absent = [name for name in cls.__slots__ if name not in keys]
+        return columns, absent
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Returns the fields of the record as a plain dictionary.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def decimal(self, name: str) -> Optional[Decimal]:
+        """
+        Returns a single numeric field as a `Decimal`.
+
+        :param name: the field to convert
+        """
+        value = getattr(self, name)
+        return None if value is None else Decimal(str(value))
+
+    def to_event(self) -> Event:
+        """
+        Returns the full pydantic :class:`Event` for this record.
+        """
+        return self.event_class(**self.as_dict())
+
+
+class CandleRecord(EventRecord):
+    """
+    Slots-based counterpart of :class:`Candle`.
+    """
+    __slots__ = tuple(Candle.model_fields)
+    event_class = Candle
+
+
+class GreeksRecord(EventRecord):
+    """
+    Slots-based counterpart of :class:`Greeks`.
+    """
+    __slots__ = tuple(Greeks.model_fields)
+    event_class = Greeks
+
+
+class ProfileRecord(EventRecord):
+    """
+    Slots-based counterpart of :class:`Profile`.
+    """
+    __slots__ = tuple(Profile.model_fields)
+    event_class = Profile
+
+
+class QuoteRecord(EventRecord):
+    """
+    Slots-based counterpart of :class:`Quote`.
+    """
+    __slots__ = tuple(Quote.model_fields)
+    event_class = Quote
+
+
+class SummaryRecord(EventRecord):
+    """
+    Slots-based counterpart of :class:`Summary`.
+    """
+    __slots__ = tuple(Summary.model_fields)
+    event_class = Summary
+
+
+class TheoPriceRecord(EventRecord):
+    """
+    Slots-based counterpart of :class:`TheoPrice`.
+    """
+    __slots__ = tuple(TheoPrice.model_fields)
+    event_class = TheoPrice
+
+
+class TimeAndSaleRecord(EventRecord):
+    """
+    Slots-based counterpart of :class:`TimeAndSale`.
+    """
+    __slots__ = tuple(TimeAndSale.model_fields)
+    event_class = TimeAndSale
+
+
+class TradeRecord(EventRecord):
+    """
+    Slots-based counterpart of :class:`Trade`.
+    """
+    __slots__ = tuple(Trade.model_fields)
+    event_class = Trade
+
+
+class UnderlyingRecord(EventRecord):
+    """
+    Slots-based counterpart of :class:`Underlying`.
+    """
+    __slots__ = tuple(Underlying.model_fields)
+    event_class = Underlying
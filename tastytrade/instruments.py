@@ -2,13 +2,12 @@ import re
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional
-
-import requests
+from typing import Any, Dict, Iterator, List, Optional
 
 from tastytrade.order import InstrumentType, TradeableTastytradeJsonDataclass
 from tastytrade.session import ProductionSession, Session
-from tastytrade.utils import TastytradeJsonDataclass, validate_response
+from tastytrade.utils import (TastytradeJsonDataclass, fetch_pages,
+                              validate_response)
 
 
 class OptionType(str, Enum):
@@ -197,7 +196,7 @@ class Cryptocurrency(TradeableTastytradeJsonDataclass):
         :return: a list of cryptocurrency objects.
         """
         params = {'symbol[]': symbols} if symbols else None
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/cryptocurrencies',
             headers=session.headers,
             params=params
@@ -223,7 +222,7 @@ class Cryptocurrency(TradeableTastytradeJsonDataclass):
         :return: a :class:`Cryptocurrency` object.
         """
         symbol = symbol.replace('/', '%2F')
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/cryptocurrencies/{symbol}',
             headers=session.headers,
         )
@@ -266,7 +265,8 @@ class Equity(TradeableTastytradeJsonDataclass):
         session: Session,
         per_page: int = 1000,
         page_offset: Optional[int] = None,
-        lendability: Optional[str] = None
+        lendability: Optional[str] = None,
+        max_workers: int = 1
     ) -> List['Equity']:
         """
         Returns a list of actively traded :class:`Equity` objects.
@@ -278,9 +278,46 @@ class Equity(TradeableTastytradeJsonDataclass):
         :param lendability:
             the lendability of the equities; e.g. 'Easy To Borrow',
             'Locate Required', 'Preborrow'
+        :param max_workers:
+            the number of pages to download concurrently once the total
+            number of pages is known.
 
         :return: a list of :class:`Equity` objects.
         """
+        return list(cls.iter_active_equities(
+            session,
+            per_page=per_page,
+            page_offset=page_offset,
+            lendability=lendability,
+            max_workers=max_workers
+        ))
+
+    @classmethod
+    def iter_active_equities(
+        cls,
+        session: Session,
+        per_page: int = 1000,
+        page_offset: Optional[int] = None,
+        lendability: Optional[str] = None,
+        max_workers: int = 1
+    ) -> Iterator['Equity']:
+        """
+        Iterates over actively traded :class:`Equity` objects, yielding them
+        as soon as the page holding them has been downloaded.
+
+        :param session: the session to use for the request.
+        :param per_page: the number of equities to get per page.
+        :param page_offset:
+            provide a specific page to get; if not provided, get all pages
+        :param lendability:
+            the lendability of the equities; e.g. 'Easy To Borrow',
+            'Locate Required', 'Preborrow'
+        :param max_workers:
+            the number of pages to download concurrently once the total
+            number of pages is known.
+
+        :return: a generator of :class:`Equity` objects.
+        """
         # if a specific page is provided, we just get that page;
         # otherwise, we loop through all pages
         paginate = False
@@ -293,28 +330,17 @@ class Equity(TradeableTastytradeJsonDataclass):
             'lendability': lendability
         }
 
-        # loop through pages and get all active equities
-        equities = []
-        while True:
-            response = requests.get(
-                f'{session.base_url}/instruments/equities/active',
-                headers=session.headers,
-                params=params
-            )
-            validate_response(response)
-
-            json = response.json()
-            data = json['data']['items']
-            equities.extend([cls(**entry) for entry in data])
-
-            pagination = json['pagination']
-            if pagination['page-offset'] >= pagination['total-pages'] - 1:
-                break
-            if not paginate:
-                break
-            params['page-offset'] += 1  # type: ignore
-
-        return equities
+        pages = fetch_pages(
+            session.client,
+            f'{session.base_url}/instruments/equities/active',
+            session.headers,
+            params,
+            paginate,
+            max_workers
+        )
+        for page in pages:
+            for entry in page:
+                yield cls(**entry)
 
     @classmethod
     def get_equities(
@@ -344,7 +370,7 @@ class Equity(TradeableTastytradeJsonDataclass):
             'is-index': is_index,
             'is-etf': is_etf
         }
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/equities',
             headers=session.headers,
             params={k: v for k, v in params.items() if v is not None}
@@ -366,7 +392,28 @@ class Equity(TradeableTastytradeJsonDataclass):
         :return: a :class:`Equity` object.
         """
         symbol = symbol.replace('/', '%2F')
-        response = requests.get(
+        response = session.client.get(
+            f'{session.base_url}/instruments/equities/{symbol}',
+            headers=session.headers
+        )
+        validate_response(response)
+
+        data = response.json()['data']
+
+        return cls(**data)
+
+    @classmethod
+    async def a_get_equity(cls, session: Session, symbol: str) -> 'Equity':
+        """
+        Returns a :class:`Equity` object from the given symbol.
+
+        :param session: the session to use for the request.
+        :param symbol: the symbol to get the equity for.
+
+        :return: a :class:`Equity` object.
+        """
+        symbol = symbol.replace('/', '%2F')
+        response = await session.async_client.get(
             f'{session.base_url}/instruments/equities/{symbol}',
             headers=session.headers
         )
@@ -431,7 +478,7 @@ class Option(TradeableTastytradeJsonDataclass):
             'active': active,
             'with-expired': with_expired
         }
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/equity-options',
             headers=session.headers,
             params={k: v for k, v in params.items() if v is not None}
@@ -459,7 +506,7 @@ class Option(TradeableTastytradeJsonDataclass):
         """
         symbol = symbol.replace('/', '%2F')
         params = {'active': active} if active is not None else None
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/equity-options/{symbol}',
             headers=session.headers,
             params=params
@@ -566,7 +613,32 @@ class NestedOptionChain(TastytradeJsonDataclass):
         :return: a :class:`NestedOptionChain` object.
         """
         symbol = symbol.replace('/', '%2F')
-        response = requests.get(
+        response = session.client.get(
+            f'{session.base_url}/option-chains/{symbol}/nested',
+            headers=session.headers
+        )
+        validate_response(response)
+
+        data = response.json()['data']['items'][0]
+
+        return cls(**data)
+
+    @classmethod
+    async def a_get_chain(
+        cls,
+        session: Session,
+        symbol: str
+    ) -> 'NestedOptionChain':
+        """
+        Gets the option chain for the given symbol in nested format.
+
+        :param session: the session to use for the request.
+        :param symbol: the symbol to get the option chain for.
+
+        :return: a :class:`NestedOptionChain` object.
+        """
+        symbol = symbol.replace('/', '%2F')
+        response = await session.async_client.get(
             f'{session.base_url}/option-chains/{symbol}/nested',
             headers=session.headers
         )
@@ -628,7 +700,7 @@ class FutureProduct(TastytradeJsonDataclass):
 
         :return: a list of :class:`FutureProduct` objects.
         """
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/future-products',
             headers=session.headers
         )
@@ -656,7 +728,7 @@ class FutureProduct(TastytradeJsonDataclass):
         :return: a :class:`FutureProduct` object.
         """
         code = code.replace('/', '')
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/instruments/future-products/{exchange}/'
              f'{code}'),
             headers=session.headers
@@ -729,7 +801,7 @@ class Future(TradeableTastytradeJsonDataclass):
             'symbol[]': symbols,
             'product-code[]': product_codes
         }
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/futures',
             headers=session.headers,
             params={k: v for k, v in params.items() if v is not None}
@@ -751,7 +823,28 @@ class Future(TradeableTastytradeJsonDataclass):
         :return: a :class:`Future` object.
         """
         symbol = symbol.replace('/', '')
-        response = requests.get(
+        response = session.client.get(
+            f'{session.base_url}/instruments/futures/{symbol}',
+            headers=session.headers
+        )
+        validate_response(response)
+
+        data = response.json()['data']
+
+        return cls(**data)
+
+    @classmethod
+    async def a_get_future(cls, session: Session, symbol: str) -> 'Future':
+        """
+        Returns a :class:`Future` object from the given symbol.
+
+        :param session: the session to use for the request.
+        :param symbol: the symbol to get the future for.
+
+        :return: a :class:`Future` object.
+        """
+        symbol = symbol.replace('/', '')
+        response = await session.async_client.get(
             f'{session.base_url}/instruments/futures/{symbol}',
             headers=session.headers
         )
@@ -798,7 +891,7 @@ class FutureOptionProduct(TastytradeJsonDataclass):
 
         :return: a list of :class:`FutureOptionProduct` objects.
         """
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/future-option-products',
             headers=session.headers
         )
@@ -825,7 +918,7 @@ class FutureOptionProduct(TastytradeJsonDataclass):
         :return: a :class:`FutureOptionProduct` object.
         """
         root_symbol = root_symbol.replace('/', '')
-        response = requests.get(
+        response = session.client.get(
             (f'{session.base_url}/instruments/future-option-products/'
              f'{exchange}/{root_symbol}'),
             headers=session.headers
@@ -909,7 +1002,7 @@ class FutureOption(TradeableTastytradeJsonDataclass):
             'option-type': option_type,
             'strike-price': strike_price
         }
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/future-options',
             headers=session.headers,
             params={k: v for k, v in params.items() if v is not None}
@@ -935,7 +1028,7 @@ class FutureOption(TradeableTastytradeJsonDataclass):
         :return: a :class:`FutureOption` object.
         """
         symbol = symbol.replace('/', '%2F').replace(' ', '%20')
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/future-options/{symbol}',
             headers=session.headers
         )
@@ -984,7 +1077,32 @@ class NestedFutureOptionChain(TastytradeJsonDataclass):
         :return: a :class:`NestedFutureOptionChain` object.
         """
         symbol = symbol.replace('/', '')
-        response = requests.get(
+        response = session.client.get(
+            f'{session.base_url}/futures-option-chains/{symbol}/nested',
+            headers=session.headers
+        )
+        validate_response(response)
+
+        data = response.json()['data']
+
+        return cls(**data)
+
+    @classmethod
+    async def a_get_chain(
+        cls,
+        session: Session,
+        symbol: str
+    ) -> 'NestedFutureOptionChain':
+        """
+        Gets the futures option chain for the given symbol in nested format.
+
+        :param session: the session to use for the request.
+        :param symbol: the symbol to get the option chain for.
+
+        :return: a :class:`NestedFutureOptionChain` object.
+        """
+        symbol = symbol.replace('/', '')
+        response = await session.async_client.get(
             f'{session.base_url}/futures-option-chains/{symbol}/nested',
             headers=session.headers
         )
@@ -1023,7 +1141,7 @@ class Warrant(TastytradeJsonDataclass):
         :return: a list of :class:`Warrant` objects.
         """
         params = {'symbol[]': symbols} if symbols is not None else {}
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/warrants',
             headers=session.headers,
             params=params
@@ -1044,7 +1162,7 @@ class Warrant(TastytradeJsonDataclass):
 
         :return: a :class:`Warrant` object.
         """
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/instruments/warrants/{symbol}',
             headers=session.headers
         )
@@ -1070,7 +1188,7 @@ def get_quantity_decimal_precisions(
 
     :return: a list of :class:`QuantityDecimalPrecision` objects.
     """
-    response = requests.get(
+    response = session.client.get(
         f'{session.base_url}/instruments/quantity-decimal-precisions',
         headers=session.headers
     )
@@ -1100,7 +1218,44 @@ def get_option_chain(
     :return: a dict mapping expiration date to a list of options
     """
     symbol = symbol.replace('/', '%2F')
-    response = requests.get(
+    response = session.client.get(
+        f'{session.base_url}/option-chains/{symbol}',
+        headers=session.headers
+    )
+    validate_response(response)
+
+    data = response.json()['data']['items']
+    chain = {}
+    for entry in data:
+        option = Option(**entry)
+        if option.expiration_date not in chain:
+            chain[option.expiration_date] = [option]
+        else:
+            chain[option.expiration_date].append(option)
+
+    return chain
+
+
+async def a_get_option_chain(
+    session: Session,
+    symbol: str
+) -> Dict[date, List[Option]]:
+    """
+    Returns a mapping of expiration date to a list of option objects
+    representing the options chain for the given symbol.
+
+    In the case that there are two expiries on the same day (e.g. SPXW
+    and SPX AM options), both will be returned in the same list. If you
+    just want one expiry, you'll need to filter the list yourself, or use
+    :class:`NestedOptionChain` instead.
+
+    :param session: the session to use for the request.
+    :param symbol: the symbol to get the option chain for.
+
+    :return: a dict mapping expiration date to a list of options
+    """
+    symbol = symbol.replace('/', '%2F')
+    response = await session.async_client.get(
         f'{session.base_url}/option-chains/{symbol}',
         headers=session.headers
     )
@@ -1137,7 +1292,44 @@ def get_future_option_chain(
     :return: a dict mapping expiration date to a list of futures options.
     """
     symbol = symbol.replace('/', '')
-    response = requests.get(
+    response = session.client.get(
+        f'{session.base_url}/futures-option-chains/{symbol}',
+        headers=session.headers
+    )
+    validate_response(response)
+
+    data = response.json()['data']['items']
+    chain = {}
+    for entry in data:
+        option = FutureOption(**entry)
+        if option.expiration_date not in chain:
+            chain[option.expiration_date] = [option]
+        else:
+            chain[option.expiration_date].append(option)
+
+    return chain
+
+
+async def a_get_future_option_chain(
+    session: ProductionSession,
+    symbol: str
+) -> Dict[date, List[FutureOption]]:
+    """
+    Returns a mapping of expiration date to a list of futures options
+    objects representing the options chain for the given symbol.
+
+    In the case that there are two expiries on the same day (e.g. EW
+    and ES options), both will be returned in the same list. If you
+    just want one expiry, you'll need to filter the list yourself, or
+    use ~:class:`NestedFutureOptionChain` instead.
+
+    :param session: the session to use for the request.
+    :param symbol: the symbol to get the option chain for.
+
+    :return: a dict mapping expiration date to a list of futures options.
+    """
+    symbol = symbol.replace('/', '')
+    response = await session.async_client.get(
         f'{session.base_url}/futures-option-chains/{symbol}',
         headers=session.headers
     )
@@ -2,8 +2,6 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
-import requests
-
 from tastytrade.session import ProductionSession, Session
 from tastytrade.utils import TastytradeJsonDataclass, validate_response
 
@@ -119,7 +117,31 @@ def get_market_metrics(
 
     :return: a list of Tastytrade 'MarketMetricInfo' objects in JSON format.
     """
-    response = requests.get(
+    response = session.client.get(
+        f'{session.base_url}/market-metrics',
+        headers=session.headers,
+        params={'symbols': ','.join(symbols)}
+    )
+    validate_response(response)
+
+    data = response.json()['data']['items']
+
+    return [MarketMetricInfo(**entry) for entry in data]
+
+
+async def a_get_market_metrics(
+    session: ProductionSession,
+    symbols: List[str]
+) -> List[MarketMetricInfo]:
+    """
+    Retrieves market metrics for the given symbols.
+
+    :param session: active user session to use
+    :param symbols: list of symbols to retrieve metrics for
+
+    :return: a list of Tastytrade 'MarketMetricInfo' objects in JSON format.
+    """
+    response = await session.async_client.get(
         f'{session.base_url}/market-metrics',
         headers=session.headers,
         params={'symbols': ','.join(symbols)}
@@ -144,7 +166,7 @@ def get_dividends(
     :return: a list of Tastytrade 'DividendInfo' objects in JSON format.
     """
     symbol = symbol.replace('/', '%2F')
-    response = requests.get(
+    response = session.client.get(
         (f'{session.base_url}/market-metrics/historic-corporate-events/'
          f'dividends/{symbol}'),
         headers=session.headers
@@ -172,7 +194,7 @@ def get_earnings(
     """
     symbol = symbol.replace('/', '%2F')
     params: Dict[str, Any] = {'start-date': start_date}
-    response = requests.get(
+    response = session.client.get(
         (f'{session.base_url}/market-metrics/historic-corporate-events/'
          f'earnings-reports/{symbol}'),
         headers=session.headers,
@@ -193,7 +215,25 @@ def get_risk_free_rate(session: Session) -> Decimal:
 
     :return: the current risk-free rate
     """
-    response = requests.get(
+    response = session.client.get(
+        f'{session.base_url}/margin-requirements-public-configuration',
+        headers=session.headers
+    )
+    validate_response(response)
+
+    data = response.json()['data']['risk-free-rate']
+    return Decimal(data)
+
+
+async def a_get_risk_free_rate(session: Session) -> Decimal:
+    """
+    Retrieves the current risk-free rate.
+
+    :param session: active user session to use
+
+    :return: the current risk-free rate
+    """
+    response = await session.async_client.get(
         f'{session.base_url}/margin-requirements-public-configuration',
         headers=session.headers
     )
@@ -1,17 +1,123 @@
-import sys
+import asyncio
+import time
 from configparser import ConfigParser
-from typing import Any
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional
 
+import bson
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo.errors import BulkWriteError
+from pymongo.errors import BulkWriteError, PyMongoError
 
-from tastytrade.dxfeed import (Candle, Event, EventType, Greeks, Profile,
-                               Quote, Summary, TheoPrice, TimeAndSale, Trade,
-                               Underlying)
+from tastytrade import logger
+from tastytrade.dxfeed import Quote
+from tastytrade.spill import SpillLog
+from tastytrade.utils import TastytradeError
+
+#: default number of encoded bytes buffered before a flush
+MAX_BUFFER_BYTES = 1024 * 1024
+#: default number of seconds a document may wait in the buffer
+MAX_BUFFER_AGE = 1.0
+#: default number of flushed batches waiting for a writer
+MAX_PENDING_BATCHES = 16
+#: default number of concurrent writer tasks
+WRITERS = 2
+#: seconds between attempts to replay the spill log
+REPLAY_INTERVAL = 5.0
+
+
+class OverflowPolicy(str, Enum):
+    """
+    This is an :class:`~enum.Enum` of what :class:`MongoDB` does with a
+    flushed batch when every writer is busy and the queue is full.
+    """
+    #: wait for room in the queue, slowing down the caller
+    BLOCK = 'block'
+    #: discard the batch being flushed
+    DROP_NEWEST = 'drop_newest'
+    #: discard the oldest batch in the queue to make room
+    DROP_OLDEST = 'drop_oldest'
+    #: append the batch to the spill log instead of the database
+    SPILL = 'spill'
+
+
+@dataclass
+class MongoDBStats:
+    """
+    Dataclass with the write counters of a :class:`MongoDB` buffer.
+    """
+    #: number of batches waiting for a writer
+    queue_depth: int = 0
+    #: highest number of batches that were waiting at once
+    max_queue_depth: int = 0
+    #: number of batches written to the database
+    batches_written: int = 0
+    #: number of documents written to the database
+    documents_written: int = 0
+    #: number of documents discarded because the queue was full
+    dropped: int = 0
+    #: number of documents written to the spill log
+    spilled: int = 0
+    #: number of documents replayed from the spill log
+    replayed: int = 0
+    #: number of batches whose write failed
+    write_errors: int = 0
+    #: total time spent in insert_many, in seconds
+    write_seconds: float = 0.0
+    #: slowest insert_many, in seconds
+    max_write_seconds: float = 0.0
+
+    @property
+    def average_write_seconds(self) -> float:
+        """
+        Average duration of a batch write, in seconds.
+        """
+        writes = self.batches_written + self.write_errors
+        return self.write_seconds / writes if writes else 0.0
 
 
 class MongoDB:
-    def __init__(self, db_name: str, collection_name: str):
+    """
+    Buffers raw streamer messages and writes them to MongoDB in bulk.
+
+    The buffer is flushed once the BSON-encoded size of its documents
+    reaches `max_buffer_bytes`, or once its oldest document is
+    `max_buffer_age` seconds old, whichever comes first. Flushed batches go
+    into a bounded queue drained by `writers` background tasks, so
+    :meth:`insert` doesn't wait for the database unless the queue is full
+    and `overflow` is :attr:`OverflowPolicy.BLOCK`. Call :meth:`close` on
+    shutdown to write out whatever is still buffered or queued.
+
+    With a `spill_path`, batches that can't be written because the database
+    is down go to a local :class:`~tastytrade.spill.SpillLog` instead of
+    being lost, as do batches that overflow the queue unless another policy
+    is chosen. The log is replayed into the collection in the background
+    once the database is reachable again.
+
+    Settings not passed explicitly are read from the `MaxBufferBytes`,
+    `MaxBufferAge`, `MaxPendingBatches`, `Writers`, `Overflow` and
+    `SpillPath` keys of the `MONGODB` section of config.ini, if present.
+
+    :param db_name: the database to write to
+    :param collection_name: the collection to write to
+    :param max_buffer_bytes: encoded size at which the buffer is flushed
+    :param max_buffer_age: age in seconds at which the buffer is flushed
+    :param max_pending_batches: number of flushed batches that may wait
+    :param writers: number of concurrent writer tasks
+    :param overflow: what to do with a batch when the queue is full
+    :param spill_path: file to keep the spill log in
+    """
+    def __init__(
+        self,
+        db_name: str,
+        collection_name: str,
+        max_buffer_bytes: Optional[int] = None,
+        max_buffer_age: Optional[float] = None,
+        max_pending_batches: Optional[int] = None,
+        writers: Optional[int] = None,
+        overflow: Optional[OverflowPolicy] = None,
+        spill_path: Optional[str] = None
+    ):
         config: ConfigParser = ConfigParser()
         config.read('config.ini')
 
@@ -22,38 +128,183 @@ class MongoDB:
         self.client = AsyncIOMotorClient(f'mongodb://{user}:{password}@{uri}')
         self.db = self.client[db_name]
         self.collection = self.db[collection_name]
-        self.buffer = []
+        self.buffer: List[Dict[str, Any]] = []
         self.buffer_size = 0
-        self.max_buffer_size = 10 * 1024  # 10KB
+        self.max_buffer_size = max_buffer_bytes or config.getint(
+            'MONGODB', 'MaxBufferBytes', fallback=MAX_BUFFER_BYTES)
+        self.max_buffer_age = max_buffer_age or config.getfloat(
+            'MONGODB', 'MaxBufferAge', fallback=MAX_BUFFER_AGE)
+        self.max_pending_batches = max_pending_batches or config.getint(
+            'MONGODB', 'MaxPendingBatches', fallback=MAX_PENDING_BATCHES)
+        self.writers = writers or config.getint(
+            'MONGODB', 'Writers', fallback=WRITERS)
+        self.spill_path = spill_path or config.get(
+            'MONGODB', 'SpillPath', fallback=None)
+        self.overflow = OverflowPolicy(overflow or config.get(
+            'MONGODB', 'Overflow', fallback=OverflowPolicy.SPILL
+            if self.spill_path else OverflowPolicy.BLOCK))
+        if self.overflow == OverflowPolicy.SPILL and not self.spill_path:
+            raise TastytradeError('A spill path is needed to spill batches!')
+        self._spill_log = SpillLog(self.spill_path) \
+            if self.spill_path else None
+        #: write counters, updated as batches go through the queue
+        self.stats = MongoDBStats()
+        self._buffer_started = 0.0
+        self._queue: asyncio.Queue = asyncio.Queue(
+            maxsize=self.max_pending_batches)
+        self._tasks: List[asyncio.Task] = []
 
-    async def insert(self, data: Any):
+    def _start(self):
+        self._tasks = [asyncio.create_task(self._writer())
+                       for _ in range(self.writers)]
+        self._tasks.append(asyncio.create_task(self._expire_buffer()))
+        if self._spill_log is not None:
+            self._tasks.append(asyncio.create_task(self._replay_forever()))
+
+    async def insert(self, data: Any, fields: Optional[List[str]] = None):
         document = {
             'type': data[0],
             'content': data[1]
         }
-        document_size = sys.getsizeof(document)
+        if fields is not None:
+            # the field order of the content, when it isn't the model's
+            document['fields'] = fields
+        if not self._tasks:
+            self._start()
 
         # Add document to buffer
+        if not self.buffer:
+            self._buffer_started = time.monotonic()
         self.buffer.append(document)
-        self.buffer_size += document_size
+        self.buffer_size += len(bson.encode(document))
 
         # Check if buffer size exceeds the maximum buffer size
         if self.buffer_size >= self.max_buffer_size:
-            await self.flush_buffer()
+            await self._enqueue(self._take_buffer())
 
-    async def flush_buffer(self):
-        if self.buffer:
+    def _take_buffer(self) -> List[Dict[str, Any]]:
+        buffer = self.buffer
+        self.buffer = []
+        self.buffer_size = 0
+        return buffer
+
+    async def _expire_buffer(self):
+        while True:
+            age = time.monotonic() - self._buffer_started
+            if self.buffer and age >= self.max_buffer_age:
+                await self._enqueue(self._take_buffer())
+                age = 0.0
+            await asyncio.sleep(self.max_buffer_age - age
+                                if self.buffer else self.max_buffer_age)
+
+    async def _enqueue(self, buffer: List[Dict[str, Any]]):
+        if not buffer:
+            return
+        if self._queue.full():
+            if self.overflow == OverflowPolicy.DROP_NEWEST:
+                self.stats.dropped += len(buffer)
+                return
+            if self.overflow == OverflowPolicy.DROP_OLDEST:
+                self.stats.dropped += len(self._queue.get_nowait())
+                self._queue.task_done()
+            elif self.overflow == OverflowPolicy.SPILL:
+                self._spill(buffer)
+                return
+        await self._queue.put(buffer)
+        self.stats.queue_depth = self._queue.qsize()
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth,
+                                         self.stats.queue_depth)
+
+    def _spill(self, buffer: List[Dict[str, Any]]):
+        self.stats.spilled += self._spill_log.append(buffer)  # type: ignore
+
+    async def _writer(self):
+        while True:
+            buffer = await self._queue.get()
+            self.stats.queue_depth = self._queue.qsize()
+            start = time.monotonic()
             try:
                 # Perform bulk write operation with plain dictionaries
-                await self.collection.insert_many(self.buffer)
-                # print(f"Flushed {len(self.buffer)} documents to the
-                # database.")
+                await self.collection.insert_many(buffer, ordered=False)
+                self.stats.batches_written += 1
+                self.stats.documents_written += len(buffer)
             except BulkWriteError as bwe:
-                print(f"Error during bulk write: {bwe.details}")
+                self.stats.write_errors += 1
+                logger.error('Error during bulk write: %s', bwe.details)
+            except PyMongoError as e:
+                self.stats.write_errors += 1
+                if self._spill_log is None:
+                    logger.error('Error during bulk write: %s', e)
+                else:
+                    logger.warning('Database unavailable, spilling %d '
+                                   'documents: %s', len(buffer), e)
+                    self._spill(buffer)
             finally:
-                # Clear the buffer
-                self.buffer = []
-                self.buffer_size = 0
+                elapsed = time.monotonic() - start
+                self.stats.write_seconds += elapsed
+                self.stats.max_write_seconds = max(
+                    self.stats.max_write_seconds, elapsed)
+                self._queue.task_done()
+
+    async def _replay_forever(self):
+        while True:
+            await asyncio.sleep(REPLAY_INTERVAL)
+            if self._spill_log.pending:  # type: ignore
+                await self.replay_spill()
+
+    async def replay_spill(self) -> int:
+        """
+        Writes the documents in the spill log back into the collection in
+        bulk, stopping at the first batch the database doesn't accept.
+
+        :return: the number of documents replayed
+        """
+        if self._spill_log is None:
+            return 0
+        replayed = 0
+        batches = self._spill_log.read_batches(self.max_buffer_size)
+        for documents, offset in batches:
+            try:
+                await self.collection.insert_many(documents, ordered=False)
+            except BulkWriteError as bwe:
+                # documents spilled mid-write may already be stored
+                errors = bwe.details['writeErrors']
+                if not all(error['code'] == 11000 for error in errors):
+                    logger.error('Error during replay: %s', bwe.details)
+            except PyMongoError as e:
+                logger.warning('Database still unavailable: %s', e)
+                break
+            self._spill_log.commit(offset)
+            replayed += len(documents)
+        if replayed:
+            logger.info('Replayed %d spilled documents.', replayed)
+        self.stats.replayed += replayed
+        return replayed
+
+    async def flush_buffer(self):
+        """
+        Queues the buffer and waits until every queued batch is written.
+        """
+        buffer = self._take_buffer()
+        if buffer:
+            # never drop or spill what is left on shutdown
+            await self._queue.put(buffer)
+        if self._tasks:
+            await self._queue.join()
+        elif buffer:
+            await self.collection.insert_many(buffer, ordered=False)
+
+    async def close(self):
+        """
+        Flushes everything still buffered or queued, stops the writers and
+        closes the client.
+        """
+        await self.flush_buffer()
+        for task in self._tasks:
+            task.cancel()
+        if self._spill_log is not None:
+            self._spill_log.close()
+        self.client.close()
 
     async def find(self):
         document = await self.collection.find_one()
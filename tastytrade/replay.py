@@ -0,0 +1,276 @@
+import asyncio
+import gzip
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import websockets
+from websockets import WebSocketServerProtocol
+
+from tastytrade import logger
+
+
+class FrameRecorder:
+    """
+    Writes raw DXLink frames to a gzipped JSON lines file, one
+    `[timestamp, frame]` array per line, where `timestamp` is the
+    wall-clock time the frame was received, in seconds. Pass a
+    `record_path` to :class:`~tastytrade.streamer.DXLinkStreamer` to record
+    everything it receives, and replay it with :class:`ReplayServer`.
+
+    :param path: the file to write, appended to if it exists
+    """
+    def __init__(self, path: str):
+        #: the file the frames are written to
+        self.path = path
+        #: number of frames written so far
+        self.frames = 0
+        self._file = gzip.open(path, 'at')
+
+    def write(
+        self,
+        frame: Union[str, bytes],
+        timestamp: Optional[float] = None
+    ) -> None:
+        """
+        Appends a frame to the recording. Binary frames are decoded as
+        UTF-8, so they're replayed as text frames.
+
+        :param frame: the raw message, as received from the websocket
+        :param timestamp: when it was received, defaults to now
+        """
+        if isinstance(frame, bytes):
+            frame = frame.decode()
+        timestamp = time.time() if timestamp is None else timestamp
+        self._file.write(json.dumps([timestamp, frame]))
+        self._file.write('\n')
+        self.frames += 1
+
+    def close(self) -> None:
+        """
+        Flushes and closes the file.
+        """
+        self._file.close()
+
+
+def read_recording(path: str) -> Iterator[Tuple[float, str]]:
+    """
+    Reads a recording written by :class:`FrameRecorder`.
+
+    :param path: the recording to read
+
+    :return: a generator of `(timestamp, frame)` tuples, in recorded order
+    """
+    with gzip.open(path, 'rt') as f:
+        for line in f:
+            if line.strip():
+                timestamp, frame = json.loads(line)
+                yield timestamp, frame
+
+
+class ReplayServer:
+    """
+    A local websocket server that speaks enough of the DXLink protocol for
+    :class:`~tastytrade.streamer.DXLinkStreamer` to connect to it, and
+    plays back the FEED_DATA frames of a recording instead of live data.
+
+    Any token is accepted. Each FEED_SETUP is answered with the fields the
+    recording was made with, so the recorded COMPACT rows decode as they
+    did originally. Playback starts at the first FEED_SUBSCRIPTION of a
+    connection and only covers event types that have a feed set up on it;
+    frames are sent to the client's channel for their event type, whatever
+    channel they were recorded on. Symbols aren't filtered, the recording
+    is replayed as it is. With `autoplay=False`, playback waits for
+    :meth:`play` instead, e.g. until every feed has been subscribed to.
+
+    Example usage::
+
+        from tastytrade.replay import ReplayServer
+
+        async with ReplayServer('session.jsonl.gz', speed=10) as server:
+            async with DXLinkStreamer(server.session) as streamer:
+                await streamer.subscribe(EventType.QUOTE, ['SPY'])
+                await server.finished.wait()
+
+    :param path: the recording to replay
+    :param speed:
+        playback speed relative to the recorded timing, so 1 is real time
+        and 10 is ten times faster; 0 sends frames as fast as possible
+    :param host: the interface to listen on
+    :param port: the port to listen on, 0 picks a free one
+    :param loop: start over at the beginning once the recording ends
+    :param autoplay: start playback at the first subscription
+    """
+    def __init__(
+        self,
+        path: str,
+        speed: float = 1.0,
+        host: str = 'localhost',
+        port: int = 0,
+        loop: bool = False,
+        autoplay: bool = True
+    ):
+        #: playback speed, 0 for as fast as possible
+        self.speed = speed
+        self.host = host
+        self.port = port
+        self.loop = loop
+        #: number of FEED_DATA frames sent to clients so far
+        self.frames_sent = 0
+        #: set once a connection has replayed the whole recording
+        self.finished = asyncio.Event()
+        #: event types a client has set up a feed for
+        self.feeds: Set[str] = set()
+        self._playing = asyncio.Event()
+        self._autoplay = autoplay
+        self._fields: Dict[str, List[str]] = {}
+        self._frames: List[Tuple[float, str, int, str]] = []
+        self._load(path)
+        self._server: Any = None
+
+    def _load(self, path: str) -> None:
+        # only the data and the fields it was recorded with are kept; the
+        # frames stay encoded so playback doesn't re-encode them
+        for timestamp, frame in read_recording(path):
+            message = json.loads(frame)
+            if message['type'] == 'FEED_CONFIG':
+                for event_type, fields in \
+                        message.get('eventFields', {}).items():
+                    self._fields[event_type] = fields
+            elif message['type'] == 'FEED_DATA':
+                header = message['data'][0]
+                if isinstance(header, str):
+                    event_type = header
+                else:
+                    event_type = header[0]
+                    if len(header) > 1:
+                        self._fields.setdefault(event_type, header[1])
+                self._frames.append((timestamp, event_type,
+                                     message['channel'], frame))
+        logger.debug('Loaded %d frames from %s', len(self._frames), path)
+
+    @property
+    def url(self) -> str:
+        """
+        The websocket URL of the running server.
+        """
+        return f'ws://{self.host}:{self.port}'
+
+    @property
+    def session(self) -> SimpleNamespace:
+        """
+        A stand-in session that points a
+        :class:`~tastytrade.streamer.DXLinkStreamer` at this server.
+        """
+        return SimpleNamespace(dxlink_url=self.url, streamer_token='replay')
+
+    async def start(self) -> None:
+        """
+        Starts listening for connections.
+        """
+        self._server = await websockets.serve(self._handle, self.host,
+                                              self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """
+        Stops the server and closes every connection.
+        """
+        self._server.close()
+        await self._server.wait_closed()
+
+    def play(self) -> None:
+        """
+        Starts playback on every subscribed connection, when the server was
+        created with `autoplay=False`.
+        """
+        self._playing.set()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _handle(self, websocket: WebSocketServerProtocol) -> None:
+        # event type -> the channel the client set up for it
+        channels: Dict[str, int] = {}
+        replay_task: Optional[asyncio.Task] = None
+
+        async def send(message: Dict[str, Any]) -> None:
+            await websocket.send(json.dumps(message))
+
+        try:
+            async for raw_message in websocket:
+                message = json.loads(raw_message)
+                kind = message['type']
+                if kind == 'SETUP':
+                    await send({'type': 'SETUP', 'channel': 0,
+                                'keepaliveTimeout': 60,
+                                'acceptKeepaliveTimeout': 60,
+                                'version': 'replay'})
+                    await send({'type': 'AUTH_STATE', 'channel': 0,
+                                'state': 'UNAUTHORIZED'})
+                elif kind == 'AUTH':
+                    await send({'type': 'AUTH_STATE', 'channel': 0,
+                                'state': 'AUTHORIZED'})
+                elif kind == 'CHANNEL_REQUEST':
+                    await send({'type': 'CHANNEL_OPENED',
+                                'channel': message['channel'],
+                                'service': message.get('service'),
+                                'parameters': message.get('parameters')})
+                elif kind == 'FEED_SETUP':
+                    event_fields = {}
+                    for event_type, fields in \
+                            message.get('acceptEventFields', {}).items():
+                        channels[event_type] = message['channel']
+                        self.feeds.add(event_type)
+                        event_fields[event_type] = \
+                            self._fields.get(event_type, fields)
+                    await send({'type': 'FEED_CONFIG',
+                                'channel': message['channel'],
+                                'dataFormat': 'COMPACT',
+                                'eventFields': event_fields})
+                elif kind == 'FEED_SUBSCRIPTION':
+                    if self._autoplay:
+                        self._playing.set()
+                    if replay_task is None:
+                        replay_task = asyncio.create_task(
+                            self._replay(websocket, channels))
+                elif kind == 'KEEPALIVE':
+                    await send({'type': 'KEEPALIVE', 'channel': 0})
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            if replay_task is not None:
+                replay_task.cancel()
+
+    async def _replay(
+        self,
+        websocket: WebSocketServerProtocol,
+        channels: Dict[str, int]
+    ) -> None:
+        await self._playing.wait()
+        while self._frames:
+            first = self._frames[0][0]
+            start = time.monotonic()
+            for timestamp, event_type, channel, frame in self._frames:
+                if self.speed:
+                    delay = (timestamp - first) / self.speed - \
+                        (time.monotonic() - start)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                target = channels.get(event_type)
+                if target is None:
+                    continue
+                if target != channel:
+                    message = json.loads(frame)
+                    message['channel'] = target
+                    frame = json.dumps(message)
+                await websocket.send(frame)
+                self.frames_sent += 1
+            if not self.loop:
+                break
+        self.finished.set()
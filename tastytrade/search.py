@@ -1,7 +1,5 @@
 from typing import List
 
-import requests
-
 from tastytrade.session import ProductionSession
 from tastytrade.utils import TastytradeJsonDataclass
 
@@ -28,7 +26,7 @@ def symbol_search(
     :return: a list of symbols and descriptions that match the search phrase
     """
     symbol = symbol.replace('/', '%2F')
-    response = requests.get(
+    response = session.client.get(
         f'{session.base_url}/symbols/search/{symbol}',
         headers=session.headers
     )
@@ -1,14 +1,26 @@
+import asyncio
+import json
 from abc import ABC
-from typing import Any, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Type, TypeVar
+from weakref import WeakKeyDictionary
 
+import httpx
 import requests
 from fake_useragent import UserAgent  # type: ignore
 
 from tastytrade import API_URL, CERT_URL
 from tastytrade.utils import (TastytradeError, TastytradeJsonDataclass,
+                              create_async_http_client, create_http_client,
                               validate_response)
 
 
+#: how long a streamer token lasts when the API doesn't say
+STREAMER_TOKEN_LIFETIME = timedelta(hours=24)
+
+SessionType = TypeVar('SessionType', bound='Session')
+
+
 class TwoFactorInfo(TastytradeJsonDataclass):
     is_active: bool
     type: Optional[str] = None
@@ -19,9 +31,134 @@ class Session(ABC):
     An abstract class which contains the basic functionality of a session.
     """
     base_url: str
+    client: requests.Session
     headers: Dict[str, str]
     user: Dict[str, str]
     session_token: str
+    remember_token: Optional[str]
+    streamer_token: str
+    streamer_expiration: datetime
+    dxlink_url: str
+    streamer_headers: Dict[str, str]
+    # endpoint handing out streamer tokens, relative to `base_url`
+    _streamer_token_path: str
+    # async clients per event loop, and the settings to create them with
+    _async_clients: WeakKeyDictionary
+    _pool_size: int
+    _max_retries: int
+
+    def _create_clients(self, pool_size: int, max_retries: int) -> None:
+        #: The pooled HTTP client shared by every API request
+        self.client = create_http_client(pool_size, max_retries)
+        self._pool_size = pool_size
+        self._max_retries = max_retries
+        self._async_clients = WeakKeyDictionary()
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        The pooled HTTP client shared by async API requests made from the
+        running event loop. An httpx client's connections belong to the
+        loop that opened them, so every loop gets a client of its own; close
+        it with :meth:`aclose` before the loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = create_async_http_client(self._pool_size,
+                                              self._max_retries)
+            self._async_clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Closes the async client of the running event loop, if it has one.
+        Await it before a loop that made async requests finishes, e.g. at
+        the end of the coroutine given to :func:`asyncio.run`, so the
+        loop's connections are released.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def refresh_streamer_token(self) -> None:
+        """
+        Fetches a new streamer token and DXLink URL. Live streamers can be
+        handed the new token with
+        :meth:`~tastytrade.streamer.DXLinkStreamer.update_token`.
+        """
+        response = self.client.get(
+            f'{self.base_url}/{self._streamer_token_path}',
+            headers=self.headers
+        )
+        validate_response(response)
+        data = response.json()['data']
+        self.streamer_token = data['token']
+        self.dxlink_url = data['dxlink-url']
+        self.streamer_headers = {
+            'Authorization': f'Bearer {self.streamer_token}'
+        }
+        #: When the streamer token stops being accepted
+        self.streamer_expiration = \
+            datetime.fromisoformat(
+                data['expires-at'].replace('Z', '+00:00')) \
+            if 'expires-at' in data \
+            else datetime.now(timezone.utc) + STREAMER_TOKEN_LIFETIME
+
+    def serialize(self) -> str:
+        """
+        Serializes the session, so it can be saved and restored later with
+        :meth:`deserialize` without logging in again.
+
+        :return: a JSON string holding the session's tokens
+        """
+        return json.dumps({
+            'base_url': self.base_url,
+            'user': self.user,
+            'session_token': self.session_token,
+            'remember_token': self.remember_token,
+            'streamer_token': self.streamer_token,
+            'streamer_expiration': self.streamer_expiration.isoformat(),
+            'dxlink_url': self.dxlink_url,
+            'user_agent': self.headers.get('User-Agent')
+        })
+
+    @classmethod
+    def deserialize(
+        cls: Type[SessionType],
+        serialized: str,
+        pool_size: int = 10,
+        max_retries: int = 3
+    ) -> SessionType:
+        """
+        Restores a session saved with :meth:`serialize`. No request is made,
+        so use :meth:`validate` to check the session is still alive.
+
+        :param serialized: the output of :meth:`serialize`
+        :param pool_size: number of HTTP connections kept alive to the API
+        :param max_retries: number of retries for throttled or failed requests
+
+        :return: the restored session
+        """
+        data = json.loads(serialized)
+        self = cls.__new__(cls)
+        self.base_url = data['base_url']
+        self._create_clients(pool_size, max_retries)
+        self.user = data['user']
+        self.session_token = data['session_token']
+        self.remember_token = data['remember_token']
+        self.headers = {'Authorization': self.session_token}
+        if data.get('user_agent'):
+            self.headers['User-Agent'] = data['user_agent']
+        self.streamer_token = data['streamer_token']
+        self.streamer_expiration = \
+            datetime.fromisoformat(data['streamer_expiration'])
+        self.dxlink_url = data['dxlink_url']
+        self.streamer_headers = {
+            'Authorization': f'Bearer {self.streamer_token}'
+        }
+        return self
 
     def validate(self) -> bool:
         """
@@ -29,7 +166,7 @@ class Session(ABC):
 
         :return: True if the session is valid and False otherwise.
         """
-        response = requests.post(
+        response = self.client.post(
             f'{self.base_url}/sessions/validate',
             headers=self.headers
         )
@@ -44,7 +181,7 @@ class Session(ABC):
         :return:
             True if the session terminated successfully and False otherwise.
         """
-        response = requests.delete(
+        response = self.client.delete(
             f'{self.base_url}/sessions',
             headers=self.headers
         )
@@ -57,7 +194,7 @@ class Session(ABC):
 
         :return: a Tastytrade 'Customer' object in JSON format.
         """
-        response = requests.get(
+        response = self.client.get(
             f'{self.base_url}/customers/me',
             headers=self.headers
         )
@@ -78,13 +215,19 @@ class CertificationSession(Session):
         tastytrade password to login; if absent, remember token is required
     :param remember_token:
         previously generated token; if absent, password is required
+    :param pool_size: number of HTTP connections kept alive to the API
+    :param max_retries: number of retries for throttled or failed requests
     """
+    _streamer_token_path = 'api-quote-tokens'
+
     def __init__(
         self,
         login: str,
         password: Optional[str] = None,
         remember_me: bool = False,
-        remember_token: Optional[str] = None
+        remember_token: Optional[str] = None,
+        pool_size: int = 10,
+        max_retries: int = 3
     ):
         body = {
             'login': login,
@@ -99,8 +242,9 @@ class CertificationSession(Session):
                                   'token to log in.')
         #: The base url to use for API requests
         self.base_url: str = CERT_URL
+        self._create_clients(pool_size, max_retries)
 
-        response = requests.post(f'{self.base_url}/sessions', json=body)
+        response = self.client.post(f'{self.base_url}/sessions', json=body)
         validate_response(response)  # throws exception if not 200
 
         json = response.json()
@@ -116,17 +260,7 @@ class CertificationSession(Session):
         self.validate()
 
         # Pull streamer tokens and urls
-        response = requests.get(
-            f'{self.base_url}/api-quote-tokens',
-            headers=self.headers
-        )
-        validate_response(response)
-        data = response.json()['data']
-        self.streamer_token = data['token']
-        self.dxlink_url = data['dxlink-url']
-        self.streamer_headers = {
-            'Authorization': f'Bearer {self.streamer_token}'
-        }
+        self.refresh_streamer_token()
 
 
 class ProductionSession(Session):
@@ -144,14 +278,20 @@ class ProductionSession(Session):
     :param two_factor_authentication:
         if two factor authentication is enabled, this is the code sent to the
         user's device
+    :param pool_size: number of HTTP connections kept alive to the API
+    :param max_retries: number of retries for throttled or failed requests
     """
+    _streamer_token_path = 'quote-streamer-tokens'
+
     def __init__(
         self,
         login: str,
         password: Optional[str] = None,
         remember_me: bool = False,
         remember_token: Optional[str] = None,
-        two_factor_authentication: Optional[str] = None
+        two_factor_authentication: Optional[str] = None,
+        pool_size: int = 10,
+        max_retries: int = 3
     ):
         body = {
             'login': login,
@@ -166,6 +306,7 @@ class ProductionSession(Session):
                                   'token to log in.')
         #: The base url to use for API requests
         self.base_url: str = API_URL
+        self._create_clients(pool_size, max_retries)
         #: The headers to use for API requests
         self.headers: Dict[str, str] = {'User-Agent': UserAgent().random}
 
@@ -174,13 +315,13 @@ class ProductionSession(Session):
                 **self.headers,
                 'X-Tastyworks-OTP': two_factor_authentication
             }
-            response = requests.post(
+            response = self.client.post(
                 f'{self.base_url}/sessions',
                 json=body,
                 headers=headers
             )
         else:
-            response = requests.post(f'{self.base_url}/sessions', json=body)
+            response = self.client.post(f'{self.base_url}/sessions', json=body)
         validate_response(response)  # throws exception if not 200
 
         json = response.json()
@@ -195,17 +336,7 @@ class ProductionSession(Session):
         self.validate()
 
         # Pull streamer tokens and urls
-        response = requests.get(
-            f'{self.base_url}/quote-streamer-tokens',
-            headers=self.headers
-        )
-        validate_response(response)
-        data = response.json()['data']
-        self.streamer_token = data['token']
-        self.dxlink_url = data['dxlink-url']
-        self.streamer_headers = {
-            'Authorization': f'Bearer {self.streamer_token}'
-        }
+        self.refresh_streamer_token()
 
     def get_2fa_info(self) -> TwoFactorInfo:
         """
@@ -213,7 +344,7 @@ class ProductionSession(Session):
 
         :return: a dictionary containing the 2FA info.
         """
-        response = requests.get(
+        response = self.client.get(
             f'{self.base_url}/users/me/two-factor-method',
             headers=self.headers
         )
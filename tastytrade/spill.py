@@ -0,0 +1,143 @@
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import bson
+
+#: default size of a new spill file, it doubles whenever it fills up
+INITIAL_SIZE = 16 * 1024 * 1024
+
+# write offset and read offset, stored at the start of the file
+_HEADER = struct.Struct('<QQ')
+# BSON documents start with their own length
+_LENGTH = struct.Struct('<i')
+
+
+class SpillLog:
+    """
+    An append-only, memory-mapped log of BSON documents, used to keep raw
+    feed data on local disk while the database is slow or unavailable.
+
+    Appending only copies bytes into the mapping, so it never waits on the
+    network. The file starts with the offset up to which documents were
+    written and the offset up to which they were replayed; an append is only
+    made visible by moving the write offset after its bytes are in place, so
+    a crash never exposes a partially written document. Once everything has
+    been replayed both offsets are reset and the space is reused.
+
+    Example usage::
+
+        log = SpillLog('market_data.spill')
+        log.append(documents)
+        for documents, offset in log.read_batches():
+            collection.insert_many(documents)
+            log.commit(offset)
+
+    :param path: the file to store the log in, created if missing
+    :param initial_size: size in bytes to allocate for a new file
+    """
+    def __init__(self, path: str, initial_size: int = INITIAL_SIZE):
+        #: the file backing the log
+        self.path = path
+        new = not os.path.exists(path) or \
+            os.path.getsize(path) < _HEADER.size
+        self._file = open(path, 'a+b')
+        if os.path.getsize(path) < initial_size:
+            self._file.truncate(initial_size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        if new:
+            self._set_offsets(_HEADER.size, _HEADER.size)
+
+    def _offsets(self) -> Tuple[int, int]:
+        return _HEADER.unpack_from(self._map, 0)
+
+    def _set_offsets(self, write_offset: int, read_offset: int) -> None:
+        _HEADER.pack_into(self._map, 0, write_offset, read_offset)
+
+    def _grow(self, size: int) -> None:
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of bytes written but not yet replayed.
+        """
+        write_offset, read_offset = self._offsets()
+        return write_offset - read_offset
+
+    def append(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """
+        Appends documents to the log.
+
+        :param documents: the documents to store
+
+        :return: the number of documents appended
+        """
+        encoded = [bson.encode(document) for document in documents]
+        data = b''.join(encoded)
+        write_offset, read_offset = self._offsets()
+        end = write_offset + len(data)
+        if end > len(self._map):
+            size = len(self._map)
+            while size < end:
+                size *= 2
+            self._grow(size)
+        self._map[write_offset:end] = data
+        self._set_offsets(end, read_offset)
+        return len(encoded)
+
+    def read_batches(
+        self,
+        max_bytes: int = 1024 * 1024
+    ) -> Iterator[Tuple[List[Dict[str, Any]], int]]:
+        """
+        Reads the documents that haven't been replayed yet, oldest first,
+        without marking them as replayed.
+
+        :param max_bytes: approximate encoded size of each batch
+
+        :return:
+            a generator of batches of documents, each with the offset to
+            pass to :meth:`commit` once the batch is safely stored
+        """
+        write_offset, offset = self._offsets()
+        while offset < write_offset:
+            documents = []
+            start = offset
+            while offset < write_offset and offset - start < max_bytes:
+                length, = _LENGTH.unpack_from(self._map, offset)
+                documents.append(bson.decode(self._map[offset:
+                                                       offset + length]))
+                offset += length
+            yield documents, offset
+
+    def commit(self, offset: int) -> None:
+        """
+        Marks every document before `offset` as replayed.
+
+        :param offset: an offset returned by :meth:`read_batches`
+        """
+        write_offset, _ = self._offsets()
+        if offset >= write_offset:
+            # everything was replayed, so start over at the beginning
+            self._set_offsets(_HEADER.size, _HEADER.size)
+        else:
+            self._set_offsets(write_offset, offset)
+
+    def flush(self) -> None:
+        """
+        Writes the mapped pages back to disk.
+        """
+        self._map.flush()
+
+    def close(self) -> None:
+        """
+        Flushes and closes the log.
+        """
+        self.flush()
+        self._map.close()
+        self._file.close()
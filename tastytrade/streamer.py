@@ -1,12 +1,19 @@
 import asyncio
-import json
+import multiprocessing
+import random
+import re
+import time
+import zlib
 from asyncio import Lock, Queue
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from ssl import SSLContext, create_default_context
-from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from types import SimpleNamespace
+from typing import (Any, AsyncIterator, Callable, Dict, List, Optional, Set,
+                    Tuple, Type, Union)
 
 import websockets
 from websockets import WebSocketClientProtocol
@@ -14,12 +21,18 @@ from websockets import WebSocketClientProtocol
 from tastytrade import logger
 from tastytrade.account import (Account, AccountBalance, CurrentPosition,
                                 TradingStatus)
-from tastytrade.dxfeed import (Candle, Event, EventType, Greeks, Profile,
-                               Quote, Summary, TheoPrice, TimeAndSale, Trade,
-                               Underlying)
-from tastytrade.mongodb import MongoDB
+from tastytrade.codec import JsonCodec, get_codec
+from tastytrade.dxfeed import (Candle, CandleRecord, Event, EventBatch,
+                               EventRecord, EventType, Greeks, GreeksRecord,
+                               Profile, ProfileRecord, Quote, QuoteRecord,
+                               Summary, SummaryRecord, TheoPrice,
+                               TheoPriceRecord, TimeAndSale, TimeAndSaleRecord,
+                               Trade, TradeRecord, Underlying,
+                               UnderlyingRecord)
+from tastytrade.mongodb import MongoDB, MongoDBStats
 from tastytrade.order import (InstrumentType, OrderChain, PlacedOrder,
                               PriceEffect)
+from tastytrade.replay import FrameRecorder
 from tastytrade.session import CertificationSession, ProductionSession, Session
 from tastytrade.utils import TastytradeError, TastytradeJsonDataclass
 from tastytrade.watchlists import Watchlist
@@ -29,6 +42,46 @@ STREAMER_URL = 'wss://streamer.tastyworks.com'
 
 DXLINK_VERSION = '0.1-js/0.40.4-WB2'
 
+#: upper bound for the size of a single FEED_SUBSCRIPTION message in bytes
+MAX_SUBSCRIPTION_FRAME = 64 * 1024
+#: number of subscription frames sent before waiting for the server to pong
+SUBSCRIPTION_WINDOW = 8
+#: first and largest delay between reconnection attempts, in seconds
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+#: seconds without any message after which the connection is presumed dead
+KEEPALIVE_TIMEOUT = 60
+
+_EVENT_CLASSES: Dict[EventType, Type[Event]] = {
+    EventType.CANDLE: Candle,
+    EventType.GREEKS: Greeks,
+    EventType.PROFILE: Profile,
+    EventType.QUOTE: Quote,
+    EventType.SUMMARY: Summary,
+    EventType.THEO_PRICE: TheoPrice,
+    EventType.TIME_AND_SALE: TimeAndSale,
+    EventType.TRADE: Trade,
+    EventType.UNDERLYING: Underlying,
+}
+
+# the default field order of each event type, which needn't be stored
+_MODEL_FIELDS: Dict[EventType, List[str]] = {
+    event_type: list(event_class.model_fields)
+    for event_type, event_class in _EVENT_CLASSES.items()
+}
+
+_RECORD_CLASSES: Dict[EventType, Type[EventRecord]] = {
+    EventType.CANDLE: CandleRecord,
+    EventType.GREEKS: GreeksRecord,
+    EventType.PROFILE: ProfileRecord,
+    EventType.QUOTE: QuoteRecord,
+    EventType.SUMMARY: SummaryRecord,
+    EventType.THEO_PRICE: TheoPriceRecord,
+    EventType.TIME_AND_SALE: TimeAndSaleRecord,
+    EventType.TRADE: TradeRecord,
+    EventType.UNDERLYING: UnderlyingRecord,
+}
+
 
 class QuoteAlert(TastytradeJsonDataclass):
     """
@@ -104,9 +157,14 @@ class AccountStreamer:
                 print(data)
 
     """
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        codec: Union[str, JsonCodec, None] = None
+    ):
         #: The active session used to initiate the streamer or make requests
         self.token: str = session.session_token
+        self._codec = get_codec(codec)
         #: The base url for the streamer websocket
         is_certification = isinstance(session, CertificationSession)
         self.base_url: str = \
@@ -157,7 +215,7 @@ class AccountStreamer:
             while True:
                 raw_message = await self._websocket.recv()  # type: ignore
                 logger.debug('raw message: %s', raw_message)
-                await self._queue.put(json.loads(raw_message))
+                await self._queue.put(self._codec.loads(raw_message))
 
     async def listen(self) -> AsyncIterator[TastytradeJsonDataclass]:
         """
@@ -254,7 +312,98 @@ class AccountStreamer:
         if value:
             message['value'] = value
         logger.debug('sending alert subscription: %s', message)
-        await self._websocket.send(json.dumps(message))  # type: ignore
+        await self._websocket.send(self._codec.dumps(message))  # type: ignore
+
+
+@dataclass
+class StreamerStats:
+    """
+    Dataclass with traffic counters for a :class:`DXLinkStreamer`.
+    """
+    #: number of FEED_DATA messages received
+    messages: int = 0
+    #: number of events contained in those messages
+    events: int = 0
+    #: size of those messages in bytes
+    bytes: int = 0
+    #: when counting started, as a unix timestamp
+    started_at: float = field(default_factory=time.time)
+    #: number of times the connection was re-established
+    reconnects: int = 0
+    #: total time spent without a working connection, in seconds
+    downtime: float = 0.0
+    #: length of the most recent outage, in seconds
+    last_gap: float = 0.0
+    #: number of frames written to the recording, if there is one
+    recorded: int = 0
+
+    @property
+    def events_per_second(self) -> float:
+        """
+        Average number of events received per second since `started_at`.
+        """
+        elapsed = time.time() - self.started_at
+        return self.events / elapsed if elapsed > 0 else 0.0
+
+
+class SampleThrottle:
+    """
+    Keeps only the first event of each symbol in every sampling interval,
+    for the event types given. The last kept time of each symbol is held in
+    a dictionary, so every event costs a single lookup.
+
+    Example usage::
+
+        # one greeks sample per symbol every 10 minutes
+        throttle = SampleThrottle({EventType.GREEKS: 600000})
+
+    :param intervals: the sampling interval in ms, per event type
+    """
+    def __init__(self, intervals: Dict[EventType, int]):
+        #: the sampling interval in ms, per event type
+        self.intervals = {EventType(event_type): interval
+                          for event_type, interval in intervals.items()}
+        #: number of events discarded so far
+        self.dropped = 0
+        self._last_kept: Dict[str, Dict[str, int]] = defaultdict(dict)
+
+    def filter(
+        self,
+        event_type: EventType,
+        fields: Optional[List[str]],
+        values: list
+    ) -> list:
+        """
+        Removes the events sampled too recently from the values of a
+        FEED_DATA message.
+
+        :param event_type: the type of the events
+        :param fields: the field order of the events
+        :param values: the flat list of values, in COMPACT format
+
+        :return: the values of the kept events
+        """
+        interval = self.intervals.get(event_type)
+        if not interval or not fields or 'time' not in fields:
+            return values
+        size = len(fields)
+        symbol_index = fields.index('eventSymbol')
+        time_index = fields.index('time')
+        last_kept = self._last_kept[event_type]
+        kept = []
+        for offset in range(0, len(values), size):
+            symbol = values[offset + symbol_index]
+            event_time = values[offset + time_index]
+            previous = last_kept.get(symbol)
+            # events without a time are left for the consumer to discard
+            if not isinstance(event_time, int) or event_time == 0:
+                kept.extend(values[offset:offset + size])
+            elif previous is None or event_time - previous >= interval:
+                last_kept[symbol] = event_time
+                kept.extend(values[offset:offset + size])
+            else:
+                self.dropped += 1
+        return kept
 
 
 class DXLinkStreamer:
@@ -276,6 +425,33 @@ class DXLinkStreamer:
             quote = await streamer.get_event(EventType.QUOTE)
             print(quote)
 
+    Every event type can be subscribed to over the same connection; each is
+    routed through its own channel, and :meth:`subscribe_many` sets up
+    several of them at once.
+
+    With `columnar=True` each FEED_DATA message is decoded in bulk into an
+    :class:`~tastytrade.dxfeed.EventBatch`, which is what the queues then
+    yield instead of individual events. With `records=True` the queues yield
+    lightweight :class:`~tastytrade.dxfeed.EventRecord` objects with float
+    fields instead of pydantic events.
+
+    If the connection drops or goes quiet, the streamer reconnects with
+    jittered exponential backoff, authenticates again and replays every
+    subscription, so the queues simply resume; `stats` counts the reconnects
+    and the time spent disconnected. Pass `reconnect=False` to let the
+    connection task fail instead.
+
+    With `sample_intervals`, only the first event of each symbol in every
+    interval is stored in MongoDB (see :class:`SampleThrottle`); the events
+    put on the queues are not affected.
+
+    Messages are decoded and encoded with the standard library's JSON
+    module unless another `codec` is chosen; 'auto' picks the fastest
+    backend installed (see :func:`~tastytrade.codec.get_codec`).
+
+    With a `record_path`, every frame received is also written to a
+    :class:`~tastytrade.replay.FrameRecorder`, so the session can be played
+    back later by a :class:`~tastytrade.replay.ReplayServer`.
     """
     def __init__(
         self,
@@ -283,11 +459,36 @@ class DXLinkStreamer:
         ssl_context: SSLContext = create_default_context(),
         # if mongo_db then the data is not parsed into events but
         # directly stored in MongoDB
-        mongodb: bool = None
+        mongodb: bool = None,
+        columnar: bool = False,
+        records: bool = False,
+        # whether parsed events are put on the queues; by default only
+        # when the data isn't stored in MongoDB
+        publish_events: Optional[bool] = None,
+        # lets several streamers share their output queues
+        queues: Optional[Dict[EventType, Queue]] = None,
+        # sampling interval in ms per event type, applied to the data
+        # stored in MongoDB
+        sample_intervals: Optional[Dict[EventType, int]] = None,
+        # FEED_SETUP options per channel: aggregation period in seconds and
+        # the subset of fields to receive
+        aggregation_periods: Optional[Dict[EventType, float]] = None,
+        event_fields: Optional[Dict[EventType, List[str]]] = None,
+        reconnect: bool = True,
+        # JSON backend for the websocket messages, see `get_codec`
+        codec: Union[str, JsonCodec, None] = None,
+        # file to record every received frame to, for later replay
+        record_path: Optional[str] = None
     ):
+        if columnar and records:
+            raise TastytradeError('Choose either columnar or records output')
         self._counter = 0
+        self._codec = get_codec(codec)
         self._lock: Lock = Lock()
-        self._queues: Dict[EventType, Queue] = defaultdict(Queue)
+        self._queues: Dict[EventType, Queue] = \
+            defaultdict(Queue) if queues is None else queues
+        #: traffic counters for this connection
+        self.stats = StreamerStats()
         self._channels: Dict[EventType, int] = {
             EventType.CANDLE: 1,
             EventType.GREEKS: 3,
@@ -299,23 +500,54 @@ class DXLinkStreamer:
             EventType.TRADE: 15,
             EventType.UNDERLYING: 17,
         }
+        self._channel_types: Dict[int, EventType] = \
+            {v: k for k, v in self._channels.items()}
+        self._channel_locks: Dict[EventType, Lock] = defaultdict(Lock)
         self._subscription_state: Dict[EventType, str] = \
             defaultdict(lambda: 'CHANNEL_CLOSED')
+        # symbols currently subscribed on each channel
+        self._subscriptions: Dict[EventType, Set[str]] = defaultdict(set)
+        # field order requested for each channel in FEED_SETUP
+        self._accept_fields: Dict[EventType, List[str]] = {}
+        self._columnar = columnar
+        self._records = records
 
         #: The unique client identifier received from the server
         self._session = session
         self._mongodb = MongoDB('tastytrade', 'market_data') \
             if mongodb else None
+        self._publish_events = not mongodb if publish_events is None \
+            else publish_events
+        #: thins out the data stored in MongoDB, if intervals were given
+        self.throttle = SampleThrottle(sample_intervals) \
+            if sample_intervals else None
+        self._aggregation_periods: Dict[EventType, float] = \
+            dict(aggregation_periods or {})
+        self._event_fields: Dict[EventType, List[str]] = {
+            event_type: self._check_fields(event_type, fields)
+            for event_type, fields in (event_fields or {}).items()
+        }
+        # candle subscriptions, keyed by their symbol, to replay them
+        self._candle_entries: Dict[str, Dict[str, Any]] = {}
         self._authenticated = False
+        # authenticated and every subscription replayed
+        self._ready = False
+        self._reconnect = reconnect
+        self._disconnected_at: Optional[float] = None
+        self._last_received = time.monotonic()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._restore_task: Optional[asyncio.Task] = None
         self._wss_url = session.dxlink_url
         self._auth_token = session.streamer_token
         self._ssl_context = ssl_context
+        self._recorder = FrameRecorder(record_path) \
+            if record_path else None
 
         self._connect_task = asyncio.create_task(self._connect())
 
     async def __aenter__(self):
         time_out = 100
-        while not self._authenticated:
+        while not self._ready:
             await asyncio.sleep(0.1)
             time_out -= 1
             if time_out < 0:
@@ -337,55 +569,179 @@ class DXLinkStreamer:
 
     async def close(self):
         """
-        Closes the websocket connection and cancels the heartbeat task.
+        Closes the websocket connection and cancels the heartbeat task,
+        then writes out any data still buffered for MongoDB.
         """
         self._connect_task.cancel()
-        self._heartbeat_task.cancel()
+        self._connection_lost()
+        if self._recorder is not None:
+            self._recorder.close()
+        if self._mongodb is not None:
+            await self._mongodb.close()
 
     async def _connect(self) -> None:
+        """
+        Keeps a connection to the websocket server open, reconnecting with
+        jittered exponential backoff whenever it is lost.
+        """
+        attempt = 0
+        while True:
+            try:
+                await self._run_connection()
+            except (websockets.WebSocketException, OSError,
+                    asyncio.TimeoutError) as e:
+                if not self._reconnect:
+                    raise
+                logger.warning('DXLink connection lost: %s', e)
+            if self._ready:
+                attempt = 0
+            self._connection_lost()
+            cap = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** attempt)
+            attempt += 1
+            await asyncio.sleep(random.uniform(0, cap))
+
+    def _connection_lost(self) -> None:
+        # an outage starts when a working connection is lost
+        if self._ready and self._disconnected_at is None:
+            self._disconnected_at = time.time()
+        self._authenticated = False
+        self._ready = False
+        for task in (self._heartbeat_task, self._restore_task):
+            if task is not None:
+                task.cancel()
+        self._subscription_state.clear()
+
+    async def _run_connection(self) -> None:
         """
         Connect to the websocket server using the URL and
         authorization token provided during initialization.
         """
-
+        ssl = self._ssl_context if self._wss_url.startswith('wss') else None
         async with websockets.connect(
             self._wss_url,
-            ssl=self._ssl_context
+            ssl=ssl
         ) as websocket:
             self._websocket = websocket
+            self._last_received = time.monotonic()
             await self._setup_connection()
 
             # main loop
             while True:
                 raw_message = await self._websocket.recv()
-                message = json.loads(raw_message)
+                self._last_received = time.monotonic()
+                if self._recorder is not None:
+                    self._recorder.write(raw_message)
+                    self.stats.recorded += 1
+                message = self._codec.loads(raw_message)
 
                 logger.debug('received: %s', message)
                 if message['type'] == 'SETUP':
                     await self._authenticate_connection()
                 elif message['type'] == 'AUTH_STATE':
-                    if message['state'] == 'AUTHORIZED':
+                    # a token update is answered with AUTHORIZED again, the
+                    # connection is already set up by then
+                    if message['state'] == 'AUTHORIZED' and \
+                            not self._authenticated:
                         self._authenticated = True
                         self._heartbeat_task = \
                             asyncio.create_task(self._heartbeat())
+                        self._restore_task = asyncio.create_task(
+                            self._restore_subscriptions())
                 elif message['type'] == 'CHANNEL_OPENED':
-                    channel = next(k for k, v in self._channels.items()
-                                   if v == message['channel'])
+                    channel = self._channel_types[message['channel']]
                     self._subscription_state[channel] = message['type']
                 elif message['type'] == 'CHANNEL_CLOSED':
                     logger.debug('Channel closed: %s', message)
                 elif message['type'] == 'FEED_CONFIG':
                     logger.debug('Feed configured: %s', message)
+                    # the server may send fewer fields than were requested
+                    for msg_type, fields in \
+                            message.get('eventFields', {}).items():
+                        self._accept_fields[EventType(msg_type)] = fields
                 elif message['type'] == 'FEED_DATA':
+                    header, data = message['data']
+                    event_type, fields = self._feed_fields(header)
+                    self._count(fields, data, len(raw_message))
                     if self._mongodb is not None:
-                        await self._mongodb.insert(message['data'])
-                    else:
-                        await self._map_message(message['data'])
+                        await self._store(event_type, fields, data)
+                    if self._publish_events:
+                        await self._map_message(event_type, fields, data)
                 elif message['type'] == 'KEEPALIVE':
                     pass
                 else:
                     raise TastytradeError('Unknown message type:', message)
 
+    def _feed_fields(
+        self,
+        header: Union[str, list]
+    ) -> Tuple[EventType, Optional[List[str]]]:
+        # the first message of a feed carries the negotiated fields
+        if isinstance(header, str):
+            msg_type, fields = header, None
+        else:
+            msg_type = header[0]
+            fields = header[1] if len(header) > 1 else None
+        try:
+            event_type = EventType(msg_type)
+        except ValueError:
+            raise TastytradeError(f'Unknown message type received: {header}')
+        if fields:
+            self._accept_fields[event_type] = fields
+        return event_type, self._accept_fields.get(event_type)
+
+    def _check_fields(
+        self,
+        event_type: EventType,
+        fields: List[str]
+    ) -> List[str]:
+        event_class = _EVENT_CLASSES[event_type]
+        unknown = [name for name in fields
+                   if name not in event_class.model_fields]
+        if unknown:
+            raise TastytradeError(f'Unknown {event_type.value} fields: '
+                                  f'{unknown}')
+        # events can't be routed without their symbol; pydantic events
+        # also need every field the model requires
+        required = ['eventSymbol']
+        if self._publish_events and not (self._columnar or self._records):
+            required = [name for name, info in event_class.model_fields.items()
+                        if info.is_required()]
+        if self.throttle is not None and event_type in self.throttle.intervals:
+            required.append('time')
+        missing = [name for name in required if name not in fields]
+        if missing:
+            raise TastytradeError(f'{event_type.value} fields must include '
+                                  f'{missing}')
+        # keep the order of the model
+        return [name for name in event_class.model_fields if name in fields]
+
+    async def _store(
+        self,
+        event_type: EventType,
+        fields: Optional[List[str]],
+        data: list
+    ) -> None:
+        if self.throttle is not None:
+            data = self.throttle.filter(event_type, fields, data)
+            if not data:
+                return
+        if fields == _MODEL_FIELDS[event_type]:
+            # readers fall back to the model's order without `fields`
+            fields = None
+        await self._mongodb.insert(  # type: ignore
+            [event_type.value, data], fields)
+
+    def _count(
+        self,
+        fields: Optional[List[str]],
+        data: list,
+        size: int
+    ) -> None:
+        self.stats.messages += 1
+        self.stats.bytes += size
+        if fields:
+            self.stats.events += len(data) // len(fields)
+
     async def _setup_connection(self):
         message = {
             'type': 'SETUP',
@@ -394,7 +750,7 @@ class DXLinkStreamer:
             'acceptKeepaliveTimeout': 60,
             'version': DXLINK_VERSION
         }
-        await self._websocket.send(json.dumps(message))
+        await self._websocket.send(self._codec.dumps(message))
 
     async def _authenticate_connection(self):
         message = {
@@ -402,9 +758,24 @@ class DXLinkStreamer:
             'channel': 0,
             'token': self._auth_token,
         }
-        await self._websocket.send(json.dumps(message))
+        await self._websocket.send(self._codec.dumps(message))
 
-    async def listen(self, event_type: EventType) -> AsyncIterator[Event]:
+    async def update_token(self, token: str) -> None:
+        """
+        Switches the connection to a new streamer token, e.g. one fetched by
+        :meth:`~tastytrade.session.Session.refresh_streamer_token` before the
+        current one expires. The token is also used for any reconnection.
+
+        :param token: the new streamer token
+        """
+        self._auth_token = token
+        if self._authenticated:
+            await self._authenticate_connection()
+
+    async def listen(
+        self,
+        event_type: EventType
+    ) -> AsyncIterator[Union[Event, EventBatch, EventRecord]]:
         """
         Using the existing subscriptions, pulls events of the given type and
         yield returns them. Never exits unless there's an error or the channel
@@ -415,7 +786,10 @@ class DXLinkStreamer:
         while True:
             yield await self._queues[event_type].get()
 
-    def get_event_nowait(self, event_type: EventType) -> Optional[Event]:
+    def get_event_nowait(
+        self,
+        event_type: EventType
+    ) -> Optional[Union[Event, EventBatch, EventRecord]]:
         """
         Using the existing subscriptions, pulls an event of the given type and
         returns it. If the queue is empty None is returned.
@@ -427,7 +801,10 @@ class DXLinkStreamer:
         else:
             return None
 
-    async def get_event(self, event_type: EventType) -> Event:
+    async def get_event(
+        self,
+        event_type: EventType
+    ) -> Union[Event, EventBatch, EventRecord]:
         """
         Using the existing subscription, pulls an event of the given type and
         returns it.
@@ -447,11 +824,62 @@ class DXLinkStreamer:
         }
 
         while True:
+            if time.monotonic() - self._last_received > KEEPALIVE_TIMEOUT:
+                logger.warning('No message received for %d seconds, '
+                               'reconnecting', KEEPALIVE_TIMEOUT)
+                await self._websocket.close()
+                return
             logger.debug('sending keepalive message: %s', message)
-            await self._websocket.send(json.dumps(message))
+            await self._websocket.send(self._codec.dumps(message))
             # send the heartbeat every 30 seconds
             await asyncio.sleep(30)
 
+    async def _restore_subscriptions(self) -> None:
+        """
+        Replays every subscription on a new connection, including symbols
+        added while the replay is running, then marks the streamer ready.
+        """
+        sent: Dict[EventType, Set[str]] = defaultdict(set)
+        candles_sent: Set[str] = set()
+        try:
+            while True:
+                pending = {event_type: symbols - sent[event_type]
+                           for event_type, symbols
+                           in self._subscriptions.items()
+                           if symbols - sent[event_type]}
+                candles = {symbol: entry for symbol, entry
+                           in self._candle_entries.items()
+                           if symbol not in candles_sent}
+                if not pending and not candles:
+                    break
+                for event_type, symbols in pending.items():
+                    await self._open_channel(event_type)
+                    entries = [{'symbol': symbol, 'type': event_type.value}
+                               for symbol in symbols]
+                    await self._send_subscription(event_type, 'add', entries)
+                    sent[event_type].update(symbols)
+                if candles:
+                    await self._open_channel(EventType.CANDLE)
+                    await self._send_subscription(EventType.CANDLE, 'add',
+                                                  list(candles.values()))
+                    candles_sent.update(candles)
+        except (websockets.WebSocketException, TastytradeError,
+                asyncio.TimeoutError) as e:
+            # closing the socket makes the connection task start over
+            logger.warning('Failed to restore subscriptions: %s', e)
+            await self._websocket.close()
+            return
+        if self._disconnected_at is not None:
+            gap = time.time() - self._disconnected_at
+            self.stats.reconnects += 1
+            self.stats.downtime += gap
+            self.stats.last_gap = gap
+            self._disconnected_at = None
+            logger.info('Reconnected after %.1f seconds, replayed %d '
+                        'subscriptions', gap,
+                        sum(map(len, sent.values())) + len(candles_sent))
+        self._ready = True
+
     async def subscribe(
         self,
         event_type: EventType,
@@ -459,22 +887,104 @@ class DXLinkStreamer:
     ) -> None:
         """
         Subscribes to quotes for given list of symbols. Used for recurring data
-        feeds.
+        feeds. The list can be arbitrarily large; it is sent in size-bounded,
+        flow-controlled messages.
         For candles, use :meth:`subscribe_candle` instead.
 
         :param event_type: type of subscription to add
         :param symbols: list of symbols to subscribe for
         """
-        if self._subscription_state[event_type] != 'CHANNEL_OPENED':
-            await self._channel_request(event_type)
-        message = {
-            'type': 'FEED_SUBSCRIPTION',
-            'channel': self._channels[event_type],
-            'add': [{'symbol': symbol, 'type': event_type}
-                    for symbol in symbols]
-        }
-        logger.debug('sending subscription: %s', message)
-        await self._websocket.send(json.dumps(message))
+        self._subscriptions[event_type].update(symbols)
+        if not self._ready:
+            # replayed as soon as the connection is back
+            return
+        entries = [{'symbol': symbol, 'type': event_type.value}
+                   for symbol in symbols]
+        try:
+            await self._open_channel(event_type)
+            await self._send_subscription(event_type, 'add', entries)
+        except (websockets.WebSocketException, TastytradeError,
+                asyncio.TimeoutError) as e:
+            # the symbols are replayed once the connection is back; closing
+            # the socket makes the connection task start over
+            logger.warning('Failed to subscribe: %s', e)
+            await self._websocket.close()
+
+    async def _send_subscription(
+        self,
+        event_type: EventType,
+        action: str,
+        entries: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Sends a subscription change of any size as a series of
+        FEED_SUBSCRIPTION messages of at most `MAX_SUBSCRIPTION_FRAME` bytes.
+        Each send waits for the socket's write buffer to drain, and after
+        every `SUBSCRIPTION_WINDOW` messages we wait for the server to answer
+        a ping, so a large subscription never floods the connection.
+        """
+        channel = self._channels[event_type]
+        dumps = self._codec.dumps
+        overhead = len(dumps({'type': 'FEED_SUBSCRIPTION', 'channel': channel,
+                              action: []}).encode())
+        # bytes between list items, e.g. ', ' for the stdlib codec
+        separator = len(dumps([0, 0])) - 2 * len(dumps(0)) - 2
+        frames: List[List[Dict[str, Any]]] = [[]]
+        size = overhead
+        for entry in entries:
+            entry_size = len(dumps(entry).encode()) + separator
+            if frames[-1] and size + entry_size > MAX_SUBSCRIPTION_FRAME:
+                frames.append([])
+                size = overhead
+            frames[-1].append(entry)
+            size += entry_size
+        for i, frame in enumerate(frames, start=1):
+            message = {
+                'type': 'FEED_SUBSCRIPTION',
+                'channel': channel,
+                action: frame
+            }
+            logger.debug('sending subscription of %d symbols', len(frame))
+            await self._websocket.send(self._codec.dumps(message))
+            if i % SUBSCRIPTION_WINDOW == 0 and i < len(frames):
+                pong = await self._websocket.ping()
+                await asyncio.wait_for(pong, timeout=30)
+
+    async def subscribe_many(
+        self,
+        subscriptions: Dict[EventType, List[str]]
+    ) -> None:
+        """
+        Subscribes to several event types at once over this connection, each
+        on its own channel.
+
+        :param subscriptions: symbols to subscribe for, per event type
+        """
+        for event_type, symbols in subscriptions.items():
+            if symbols:
+                await self.subscribe(event_type, symbols)
+
+    @property
+    def mongodb_stats(self) -> Optional[MongoDBStats]:
+        """
+        Write counters of the MongoDB buffer, if data is being stored.
+        """
+        return self._mongodb.stats if self._mongodb is not None else None
+
+    @property
+    def subscriptions(self) -> Dict[EventType, Set[str]]:
+        """
+        The symbols currently subscribed to, per event type.
+        """
+        return {event_type: set(symbols)
+                for event_type, symbols in self._subscriptions.items()
+                if symbols}
+
+    async def _open_channel(self, event_type: EventType) -> None:
+        # concurrent subscribers must not request the same channel twice
+        async with self._channel_locks[event_type]:
+            if self._subscription_state[event_type] != 'CHANNEL_OPENED':
+                await self._channel_request(event_type)
 
     async def cancel_channel(self, event_type: EventType) -> None:
         """
@@ -487,7 +997,7 @@ class DXLinkStreamer:
             'channel': self._channels[event_type],
         }
         logger.debug('sending channel cancel: %s', message)
-        await self._websocket.send(json.dumps(message))
+        await self._websocket.send(self._codec.dumps(message))
 
     async def _channel_request(self, event_type: EventType) -> None:
         message = {
@@ -499,7 +1009,7 @@ class DXLinkStreamer:
             },
         }
         logger.debug('sending subscription: %s', message)
-        await self._websocket.send(json.dumps(message))
+        await self._websocket.send(self._codec.dumps(message))
         time_out = 100
         while not self._subscription_state[event_type] == 'CHANNEL_OPENED':
             await asyncio.sleep(0.1)
@@ -513,36 +1023,19 @@ class DXLinkStreamer:
         message = {
             'type': 'FEED_SETUP',
             'channel': self._channels[event_type],
-            'acceptAggregationPeriod': 10,
+            'acceptAggregationPeriod':
+                self._aggregation_periods.get(event_type, 10),
             'acceptDataFormat': 'COMPACT'
         }
 
-        def dict_from_schema(event_class: Any):
-            schema = event_class.schema()
-            return {schema['title']: list(schema['properties'].keys())}
-
-        if event_type == EventType.CANDLE:
-            accept = dict_from_schema(Candle)
-        elif event_type == EventType.GREEKS:
-            accept = dict_from_schema(Greeks)
-        elif event_type == EventType.PROFILE:
-            accept = dict_from_schema(Profile)
-        elif event_type == EventType.QUOTE:
-            accept = dict_from_schema(Quote)
-        elif event_type == EventType.SUMMARY:
-            accept = dict_from_schema(Summary)
-        elif event_type == EventType.THEO_PRICE:
-            accept = dict_from_schema(TheoPrice)
-        elif event_type == EventType.TIME_AND_SALE:
-            accept = dict_from_schema(TimeAndSale)
-        elif event_type == EventType.TRADE:
-            accept = dict_from_schema(Trade)
-        elif event_type == EventType.UNDERLYING:
-            accept = dict_from_schema(Underlying)
+        fields = self._event_fields.get(event_type) or \
+            list(_EVENT_CLASSES[event_type].model_fields.keys())
+        self._accept_fields[event_type] = fields
+        accept = {event_type.value: fields}
         message['acceptEventFields'] = accept
         # send message
         logger.debug('setting up feed: %s', message)
-        await self._websocket.send(json.dumps(message))
+        await self._websocket.send(self._codec.dumps(message))
 
     async def unsubscribe(
         self,
@@ -556,17 +1049,17 @@ class DXLinkStreamer:
         :param event_type: type of subscription to remove
         :param symbols: list of symbols to unsubscribe from
         """
-        if not self._authenticated:
-            raise TastytradeError('Stream not authenticated')
-        event_type_str = str(event_type).split('.')[1].capitalize()
-        message = {
-            'type': 'FEED_SUBSCRIPTION',
-            'channel': self._channels[event_type],
-            'remove': [{'symbol': symbol, "type": event_type_str} for symbol in
-                       symbols]
-        }
-        logger.debug('sending subscription: %s', message)
-        await self._websocket.send(json.dumps(message))
+        self._subscriptions[event_type].difference_update(symbols)
+        if not self._ready:
+            # the symbols won't be replayed when the connection is back
+            return
+        entries = [{'symbol': symbol, 'type': event_type.value}
+                   for symbol in symbols]
+        try:
+            await self._send_subscription(event_type, 'remove', entries)
+        except websockets.ConnectionClosed as e:
+            # a new connection starts without these symbols anyway
+            logger.warning('Connection lost while unsubscribing: %s', e)
 
     async def subscribe_candle(
         self,
@@ -587,7 +1080,6 @@ class DXLinkStreamer:
         :param end_time: ending time for the data range
         :param extended_trading_hours: whether to include extended trading
         """
-        await self._channel_request(EventType.CANDLE)
         message = {
             'type': 'FEED_SUBSCRIPTION',
             'channel': self._channels[EventType.CANDLE],
@@ -600,7 +1092,16 @@ class DXLinkStreamer:
         }
         if end_time is not None:
             raise TastytradeError('End time no longer supported')
-        await self._websocket.send(json.dumps(message))
+        for entry in message['add']:
+            self._candle_entries[entry['symbol']] = entry
+        if not self._ready:
+            # replayed as soon as the connection is back
+            return
+        try:
+            await self._channel_request(EventType.CANDLE)
+            await self._websocket.send(self._codec.dumps(message))
+        except websockets.ConnectionClosed as e:
+            logger.warning('Connection lost while subscribing: %s', e)
 
     async def unsubscribe_candle(
         self,
@@ -616,7 +1117,6 @@ class DXLinkStreamer:
         :param extended_trading_hours:
             whether candle to unsubscribe from contains extended trading hours
         """
-        await self._channel_request(EventType.CANDLE)
         message = {
             'type': 'FEED_SUBSCRIPTION',
             'channel': self._channels[EventType.CANDLE],
@@ -626,57 +1126,277 @@ class DXLinkStreamer:
                 'type': 'Candle'
             }]
         }
-        await self._websocket.send(json.dumps(message))
-
-    async def _map_message(self, message) -> None:
+        self._candle_entries.pop(message['remove'][0]['symbol'], None)
+        if not self._ready:
+            return
+        try:
+            await self._channel_request(EventType.CANDLE)
+            await self._websocket.send(self._codec.dumps(message))
+        except websockets.ConnectionClosed as e:
+            logger.warning('Connection lost while unsubscribing: %s', e)
+
+    async def _map_message(
+        self,
+        event_type: EventType,
+        fields: Optional[List[str]],
+        data: list
+    ) -> None:
         """
         Takes the raw JSON data, parses the events and places them into their
         respective queues.
 
-        :param message: raw JSON data from the websocket
+        :param event_type: the type of the events
+        :param fields: the negotiated field order of the events
+        :param data: the flat list of values from the websocket
+        """
+        logger.debug('received message: %s %s', event_type, data)
+        event_class = _EVENT_CLASSES[event_type]
+        queue = self._queues[event_type]
+        if self._columnar:
+            await queue.put(event_class.from_stream_columnar(data, fields))
+        elif self._records:
+            for record in _RECORD_CLASSES[event_type].from_stream(data,
+                                                                  fields):
+                await queue.put(record)
+        else:
+            for event in event_class.from_stream(data, fields):
+                await queue.put(event)
+
+
+def _shard_process(
+    credentials: Dict[str, str],
+    shard: int,
+    commands: Any,
+    counters: Any,
+    streamer_kwargs: Dict[str, Any]
+) -> None:  # pragma: no cover
+    """
+    Entry point of a shard running in its own process. Subscriptions arrive
+    through the `commands` queue and the data goes straight to MongoDB.
+    """
+    async def run():
+        session = SimpleNamespace(**credentials)
+        async with DXLinkStreamer(session, mongodb=True,  # type: ignore
+                                  **streamer_kwargs) as streamer:
+            while True:
+                while not commands.empty():
+                    command = commands.get_nowait()
+                    if command is None:
+                        return
+                    if command[0] == 'token':
+                        await streamer.update_token(command[1])
+                        continue
+                    event_type, symbols = command
+                    await streamer.subscribe(event_type, symbols)
+                counters[shard * 3] = streamer.stats.messages
+                counters[shard * 3 + 1] = streamer.stats.events
+                counters[shard * 3 + 2] = streamer.stats.bytes
+                await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+
+
+class DXLinkStreamerPool:
+    """
+    Spreads a large symbol universe over several :class:`DXLinkStreamer`
+    connections, so that no single receive loop has to decode the whole
+    feed. Symbols are assigned to a shard by hashing `shard_key(symbol)`,
+    which defaults to the symbol itself; use :meth:`underlying_key` to keep
+    the options of an underlying on the same connection.
+
+    In-process shards share their output queues, so :meth:`listen` and
+    :meth:`get_event` yield the merged stream of all connections. With
+    `processes=True` every shard runs its receive loop in a separate
+    process and stores its data in MongoDB, which then is the merged sink.
+
+    Example usage::
+
+        from tastytrade import DXLinkStreamerPool
+        from tastytrade.dxfeed import EventType
+
+        async with DXLinkStreamerPool(session, shards=4) as pool:
+            await pool.subscribe(EventType.GREEKS, option_symbols)
+            async for greeks in pool.listen(EventType.GREEKS):
+                print(greeks)
+
+    :param session: the session used to connect every shard
+    :param shards: the number of connections to open
+    :param shard_key: maps a symbol to the key used to pick its shard
+    :param processes: whether to run each shard in its own process
+    :param streamer_kwargs: passed on to every :class:`DXLinkStreamer`
+    """
+    def __init__(
+        self,
+        session: ProductionSession,
+        shards: int = 4,
+        shard_key: Optional[Callable[[str], str]] = None,
+        processes: bool = False,
+        **streamer_kwargs: Any
+    ):
+        if shards < 1:
+            raise TastytradeError('A pool needs at least one shard')
+        if processes and not streamer_kwargs.pop('mongodb', True):
+            raise TastytradeError('Process shards can only write to MongoDB')
+        self._session = session
+        self._shard_count = shards
+        self._shard_key = shard_key or (lambda symbol: symbol)
+        self._processes = processes
+        self._streamer_kwargs = streamer_kwargs
+        self._queues: Dict[EventType, Queue] = defaultdict(Queue)
+        self._streamers: List[DXLinkStreamer] = []
+        self._workers: List[multiprocessing.Process] = []
+        self._commands: List[Any] = []
+        self._counters: Any = None
+        self._started_at = time.time()
+
+    async def __aenter__(self):
+        self._started_at = time.time()
+        if self._processes:
+            self._start_processes()
+        else:
+            self._streamers = [
+                DXLinkStreamer(self._session, queues=self._queues,
+                               **self._streamer_kwargs)
+                for _ in range(self._shard_count)
+            ]
+            await asyncio.gather(*(s.__aenter__() for s in self._streamers))
+        return self
+
+    @classmethod
+    async def create(
+        cls,
+        session: ProductionSession,
+        shards: int = 4,
+        **kwargs: Any
+    ) -> 'DXLinkStreamerPool':
+        self = cls(session, shards=shards, **kwargs)
+        return await self.__aenter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes every shard's connection.
+        """
+        for streamer in self._streamers:
+            await streamer.close()
+        for commands in self._commands:
+            commands.put(None)
+        for worker in self._workers:
+            await asyncio.get_running_loop().run_in_executor(
+                None, worker.join, 10)
+            if worker.is_alive():
+                worker.terminate()
+
+    def _start_processes(self) -> None:
+        context = multiprocessing.get_context('spawn')
+        credentials = {
+            'dxlink_url': self._session.dxlink_url,
+            'streamer_token': self._session.streamer_token
+        }
+        self._counters = context.Array('q', self._shard_count * 3)
+        for shard in range(self._shard_count):
+            commands = context.Queue()
+            worker = context.Process(
+                target=_shard_process,
+                args=(credentials, shard, commands, self._counters,
+                      self._streamer_kwargs),
+                daemon=True
+            )
+            worker.start()
+            self._commands.append(commands)
+            self._workers.append(worker)
+
+    @staticmethod
+    def underlying_key(symbol: str) -> str:
+        """
+        Shard key grouping streamer symbols by their alphabetic root, so
+        e.g. '.SPY240628P500' and 'SPY' land on the same connection.
+
+        :param symbol: the streamer symbol to get the key for
+        """
+        match = re.match(r'[./]*([A-Z]+)', symbol)
+        return match.group(1) if match else symbol
+
+    def shard_of(self, symbol: str) -> int:
         """
-        logger.debug('received message: %s', message)
-        if isinstance(message[0], str):
-            msg_type = message[0]
+        Returns the index of the shard the given symbol is assigned to.
+
+        :param symbol: the streamer symbol to look up
+        """
+        key = self._shard_key(symbol).encode()
+        return zlib.crc32(key) % self._shard_count
+
+    async def subscribe(
+        self,
+        event_type: EventType,
+        symbols: List[str]
+    ) -> None:
+        """
+        Subscribes to the given symbols, each on the connection of its shard.
+
+        :param event_type: type of subscription to add
+        :param symbols: list of symbols to subscribe for
+        """
+        sharded: Dict[int, List[str]] = defaultdict(list)
+        for symbol in symbols:
+            sharded[self.shard_of(symbol)].append(symbol)
+        if self._processes:
+            for shard, shard_symbols in sharded.items():
+                self._commands[shard].put((event_type, shard_symbols))
         else:
-            msg_type = message[0][0]
-        data = message[1]
-        # parse type or warn for unknown type
-        if msg_type == EventType.CANDLE:
-            candles = Candle.from_stream(data)
-            for candle in candles:
-                await self._queues[EventType.CANDLE].put(candle)
-        elif msg_type == EventType.GREEKS:
-            greeks = Greeks.from_stream(data)
-            for greek in greeks:
-                await self._queues[EventType.GREEKS].put(greek)
-        elif msg_type == EventType.PROFILE:
-            profiles = Profile.from_stream(data)
-            for profile in profiles:
-                await self._queues[EventType.PROFILE].put(profile)
-        elif msg_type == EventType.QUOTE:
-                quotes = Quote.from_stream(data)
-                for quote in quotes:
-                    await self._queues[EventType.QUOTE].put(quote)
-        elif msg_type == EventType.SUMMARY:
-            summaries = Summary.from_stream(data)
-            for summary in summaries:
-                await self._queues[EventType.SUMMARY].put(summary)
-        elif msg_type == EventType.THEO_PRICE:
-            theo_prices = TheoPrice.from_stream(data)
-            for theo_price in theo_prices:
-                await self._queues[EventType.THEO_PRICE].put(theo_price)
-        elif msg_type == EventType.TIME_AND_SALE:
-            time_and_sales = TimeAndSale.from_stream(data)
-            for tas in time_and_sales:
-                await self._queues[EventType.TIME_AND_SALE].put(tas)
-        elif msg_type == EventType.TRADE:
-            trades = Trade.from_stream(data)
-            for trade in trades:
-                await self._queues[EventType.TRADE].put(trade)
-        elif msg_type == EventType.UNDERLYING:
-            underlyings = Underlying.from_stream(data)
-            for underlying in underlyings:
-                await self._queues[EventType.UNDERLYING].put(underlying)
+            await asyncio.gather(*(
+                self._streamers[shard].subscribe(event_type, shard_symbols)
+                for shard, shard_symbols in sharded.items()
+            ))
+
+    async def update_token(self, token: str) -> None:
+        """
+        Hands a new streamer token to every shard.
+
+        :param token: the new streamer token
+        """
+        if self._processes:
+            for commands in self._commands:
+                commands.put(('token', token))
         else:
-            raise TastytradeError(f'Unknown message type received: {message}')
+            for streamer in self._streamers:
+                await streamer.update_token(token)
+
+    async def listen(
+        self,
+        event_type: EventType
+    ) -> AsyncIterator[Union[Event, EventBatch, EventRecord]]:
+        """
+        Yields the merged events of the given type from every shard. Never
+        exits unless there's an error.
+
+        :param event_type: the type of event to listen for
+        """
+        while True:
+            yield await self._queues[event_type].get()
+
+    async def get_event(
+        self,
+        event_type: EventType
+    ) -> Union[Event, EventBatch, EventRecord]:
+        """
+        Pulls the next event of the given type from any shard.
+
+        :param event_type: the type of event to get
+        """
+        return await self._queues[event_type].get()
+
+    @property
+    def stats(self) -> List[StreamerStats]:
+        """
+        The traffic counters of every shard, in shard order.
+        """
+        if not self._processes:
+            return [streamer.stats for streamer in self._streamers]
+        return [StreamerStats(messages=self._counters[shard * 3],
+                              events=self._counters[shard * 3 + 1],
+                              bytes=self._counters[shard * 3 + 2],
+                              started_at=self._started_at)
+                for shard in range(self._shard_count)]
@@ -1,9 +1,18 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, Deque, Dict, Iterator, List, Union
 
+import httpx
 import pandas_market_calendars as mcal  # type: ignore
 import pytz
+import requests
 from pydantic import BaseModel
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 NYSE = mcal.get_calendar('NYSE')
 TZ = pytz.timezone('US/Eastern')
@@ -206,7 +215,122 @@ class TastytradeJsonDataclass(BaseModel):
         populate_by_name = True
 
 
-def validate_response(response: Response) -> None:
+def create_http_client(
+    pool_size: int = 10,
+    max_retries: int = 3,
+    backoff_factor: float = 0.5
+) -> requests.Session:
+    """
+    Creates an HTTP client which keeps connections to the API alive and
+    reuses them across requests. Idempotent requests that fail with 429 or a
+    5xx status are retried with exponential backoff, honouring any
+    Retry-After header.
+
+    :param pool_size: maximum number of connections kept open per host
+    :param max_retries: number of times a failed request is retried
+    :param backoff_factor: base delay in seconds between retries
+
+    :return: a configured :class:`requests.Session`
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=retry)
+    client = requests.Session()
+    client.mount('https://', adapter)
+    client.mount('http://', adapter)
+    return client
+
+
+class _AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """
+    Async counterpart of the urllib3 retry policy used by
+    :func:`create_http_client`.
+    """
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        max_retries: int,
+        backoff_factor: float
+    ):
+        self._transport = transport
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+
+    async def handle_async_request(
+        self,
+        request: httpx.Request
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = await self._transport.handle_async_request(request)
+            if (attempt >= self._max_retries
+                    or request.method not in Retry.DEFAULT_ALLOWED_METHODS
+                    or response.status_code not in (429, 500, 502, 503, 504)):
+                return response
+            retry_after = response.headers.get('Retry-After', '')
+            delay = float(retry_after) if retry_after.isdigit() \
+                else self._backoff_factor * 2 ** attempt
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def create_async_http_client(
+    pool_size: int = 10,
+    max_retries: int = 3,
+    backoff_factor: float = 0.5
+) -> httpx.AsyncClient:
+    """
+    Creates an async HTTP client with the same connection pooling and retry
+    behaviour as :func:`create_http_client`.
+
+    :param pool_size: maximum number of connections kept open
+    :param max_retries: number of times a failed request is retried
+    :param backoff_factor: base delay in seconds between retries
+
+    :return: a configured :class:`httpx.AsyncClient`
+    """
+    limits = httpx.Limits(max_connections=pool_size,
+                          max_keepalive_connections=pool_size)
+    transport = httpx.AsyncHTTPTransport(limits=limits, retries=max_retries)
+    return httpx.AsyncClient(
+        transport=_AsyncRetryTransport(transport, max_retries, backoff_factor),
+        timeout=30
+    )
+
+
+def build_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Formats query parameters so that :mod:`requests` and :mod:`httpx` send
+    them identically: missing values are dropped, enums are sent by value
+    and booleans as 'True' or 'False', the way :mod:`requests` writes them.
+
+    :param params: the parameters, possibly with None values
+
+    :return: the parameters to pass to either client
+    """
+    formatted: Dict[str, Any] = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = str(value)
+        elif isinstance(value, Enum):
+            value = value.value
+        formatted[key] = value
+    return formatted
+
+
+def validate_response(response: Union[Response, httpx.Response]) -> None:
     """
     Checks if the given code is an error; if so, raises an exception.
 
@@ -224,3 +348,66 @@ def validate_response(response: Response) -> None:
                     error_message += f"\n{error['domain']}: {error['reason']}"
 
         raise TastytradeError(error_message)
+
+
+def fetch_pages(
+    client: requests.Session,
+    url: str,
+    headers: Dict[str, str],
+    params: Dict[str, Any],
+    paginate: bool = True,
+    max_workers: int = 1
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Fetches a paginated endpoint, yielding the items of each page in order.
+
+    The first page is requested on its own to learn `total-pages`; the
+    remaining pages are then downloaded by up to `max_workers` threads,
+    keeping at most that many requests in flight so that a slow consumer
+    doesn't pull the whole result set into memory.
+
+    :param client: the HTTP client to use for the requests
+    :param url: the endpoint to fetch
+    :param headers: the headers to send with every request
+    :param params:
+        the query parameters, including 'page-offset'; None values are
+        dropped
+    :param paginate: whether to fetch the pages after the first one
+    :param max_workers:
+        the number of pages to download concurrently; 1 fetches the pages
+        one after another
+
+    :return: a generator of the raw items of each page
+    """
+    params = {k: v for k, v in params.items() if v is not None}
+
+    def fetch(offset: int) -> Dict[str, Any]:
+        response = client.get(url, headers=headers,
+                              params={**params, 'page-offset': offset})
+        validate_response(response)
+        return response.json()
+
+    json = fetch(params.get('page-offset', 0))
+    yield json['data']['items']
+    if not paginate:
+        return
+
+    pagination = json['pagination']
+    offsets = iter(range(pagination['page-offset'] + 1,
+                         pagination['total-pages']))
+    if max_workers <= 1:
+        for offset in offsets:
+            yield fetch(offset)['data']['items']
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: Deque[Future] = deque()
+    try:
+        for offset in offsets:
+            pending.append(executor.submit(fetch, offset))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()['data']['items']
+        while pending:
+            yield pending.popleft().result()['data']['items']
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,7 +1,5 @@
 from typing import Dict, List, Optional
 
-import requests
-
 from tastytrade.instruments import InstrumentType
 from tastytrade.session import ProductionSession
 from tastytrade.utils import TastytradeJsonDataclass, validate_response
@@ -39,7 +37,7 @@ class PairsWatchlist(TastytradeJsonDataclass):
 
         :return: a list of :class:`PairsWatchlist` objects.
         """
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/pairs-watchlists',
             headers=session.headers
         )
@@ -62,7 +60,7 @@ class PairsWatchlist(TastytradeJsonDataclass):
 
         :return: a :class:`PairsWatchlist` object.
         """
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/pairs-watchlists/{name}',
             headers=session.headers
         )
@@ -97,7 +95,7 @@ class Watchlist(TastytradeJsonDataclass):
 
         :return: a list of :class:`Watchlist` objects.
         """
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/public-watchlists',
             headers=session.headers,
             params={'counts-only': counts_only}
@@ -122,7 +120,7 @@ class Watchlist(TastytradeJsonDataclass):
 
         :return: a :class:`Watchlist` object.
         """
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/public-watchlists/{name}',
             headers=session.headers
         )
@@ -144,7 +142,7 @@ class Watchlist(TastytradeJsonDataclass):
 
         :return: a list of :class:`Watchlist` objects.
         """
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/watchlists',
             headers=session.headers
         )
@@ -168,7 +166,7 @@ class Watchlist(TastytradeJsonDataclass):
 
         :return: a :class:`Watchlist` object.
         """
-        response = requests.get(
+        response = session.client.get(
             f'{session.base_url}/watchlists/{name}',
             headers=session.headers
         )
@@ -190,7 +188,7 @@ class Watchlist(TastytradeJsonDataclass):
         :param session: the session to use for the request.
         :param name: the name of the watchlist to delete.
         """
-        response = requests.delete(
+        response = session.client.delete(
             f'{session.base_url}/watchlists/{name}',
             headers=session.headers
         )
@@ -202,7 +200,7 @@ class Watchlist(TastytradeJsonDataclass):
 
         :param session: the session to use for the request.
         """
-        response = requests.post(
+        response = session.client.post(
             f'{session.base_url}/watchlists',
             headers=session.headers,
             json=self.dict(by_alias=True)
@@ -215,7 +213,7 @@ class Watchlist(TastytradeJsonDataclass):
 
         :param session: the session to use for the request.
         """
-        response = requests.put(
+        response = session.client.put(
             f'{session.base_url}/watchlists/{self.name}',
             headers=session.headers,
             json=self.dict(by_alias=True)
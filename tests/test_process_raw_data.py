@@ -0,0 +1,97 @@
+from process_raw_data import handle_batch, watch_inserts
+from tastytrade.dxfeed import Greeks, Quote, Trade
+
+
+class FakeCollection:
+    def __init__(self):
+        self.inserted = []
+        self.deleted = []
+
+    def insert_many(self, documents, ordered=True):
+        self.inserted.extend(documents)
+
+    def delete_many(self, query):
+        self.deleted.extend(query['_id']['$in'])
+
+
+def _row(model, **values):
+    return [values.get(name, 0) for name in model.model_fields]
+
+
+def test_handle_batch_skips_unknown_types():
+    trade = _row(Trade, eventSymbol='SPY', time=1700000000000, price=1.5,
+                 exchangeCode='Q', tickDirection='UP',
+                 extendedTradingHours=False)
+    greeks = _row(Greeks, eventSymbol='.SPY', time=1700000000000)
+    quote = _row(Quote, eventSymbol='SPY', bidExchangeCode='Q',
+                 askExchangeCode='Q')
+    documents = [
+        {'_id': 1, 'type': 'Trade', 'content': trade},
+        {'_id': 2, 'type': 'Quote', 'content': quote},
+        {'_id': 3, 'type': 'Greeks', 'content': greeks},
+    ]
+    source = FakeCollection()
+    trade_data = FakeCollection()
+    greeks_data = FakeCollection()
+
+    events = handle_batch(documents, trade_data, greeks_data, source)
+
+    assert events == 2
+    assert [row['eventSymbol'] for row in trade_data.inserted] == ['SPY']
+    assert [row['eventSymbol'] for row in greeks_data.inserted] == ['.SPY']
+    # the whole batch is acknowledged, including the quote
+    assert source.deleted == [1, 2, 3]
+
+
+class FakeCursor(list):
+    def sort(self, key, direction):
+        return FakeCursor(sorted(self, key=lambda document: document[key]))
+
+    def limit(self, count):
+        return FakeCursor(self[:count])
+
+
+class FakeStream:
+    def __init__(self, documents):
+        self.changes = [{'fullDocument': document} for document in documents]
+        self.resume_token = None
+        self.alive = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def try_next(self):
+        if self.changes:
+            return self.changes.pop(0)
+        # the stream has nothing more, the pending batch is handed out
+        self.alive = False
+        return None
+
+
+class FakeSource:
+    def __init__(self, backlog, inserts):
+        self.backlog = backlog
+        self.inserts = inserts
+
+    def watch(self, pipeline, **kwargs):
+        return FakeStream(self.inserts)
+
+    def find(self, query):
+        last_id = query.get('_id', {}).get('$gt', float('-inf'))
+        return FakeCursor(document for document in self.backlog
+                          if document['_id'] > last_id)
+
+
+def test_watch_inserts_keeps_inserts_below_the_drained_ids():
+    # 5 was drained and also shows up on the stream; 2 was written after
+    # the drain by another writer, with an older _id
+    backlog = [{'_id': 4}, {'_id': 5}]
+    inserts = [{'_id': 5}, {'_id': 2}, {'_id': 6}]
+    batches = watch_inserts(FakeSource(backlog, inserts), 10, 60)
+
+    handled = [document['_id'] for batch, _ in batches for document in batch]
+
+    assert handled == [4, 5, 2, 6]
@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+from tastytrade.session import ProductionSession
+
+
+def _session():
+    return ProductionSession.deserialize(json.dumps({
+        'base_url': 'https://api.tastyworks.com',
+        'user': {},
+        'session_token': 'session',
+        'remember_token': None,
+        'streamer_token': 'streamer',
+        'streamer_expiration': '2030-01-01T00:00:00+00:00',
+        'dxlink_url': 'wss://tasty-openapi-ws.dxfeed.com/realtime'
+    }))
+
+
+def test_aclose_closes_the_client_of_the_running_loop():
+    session = _session()
+
+    async def run():
+        client = session.async_client
+        assert session.async_client is client
+        await session.aclose()
+        assert client.is_closed
+        # a later request on the same loop gets a new client
+        assert session.async_client is not client
+        await session.aclose()
+        return client
+
+    first = asyncio.run(run())
+    assert first.is_closed
+    assert not session._async_clients
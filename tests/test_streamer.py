@@ -0,0 +1,71 @@
+import asyncio
+
+from tastytrade.dxfeed import EventType
+from tastytrade.replay import FrameRecorder, ReplayServer
+from tastytrade.streamer import DXLinkStreamer
+
+
+async def _wait_for(condition, timeout=5):
+    for _ in range(int(timeout / 0.05)):
+        if condition():
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError('condition not met in time')
+
+
+def test_update_token_keeps_the_connection_setup(tmp_path):
+    recording = str(tmp_path / 'empty.jsonl.gz')
+    FrameRecorder(recording).close()
+
+    async def run():
+        async with ReplayServer(recording) as server:
+            streamer = DXLinkStreamer(
+                server.session, record_path=str(tmp_path / 'out.jsonl.gz'))
+            async with streamer:
+                await streamer.subscribe(EventType.QUOTE, ['SPY', 'QQQ'])
+                heartbeat = streamer._heartbeat_task
+                restore = streamer._restore_task
+                sent = []
+
+                async def send_subscription(event_type, action, entries):
+                    sent.append((event_type, action, entries))
+
+                streamer._send_subscription = send_subscription
+                received = streamer.stats.recorded
+                await streamer.update_token('new')
+                # the server answers the new AUTH with AUTHORIZED
+                await _wait_for(lambda: streamer.stats.recorded > received)
+                await asyncio.sleep(0.1)
+
+                assert streamer._heartbeat_task is heartbeat
+                assert streamer._restore_task is restore
+                assert not heartbeat.done()
+                assert sent == []
+            await asyncio.sleep(0)
+            assert heartbeat.cancelled()
+
+    asyncio.run(run())
+
+
+def test_subscribe_reconnects_when_the_channel_fails(tmp_path):
+    recording = str(tmp_path / 'empty.jsonl.gz')
+    FrameRecorder(recording).close()
+
+    async def run():
+        async with ReplayServer(recording) as server:
+            async with DXLinkStreamer(server.session) as streamer:
+                async def channel_request(event_type):
+                    raise asyncio.TimeoutError()
+
+                original = streamer._channel_request
+                streamer._channel_request = channel_request
+                await streamer.subscribe(EventType.TRADE, ['SPY'])
+                streamer._channel_request = original
+
+                assert streamer.subscriptions[EventType.TRADE] == {'SPY'}
+                # the symbols are replayed on the next connection
+                await _wait_for(lambda: streamer.stats.reconnects == 1,
+                                timeout=10)
+                assert streamer._ready
+
+    asyncio.run(run())